@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class AccessControlConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.access_control"
+
+    def ready(self):
+        from apps.core.services import outbox_service
+
+        from . import signals  # noqa: F401
+        from .services import invite_service
+
+        outbox_service.register_handler(
+            invite_service.INVITE_EMAILS_TOPIC,
+            invite_service.relay_invite_emails,
+            redact=invite_service.redact_invite_emails,
+        )
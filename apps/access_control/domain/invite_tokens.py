@@ -0,0 +1,24 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def generate_invite_token() -> str:
+    """Generate the plaintext token sent to the invitee; only its hash is stored."""
+    return secrets.token_urlsafe(32)
+
+
+def hash_invite_token(token: str) -> str:
+    """Fixed-width SHA-256 hex digest stored in ``OrganizationInvite.token_hash``.
+
+    Tokens carry 256 random bits, so an unsalted fast hash is enough to keep
+    them out of the database without slowing lookups down.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def default_invite_expiry() -> datetime:
+    return timezone.now() + timedelta(days=getattr(settings, "INVITE_TTL_DAYS", 7))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.access_control.services import role_count_service
+
+
+class Command(BaseCommand):
+    help = "Recompute materialized per-org role counts from memberships."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--org",
+            action="append",
+            dest="org_ids",
+            help="Only rebuild this organization (repeatable). Defaults to all.",
+        )
+
+    def handle(self, *args, **options):
+        rows = role_count_service.rebuild(options["org_ids"])
+        self.stdout.write(f"Wrote {rows} role count rows.")
@@ -0,0 +1,87 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+# Frozen copy of RoleType.values as of this migration.
+ROLES = ("ORG_ADMIN", "FINANCE", "APPROVER", "VIEWER", "VENDOR")
+
+
+def backfill_role_counts(apps, schema_editor):
+    Organization = apps.get_model("organizations", "Organization")
+    UserRole = apps.get_model("access_control", "UserRole")
+    OrganizationRoleCount = apps.get_model("access_control", "OrganizationRoleCount")
+    totals = {
+        (row["org_id"], row["role"]): (row["members"], row["active"])
+        for row in UserRole.objects.values("org_id", "role")
+        .annotate(
+            members=Count("id"),
+            active=Count("id", filter=Q(user__is_active=True)),
+        )
+        .order_by()
+    }
+    OrganizationRoleCount.objects.bulk_create(
+        [
+            OrganizationRoleCount(
+                org_id=org_id,
+                role=role,
+                member_count=totals.get((org_id, role), (0, 0))[0],
+                active_count=totals.get((org_id, role), (0, 0))[1],
+            )
+            for org_id in Organization.objects.values_list("org_id", flat=True).iterator()
+            for role in ROLES
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("access_control", "0002_primary_role_constraints_and_choices"),
+        ("organizations", "0003_organization_timezone"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrganizationRoleCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        choices=[
+                            ("ORG_ADMIN", "Organization Admin"),
+                            ("FINANCE", "Finance"),
+                            ("APPROVER", "Approver"),
+                            ("VIEWER", "Viewer"),
+                            ("VENDOR", "Vendor"),
+                        ],
+                        max_length=40,
+                    ),
+                ),
+                ("member_count", models.IntegerField(default=0)),
+                ("active_count", models.IntegerField(default=0)),
+                (
+                    "org",
+                    models.ForeignKey(
+                        db_column="org_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="role_counts",
+                        to="organizations.organization",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "organization_role_counts",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="organizationrolecount",
+            constraint=models.UniqueConstraint(fields=("org", "role"), name="uniq_org_role_count"),
+        ),
+        migrations.RunPython(backfill_role_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,75 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+
+import apps.access_control.domain.invite_tokens
+
+
+def hash_tokens_and_set_expiry(apps, schema_editor):
+    OrganizationInvite = apps.get_model("access_control", "OrganizationInvite")
+    ttl = timedelta(days=getattr(settings, "INVITE_TTL_DAYS", 7))
+    batch = []
+    for invite in OrganizationInvite.objects.only("id", "token", "invited_at").iterator():
+        invite.token_hash = hashlib.sha256(invite.token.encode()).hexdigest()
+        invite.expires_at = invite.invited_at + ttl
+        batch.append(invite)
+        if len(batch) >= 1000:
+            OrganizationInvite.objects.bulk_update(batch, ["token_hash", "expires_at"])
+            batch = []
+    if batch:
+        OrganizationInvite.objects.bulk_update(batch, ["token_hash", "expires_at"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("access_control", "0003_organization_role_counts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organizationinvite",
+            name="token_hash",
+            field=models.CharField(max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name="organizationinvite",
+            name="expires_at",
+            field=models.DateTimeField(null=True),
+        ),
+        # Plaintext tokens cannot be recovered from their hashes.
+        migrations.RunPython(hash_tokens_and_set_expiry),
+        migrations.RemoveField(
+            model_name="organizationinvite",
+            name="token",
+        ),
+        migrations.AlterField(
+            model_name="organizationinvite",
+            name="token_hash",
+            field=models.CharField(max_length=64, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="organizationinvite",
+            name="expires_at",
+            field=models.DateTimeField(
+                default=apps.access_control.domain.invite_tokens.default_invite_expiry
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organizationinvite",
+            index=models.Index(
+                condition=models.Q(("status", "INVITED")),
+                fields=["expires_at"],
+                name="idx_invites_pending_expiry",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organizationinvite",
+            index=models.Index(
+                condition=models.Q(("status", "ACTIVE")),
+                fields=["accepted_at"],
+                name="idx_invites_accepted_at",
+            ),
+        ),
+    ]
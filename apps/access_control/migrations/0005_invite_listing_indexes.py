@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("access_control", "0004_invite_token_hash_and_expiry"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="organizationinvite",
+            name="idx_invites_org_status",
+        ),
+        migrations.AddIndex(
+            model_name="organizationinvite",
+            index=models.Index(
+                fields=["org", "status", "-invited_at", "-id"], name="idx_invites_org_status"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organizationinvite",
+            index=models.Index(
+                fields=["org", "-invited_at", "-id"], name="idx_invites_org_invited_at"
+            ),
+        ),
+    ]
@@ -1,20 +1,43 @@
 from __future__ import annotations
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 
 from apps.organizations.models import Organization
+from apps.organizations.tenancy import resolve_scope_org_id
 
 from .domain.enums import InviteStatus, RoleType
+from .domain.invite_tokens import default_invite_expiry
 
 
 class OrganizationScopedQuerySet(models.QuerySet):
     def for_org(self, org_id: str) -> "OrganizationScopedQuerySet":
         return self.filter(org_id=org_id)
 
+    def for_current_org(self) -> "OrganizationScopedQuerySet":
+        """Filter on the current tenant (see ``apps.organizations.tenancy``).
 
-class OrganizationScopedManager(models.Manager.from_queryset(OrganizationScopedQuerySet)):
-    pass
+        Raises ``TenantContextMissing`` when no tenant is bound; inside
+        ``cross_tenant()`` the queryset is left unfiltered.
+        """
+        org_id = resolve_scope_org_id()
+        if org_id is None:
+            return self
+        return self.filter(org_id=org_id)
+
+
+OrganizationScopedManager = models.Manager.from_queryset(OrganizationScopedQuerySet)
+
+
+class CurrentOrgManager(OrganizationScopedManager):
+    """Opt-in tenant scoping: ``Model.scoped`` applies ``for_current_org()`` to every query.
+
+    ``objects`` stays unscoped, so related managers, admin and maintenance
+    code see every tenant unless they ask otherwise.
+    """
+
+    def get_queryset(self) -> OrganizationScopedQuerySet:
+        return super().get_queryset().for_current_org()
 
 
 class UserRole(models.Model):
@@ -34,6 +57,7 @@ class UserRole(models.Model):
     assigned_at = models.DateTimeField(auto_now_add=True)
 
     objects = OrganizationScopedManager()
+    scoped = CurrentOrgManager()
 
     class Meta:
         db_table = "user_roles"
@@ -51,6 +75,36 @@ class UserRole(models.Model):
     def __str__(self) -> str:  # pragma: no cover - convenience only
         return f"{self.user_id} -> {self.org_id} ({self.role})"
 
+    def save(self, *args, **kwargs):
+        # Role-count receivers lock the stored row in pre_save; the write must
+        # share their transaction.
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+
+
+class OrganizationRoleCount(models.Model):
+    """Members and active members per org and role, maintained by ``role_count_service``."""
+
+    org = models.ForeignKey(
+        Organization,
+        to_field="org_id",
+        db_column="org_id",
+        on_delete=models.CASCADE,
+        related_name="role_counts",
+    )
+    role = models.CharField(max_length=40, choices=RoleType.choices)
+    member_count = models.IntegerField(default=0)
+    active_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "organization_role_counts"
+        constraints = [
+            models.UniqueConstraint(fields=["org", "role"], name="uniq_org_role_count"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - convenience only
+        return f"{self.org_id} {self.role}: {self.active_count}/{self.member_count}"
+
 
 class OrganizationInvite(models.Model):
     org = models.ForeignKey(
@@ -67,13 +121,14 @@ class OrganizationInvite(models.Model):
         choices=InviteStatus.choices,
         default=InviteStatus.INVITED,
     )
-    token = models.CharField(max_length=64, unique=True)
+    token_hash = models.CharField(max_length=64, unique=True)
     invited_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.PROTECT,
         related_name="sent_organization_invites",
     )
     invited_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(default=default_invite_expiry)
     accepted_at = models.DateTimeField(null=True, blank=True)
     accepted_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -83,6 +138,9 @@ class OrganizationInvite(models.Model):
         related_name="accepted_organization_invites",
     )
 
+    objects = OrganizationScopedManager()
+    scoped = CurrentOrgManager()
+
     class Meta:
         db_table = "organization_invites"
         constraints = [
@@ -92,8 +150,22 @@ class OrganizationInvite(models.Model):
             )
         ]
         indexes = [
-            models.Index(fields=["org", "status"], name="idx_invites_org_status"),
+            models.Index(
+                fields=["org", "status", "-invited_at", "-id"], name="idx_invites_org_status"
+            ),
+            models.Index(fields=["org", "-invited_at", "-id"], name="idx_invites_org_invited_at"),
             models.Index(fields=["email"], name="idx_invites_email"),
+            # Purge scans (see ``tasks.purge_expired_invites``) only touch these rows.
+            models.Index(
+                fields=["expires_at"],
+                name="idx_invites_pending_expiry",
+                condition=models.Q(status=InviteStatus.INVITED),
+            ),
+            models.Index(
+                fields=["accepted_at"],
+                name="idx_invites_accepted_at",
+                condition=models.Q(status=InviteStatus.ACTIVE),
+            ),
         ]
 
     def __str__(self) -> str:  # pragma: no cover - convenience only
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from typing import Optional
 
+from django.utils import timezone
+
 from apps.organizations.models import Organization
 
+from ..domain.enums import InviteStatus
+from ..domain.invite_tokens import hash_invite_token
 from ..models import OrganizationInvite
 
 
@@ -14,14 +18,47 @@ class OrganizationInviteRepository:
             org=org,
             email=email,
             role=role,
-            token=token,
+            token_hash=hash_invite_token(token),
             invited_by=invited_by,
         )
 
     @staticmethod
     def get_by_token(token: str) -> Optional[OrganizationInvite]:
-        return OrganizationInvite.objects.filter(token=token).select_related("org").first()
+        return (
+            OrganizationInvite.objects.filter(token_hash=hash_invite_token(token))
+            .select_related("org")
+            .first()
+        )
+
+    @staticmethod
+    def delete_expired(*, org_id: str, email: str) -> int:
+        deleted, _ = OrganizationInvite.objects.filter(
+            org_id=org_id,
+            email=email,
+            status=InviteStatus.INVITED,
+            expires_at__lte=timezone.now(),
+        ).delete()
+        return deleted
 
     @staticmethod
-    def list_for_org(org_id: str):
-        return OrganizationInvite.objects.filter(org_id=org_id)
+    def list_for_org(
+        org_id: str, *, status: Optional[str] = None, fields: tuple[str, ...] = ()
+    ):
+        """Invites of ``org_id``, newest first; ``fields`` projects ``.values()`` rows.
+
+        The ``(org, [status,] -invited_at, -id)`` indexes serve both the filter
+        and the ordering, so keyset pages never sort or skip rows.
+        """
+        return _newest_first(OrganizationInvite.objects.filter(org_id=org_id), status, fields)
+
+    @staticmethod
+    def list_for_current_org(*, status: Optional[str] = None, fields: tuple[str, ...] = ()):
+        """Like :meth:`list_for_org` for the current tenant (``OrganizationInvite.scoped``)."""
+        return _newest_first(OrganizationInvite.scoped.all(), status, fields)
+
+
+def _newest_first(invites, status: Optional[str], fields: tuple[str, ...]):
+    if status is not None:
+        invites = invites.filter(status=status)
+    invites = invites.order_by("-invited_at", "-id")
+    return invites.values(*fields) if fields else invites
@@ -27,10 +27,29 @@ class OrganizationInviteResponseSerializer(serializers.ModelSerializer):
             "role",
             "status",
             "invited_at",
+            "expires_at",
         )
         read_only_fields = fields
 
 
+class OrganizationInviteListSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    email = serializers.EmailField()
+    role = serializers.CharField()
+    status = serializers.CharField()
+    invited_at = serializers.DateTimeField()
+    expires_at = serializers.DateTimeField()
+    accepted_at = serializers.DateTimeField(allow_null=True)
+
+
+class OrganizationInvitePageSerializer(serializers.Serializer):
+    """``InviteCursorPagination`` envelope; ``next``/``previous`` are null at the ends."""
+
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+    results = OrganizationInviteListSerializer(many=True)
+
+
 class OrganizationInviteAcceptSerializer(serializers.Serializer):
     token = serializers.CharField(allow_blank=False, trim_whitespace=True)
     password = serializers.CharField(allow_blank=False, trim_whitespace=True, write_only=True)
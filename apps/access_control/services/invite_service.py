@@ -1,24 +1,24 @@
 from __future__ import annotations
 
 import re
-import secrets
+from datetime import timedelta
+from typing import Iterable
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 
-from apps.notifications.services.email_service import send_email
+from apps.core.services import outbox_service
+from apps.notifications.services.email_service import send_templated_emails
 
 from ..domain.enums import InviteStatus
+from ..domain.invite_tokens import generate_invite_token
 from ..models import OrganizationInvite, UserRole
 from ..repositories.invite_repository import OrganizationInviteRepository
 
 
-def generate_invite_token() -> str:
-    return secrets.token_urlsafe(32)
-
-
 def _normalize_email(email: str) -> str:
     return email.strip().lower()
 
@@ -29,13 +29,56 @@ def _base_username_from_email(email: str) -> str:
     return cleaned or "user"
 
 
+USERNAME_CREATE_ATTEMPTS = 3
+
+
 def _generate_unique_username(user_model, base: str) -> str:
-    candidate = base
+    """Return ``base`` or ``base<n>`` with the smallest free ``n``, in one query.
+
+    Usernames are unique case-insensitively, so candidates are compared in
+    lower case; the ``Lower(username)`` prefix scan replaces probing each
+    candidate. On PostgreSQL the scan is served by the ``text_pattern_ops``
+    index from ``accounts`` migration 0005; other backends scan the table.
+    """
+    base = base.lower()
+    existing = (
+        user_model.objects.annotate(username_lower=Lower("username"))
+        .filter(username_lower__startswith=base)
+        .values_list("username_lower", flat=True)
+    )
+    base_taken = False
+    suffixes: set[int] = set()
+    for username in existing:
+        rest = username[len(base):]
+        if not rest:
+            base_taken = True
+        elif rest.isdigit() and not rest.startswith("0"):
+            suffixes.add(int(rest))
+    if not base_taken:
+        return base
+
     counter = 1
-    while user_model.objects.filter(username=candidate).exists():
-        candidate = f"{base}{counter}"
+    while counter in suffixes:
         counter += 1
-    return candidate
+    return f"{base}{counter}"
+
+
+def _create_invited_user(user_model, *, email: str, password: str, role: str):
+    """Create the invitee, retrying with a fresh username if a concurrent insert wins."""
+    base = _base_username_from_email(email)
+    for attempt in range(1, USERNAME_CREATE_ATTEMPTS + 1):
+        username = _generate_unique_username(user_model, base)
+        try:
+            with transaction.atomic():
+                return user_model.objects.create_user(
+                    username=username,
+                    email=email,
+                    password=password,
+                    primary_role=role,
+                )
+        except IntegrityError:
+            if attempt == USERNAME_CREATE_ATTEMPTS:
+                raise
 
 
 def _build_invite_link(token: str) -> str | None:
@@ -45,43 +88,102 @@ def _build_invite_link(token: str) -> str | None:
     return f"{base.rstrip('/')}/?token={token}"
 
 
-def send_invite_email(*, email: str, org_name: str, token: str) -> None:
-    subject = f"You're invited to {org_name}"
-    link = _build_invite_link(token)
-    if link:
-        message = (
-            f"You've been invited to join {org_name}. "
-            f"Accept your invite here: {link}"
-        )
-    else:
-        message = (
-            f"You've been invited to join {org_name}. "
-            f"Use this invite token to accept: {token}"
+INVITE_TEMPLATE = "organization_invite"
+
+
+def send_invite_emails(*, org_name: str, invites: Iterable[tuple[str, str]]) -> None:
+    """Email each ``(email, token)`` its invite; one template render pass for the batch."""
+    send_templated_emails(
+        template=INVITE_TEMPLATE,
+        recipients=(
+            (email, {"token": token, "link": _build_invite_link(token)})
+            for email, token in invites
+        ),
+        shared_context={"org_name": org_name},
+    )
+
+
+INVITE_EMAILS_TOPIC = "access_control.invite_emails"
+
+
+def enqueue_invite_emails(*, org_name: str, invites: Iterable[tuple[str, str]]) -> None:
+    """Record the invite emails in the caller's transaction (see ``outbox_service``).
+
+    The outbox row holds the plaintext tokens until the relay hands them to
+    ``send_invite_emails`` and deletes it, or redacts it once it has failed
+    for good.
+    """
+    outbox_service.enqueue(
+        INVITE_EMAILS_TOPIC,
+        {"org_name": org_name, "invites": [[email, token] for email, token in invites]},
+    )
+
+
+def relay_invite_emails(payloads: list[dict]) -> None:
+    """Outbox handler: one render pass per organization across the relayed batch."""
+    by_org: dict[str, list[tuple[str, str]]] = {}
+    for payload in payloads:
+        by_org.setdefault(payload["org_name"], []).extend(
+            (email, token) for email, token in payload["invites"]
         )
-    send_email(subject=subject, message=message, recipients=[email])
+    for org_name, invites in by_org.items():
+        send_invite_emails(org_name=org_name, invites=invites)
+
+
+def redact_invite_emails(payload: dict) -> dict:
+    """Dead-letter form of an invite email payload: who went unemailed, without tokens."""
+    return {
+        "org_name": payload["org_name"],
+        "invites": [email for email, _ in payload["invites"]],
+    }
 
 
 def invite_user(*, org, email: str, role: str, invited_by) -> OrganizationInvite:
+    """Create the invite and, in the same transaction, queue its email in the outbox.
+
+    Only the token's hash is stored; the plaintext is available as
+    ``invite.token`` on the returned instance and nowhere else.
+    """
     normalized_email = _normalize_email(email)
-    if UserRole.objects.filter(org_id=org.org_id, user__email__iexact=normalized_email).exists():
-        raise ValueError("User is already a member of this organization.")
+    membership = (
+        UserRole.objects.filter(org_id=org.org_id, user__email__iexact=normalized_email)
+        .select_related("user")
+        .only("role", "user__password")
+        .first()
+    )
+    if membership is not None:
+        # Members provisioned without a password can only get in through an
+        # invite, so they may be re-invited once their last one expired. A
+        # live invite still conflicts on the (org, email) slot below.
+        if membership.user.has_usable_password():
+            raise ValueError("User is already a member of this organization.")
+        if membership.role != role:
+            raise ValueError("Re-invite must use the member's current role.")
 
     token = generate_invite_token()
 
+    def create():
+        with transaction.atomic():
+            invite = OrganizationInviteRepository.create(
+                org=org,
+                email=normalized_email,
+                role=role,
+                token=token,
+                invited_by=invited_by,
+            )
+            enqueue_invite_emails(org_name=org.name, invites=[(normalized_email, token)])
+            return invite
+
     try:
-        invite = OrganizationInviteRepository.create(
-            org=org,
-            email=normalized_email,
-            role=role,
-            token=token,
-            invited_by=invited_by,
-        )
+        invite = create()
     except IntegrityError as exc:
-        raise ValueError("This email has already been invited to the organization.") from exc
-
-    transaction.on_commit(
-        lambda: send_invite_email(email=normalized_email, org_name=org.name, token=token)
-    )
+        # An expired invite still holds the (org, email) slot until it is purged.
+        if not OrganizationInviteRepository.delete_expired(
+            org_id=org.org_id, email=normalized_email
+        ):
+            raise ValueError("This email has already been invited to the organization.") from exc
+        invite = create()
+    invite.token = token
     return invite
 
 
@@ -91,6 +193,8 @@ def accept_invite(*, token: str, password: str) -> OrganizationInvite:
         raise ValueError("Invite token is invalid.")
     if invite.status != InviteStatus.INVITED:
         raise ValueError("Invite has already been accepted.")
+    if invite.expires_at <= timezone.now():
+        raise ValueError("Invite has expired.")
 
     normalized_email = _normalize_email(invite.email)
     UserModel = get_user_model()
@@ -98,14 +202,11 @@ def accept_invite(*, token: str, password: str) -> OrganizationInvite:
     with transaction.atomic():
         user = UserModel.objects.filter(email__iexact=normalized_email).first()
         if user is None:
-            username = _generate_unique_username(
-                UserModel, _base_username_from_email(normalized_email)
-            )
-            user = UserModel.objects.create_user(
-                username=username,
+            user = _create_invited_user(
+                UserModel,
                 email=normalized_email,
                 password=password,
-                primary_role=invite.role,
+                role=invite.role,
             )
         else:
             if user.primary_role != invite.role:
@@ -125,3 +226,39 @@ def accept_invite(*, token: str, password: str) -> OrganizationInvite:
         invite.save(update_fields=["status", "accepted_at", "accepted_user"])
 
     return invite
+
+
+def purge_expired_invites(
+    *,
+    now=None,
+    batch_size: int | None = None,
+    max_batches: int = 100,
+) -> dict[str, int]:
+    """Delete expired pending invites and accepted invites past their retention.
+
+    Works in batches of ``INVITE_PURGE_BATCH_SIZE`` ids, each deleted in its
+    own short statement, and stops after ``max_batches`` per kind so one run
+    stays bounded; the next run picks up the remainder.
+    """
+    now = now or timezone.now()
+    batch_size = batch_size or getattr(settings, "INVITE_PURGE_BATCH_SIZE", 1000)
+    retention = timedelta(days=getattr(settings, "INVITE_ACCEPTED_RETENTION_DAYS", 90))
+    invites = OrganizationInvite.objects
+    candidates = {
+        "expired": invites.filter(status=InviteStatus.INVITED, expires_at__lte=now),
+        "accepted": invites.filter(
+            status=InviteStatus.ACTIVE, accepted_at__lte=now - retention
+        ),
+    }
+    purged = {}
+    for kind, queryset in candidates.items():
+        purged[kind] = 0
+        for _ in range(max_batches):
+            ids = list(queryset.values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            deleted, _ = invites.filter(id__in=ids).delete()
+            purged[kind] += deleted
+            if len(ids) < batch_size:
+                break
+    return purged
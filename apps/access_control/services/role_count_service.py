@@ -0,0 +1,168 @@
+"""Materialized member counts per organization and role.
+
+``OrganizationRoleCount`` holds, for each org and role, how many memberships
+exist and how many belong to active users. Signals (see ``..signals``) apply
+deltas whenever a membership is created, deleted or changes role, and
+whenever a user is activated or deactivated; bulk writers call
+:func:`apply_deltas` or :func:`count_activation_changes` themselves.
+
+Each delta is a single ``UPDATE ... SET count = count + n`` issued in role
+order, so concurrent writers serialize on the row lock without deadlocking.
+Check-then-act callers such as the last-admin guard read the row with
+:func:`active_count` ``(for_update=True)`` inside their transaction.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from apps.organizations.models import Organization
+
+from ..domain.enums import RoleType
+from ..models import OrganizationRoleCount, UserRole
+
+# role -> (member delta, active delta)
+Deltas = Dict[str, Tuple[int, int]]
+
+
+def ensure_rows(org_id: str) -> None:
+    """Create the org's zeroed count rows; new organizations get them up front."""
+    OrganizationRoleCount.objects.bulk_create(
+        [OrganizationRoleCount(org_id=org_id, role=role) for role in RoleType.values],
+        ignore_conflicts=True,
+    )
+
+
+def _update(org_id: str, role: str, members: int, active: int) -> int:
+    return OrganizationRoleCount.objects.filter(org_id=org_id, role=role).update(
+        member_count=F("member_count") + members,
+        active_count=F("active_count") + active,
+    )
+
+
+def apply_deltas(org_id: str, deltas: Deltas) -> None:
+    changes = {role: delta for role, delta in deltas.items() if delta != (0, 0)}
+    if not changes:
+        return
+    with transaction.atomic():
+        for role in sorted(changes):
+            if not _update(org_id, role, *changes[role]):
+                ensure_rows(org_id)
+                _update(org_id, role, *changes[role])
+
+
+def add_member(org_id: str, role: str, *, active: bool = True) -> bool:
+    """Count a membership about to be inserted; ``False`` if the org does not exist.
+
+    Doubles as the org existence check, so a caller inserting one membership
+    needs no separate lookup. Insert the membership with ``bulk_create`` so
+    the signal does not count it again.
+    """
+    if _update(org_id, role, 1, 1 if active else 0):
+        return True
+    if not Organization.objects.filter(org_id=org_id).exists():
+        return False
+    ensure_rows(org_id)
+    _update(org_id, role, 1, 1 if active else 0)
+    return True
+
+
+def membership_deltas(
+    memberships: Iterable[Tuple[str, str, bool]], sign: int = 1
+) -> Dict[str, Deltas]:
+    """Per-org deltas for ``(org_id, role, user_is_active)`` memberships added (or removed)."""
+    per_org: Dict[str, Dict[str, list]] = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+    for org_id, role, is_active in memberships:
+        counts = per_org[org_id][role]
+        counts[0] += sign
+        counts[1] += sign if is_active else 0
+    return {
+        org_id: {role: (members, active) for role, (members, active) in roles.items()}
+        for org_id, roles in per_org.items()
+    }
+
+
+def activation_deltas(memberships: Iterable[Tuple[str, str]], sign: int) -> Dict[str, Deltas]:
+    """Per-org deltas for users of ``(org_id, role)`` memberships (de)activated by ``sign``."""
+    per_org: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for org_id, role in memberships:
+        per_org[org_id][role] += sign
+    return {
+        org_id: {role: (0, active) for role, active in roles.items()}
+        for org_id, roles in per_org.items()
+    }
+
+
+def count_activation_changes(user_ids: Iterable[int], *, sign: int) -> None:
+    """Apply ``sign`` to the active counts of every membership of ``user_ids``.
+
+    For bulk ``QuerySet.update`` writers, which send no ``post_save``; pass
+    only users whose ``is_active`` actually flipped. A user's activity counts
+    in every org they belong to.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    memberships = (
+        UserRole.objects.filter(user_id__in=user_ids)
+        .order_by("org_id")
+        .values_list("org_id", "role")
+    )
+    for org_id, deltas in activation_deltas(memberships, sign).items():
+        apply_deltas(org_id, deltas)
+
+
+def active_count(org_id: str, role: str, *, for_update: bool = False) -> int:
+    """Active members with ``role``; ``for_update`` locks the row until the transaction ends."""
+    rows = OrganizationRoleCount.objects.filter(org_id=org_id, role=role)
+    if for_update:
+        rows = rows.select_for_update()
+    return rows.values_list("active_count", flat=True).first() or 0
+
+
+def counts_for_org(org_id: str) -> Dict[str, Dict[str, int]]:
+    return {
+        role: {"members": members, "active": active}
+        for role, members, active in OrganizationRoleCount.objects.filter(org_id=org_id)
+        .order_by("role")
+        .values_list("role", "member_count", "active_count")
+    }
+
+
+def rebuild(org_ids: Optional[Iterable[str]] = None) -> int:
+    """Recompute counts from ``UserRole`` for ``org_ids`` (default: every org).
+
+    For backfills, bulk loads that bypass signals and drift repair. Returns
+    the number of count rows written.
+    """
+    organizations = Organization.objects.all()
+    memberships = UserRole.objects.all()
+    if org_ids is not None:
+        org_ids = list(org_ids)
+        organizations = organizations.filter(org_id__in=org_ids)
+        memberships = memberships.filter(org_id__in=org_ids)
+    totals = {
+        (row["org_id"], row["role"]): row
+        for row in memberships.values("org_id", "role")
+        .annotate(members=Count("id"), active=Count("id", filter=Q(user__is_active=True)))
+        .order_by()
+    }
+    rows = [
+        OrganizationRoleCount(
+            org_id=org_id,
+            role=role,
+            member_count=totals.get((org_id, role), {}).get("members", 0),
+            active_count=totals.get((org_id, role), {}).get("active", 0),
+        )
+        for org_id in organizations.values_list("org_id", flat=True).iterator()
+        for role in RoleType.values
+    ]
+    with transaction.atomic():
+        OrganizationRoleCount.objects.filter(
+            org_id__in=organizations.values("org_id")
+        ).delete()
+        OrganizationRoleCount.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
@@ -0,0 +1,66 @@
+"""Keep ``OrganizationRoleCount`` in step with memberships and user activation.
+
+Each receiver compares against the stored row, read with
+``select_for_update`` inside the writer's transaction (``UserRole.save``,
+``User.save`` and deletes are atomic), so stale or concurrently modified
+instances never count a change twice.
+"""
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import pre_delete, pre_save
+from django.dispatch import receiver
+
+from .models import UserRole
+from .services import role_count_service
+
+User = get_user_model()
+
+
+def _stored(model, pk, *fields):
+    """``fields`` of the stored row, locked until the transaction ends; ``None`` if absent."""
+    return model._base_manager.select_for_update().filter(pk=pk).values_list(*fields).first()
+
+
+@receiver(pre_save, sender=UserRole, dispatch_uid="role_counts_membership_saved")
+def count_membership_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and "role" not in update_fields):
+        return
+    stored = None if instance._state.adding else _stored(
+        UserRole, instance.pk, "role", "user__is_active"
+    )
+    if stored is None:
+        # Locking the user orders this insert against a concurrent (de)activation.
+        active = 1 if _stored(User, instance.user_id, "is_active") == (True,) else 0
+        role_count_service.apply_deltas(instance.org_id, {instance.role: (1, active)})
+        return
+    previous, is_active = stored
+    if previous == instance.role:
+        return
+    active = 1 if is_active else 0
+    role_count_service.apply_deltas(
+        instance.org_id, {instance.role: (1, active), previous: (-1, -active)}
+    )
+
+
+@receiver(pre_delete, sender=UserRole, dispatch_uid="role_counts_membership_deleted")
+def count_membership_delete(sender, instance, **kwargs):
+    stored = _stored(UserRole, instance.pk, "role", "user__is_active")
+    if stored is None:
+        return
+    role, is_active = stored
+    role_count_service.apply_deltas(instance.org_id, {role: (-1, -1 if is_active else 0)})
+
+
+@receiver(pre_save, sender=User, dispatch_uid="role_counts_user_saved")
+def count_user_activation(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and "is_active" not in update_fields:
+        return
+    stored = _stored(User, instance.pk, "is_active")
+    if stored is None or stored[0] == instance.is_active:
+        return
+    role_count_service.count_activation_changes(
+        [instance.pk], sign=1 if instance.is_active else -1
+    )
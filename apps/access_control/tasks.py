@@ -0,0 +1,18 @@
+from celery import shared_task
+
+from shared.logging import get_logger
+
+from .services.invite_service import purge_expired_invites as purge
+
+logger = get_logger(__name__)
+
+
+@shared_task
+def purge_expired_invites():
+    """Scheduled by ``CELERY_BEAT_SCHEDULE``; runs on the maintenance queue."""
+    purged = purge()
+    logger.info(
+        "Expired invites purged",
+        extra={"expired_purged": purged["expired"], "accepted_purged": purged["accepted"]},
+    )
+    return purged
@@ -1,11 +1,20 @@
+import re
+from datetime import timedelta
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.core import mail
+from django.db import IntegrityError
 from django.test import TestCase, override_settings
+from django.utils import timezone
 from rest_framework.test import APIClient
 
 from apps.access_control.domain.enums import InviteStatus, RoleType
+from apps.access_control.domain.invite_tokens import hash_invite_token
 from apps.access_control.models import OrganizationInvite, UserRole
+from apps.access_control.services import invite_service
 from apps.accounts.services.auth_token_service import issue_token
+from apps.organizations.services import provisioning_service
 from apps.organizations.services.organization_service import create_organization
 
 
@@ -14,6 +23,8 @@ from apps.organizations.services.organization_service import create_organization
     ALLOWED_CURRENCIES=["USD", "INR"],
     ALLOWED_COUNTRIES=["US", "IN"],
     EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_DELIVERY_MODE="sync",
+    OUTBOX_RELAY_MODE="sync",
     DEFAULT_FROM_EMAIL="noreply@sourceright.local",
 )
 class OrganizationInviteTests(TestCase):
@@ -86,11 +97,15 @@ class OrganizationInviteTests(TestCase):
         headers = self._auth_headers(user=self.user, org_id=org.org_id, role=RoleType.ORG_ADMIN)
 
         payload = {"email": "invitee@example.com", "role": RoleType.VIEWER}
-        response = self.client.post(self.invite_url, payload, format="json", **headers)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.invite_url, payload, format="json", **headers)
         self.assertEqual(response.status_code, 201)
 
+        token = self._emailed_token()
         invite = OrganizationInvite.objects.get(email="invitee@example.com")
-        accept_payload = {"token": invite.token, "password": "StrongPass123"}
+        self.assertEqual(invite.token_hash, hash_invite_token(token))
+        self.assertNotIn(token, invite.token_hash)
+        accept_payload = {"token": token, "password": "StrongPass123"}
         accept_response = self.client.post(self.accept_url, accept_payload, format="json")
 
         self.assertEqual(accept_response.status_code, 200)
@@ -104,3 +119,198 @@ class OrganizationInviteTests(TestCase):
                 role=RoleType.VIEWER,
             ).exists()
         )
+
+    def _emailed_token(self):
+        return re.search(r"accept: (\S+)", mail.outbox[-1].body).group(1)
+
+    def _create_invite(self, email):
+        org = create_organization(
+            creator=self.user, name="Org One", country="IN", base_currency="INR"
+        )
+        return invite_service.invite_user(
+            org=org, email=email, role=RoleType.VIEWER, invited_by=self.user
+        )
+
+    def test_generate_unique_username_uses_single_query(self):
+        User = get_user_model()
+        for username in ["john", "John1", "john2", "john4", "johnny", "john03"]:
+            User.objects.create_user(
+                username=username,
+                email=f"{username}@example.com",
+                password="pass1234",
+                primary_role=RoleType.VIEWER,
+            )
+
+        with self.assertNumQueries(1):
+            username = invite_service._generate_unique_username(User, "john")
+
+        self.assertEqual(username, "john3")
+        self.assertEqual(invite_service._generate_unique_username(User, "jane"), "jane")
+
+    def test_accept_invite_retries_username_on_integrity_error(self):
+        invite = self._create_invite("john@example.com")
+        create_user = get_user_model().objects.create_user
+        calls = []
+
+        def flaky_create_user(**kwargs):
+            calls.append(kwargs["username"])
+            if len(calls) == 1:
+                raise IntegrityError("duplicate username")
+            return create_user(**kwargs)
+
+        with mock.patch.object(
+            get_user_model().objects, "create_user", side_effect=flaky_create_user
+        ):
+            response = self.client.post(
+                self.accept_url,
+                {"token": invite.token, "password": "StrongPass123"},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(get_user_model().objects.filter(email="john@example.com").exists())
+
+    def test_expired_invite_cannot_be_accepted_and_can_be_reissued(self):
+        invite = self._create_invite("late@example.com")
+        OrganizationInvite.objects.filter(pk=invite.pk).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        response = self.client.post(
+            self.accept_url,
+            {"token": invite.token, "password": "StrongPass123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+        reissued = invite_service.invite_user(
+            org=invite.org, email="late@example.com", role=RoleType.VIEWER, invited_by=self.user
+        )
+        self.assertNotEqual(reissued.pk, invite.pk)
+        self.assertFalse(OrganizationInvite.objects.filter(pk=invite.pk).exists())
+
+    def test_purge_expired_invites_in_batches(self):
+        org = create_organization(
+            creator=self.user, name="Org One", country="IN", base_currency="INR"
+        )
+        invites = [
+            invite_service.invite_user(
+                org=org,
+                email=f"user{index}@example.com",
+                role=RoleType.VIEWER,
+                invited_by=self.user,
+            )
+            for index in range(5)
+        ]
+        now = timezone.now()
+        OrganizationInvite.objects.filter(pk__in=[i.pk for i in invites[:3]]).update(
+            expires_at=now - timedelta(days=1)
+        )
+        OrganizationInvite.objects.filter(pk=invites[3].pk).update(
+            status=InviteStatus.ACTIVE, accepted_at=now - timedelta(days=365)
+        )
+
+        # One bounded batch per kind, then the rest on the next run.
+        self.assertEqual(
+            invite_service.purge_expired_invites(batch_size=2, max_batches=1),
+            {"expired": 2, "accepted": 1},
+        )
+        self.assertEqual(
+            invite_service.purge_expired_invites(batch_size=2),
+            {"expired": 1, "accepted": 0},
+        )
+        self.assertEqual(
+            list(OrganizationInvite.objects.values_list("pk", flat=True)), [invites[4].pk]
+        )
+
+    def test_provisioned_member_can_be_reinvited_after_invite_is_purged(self):
+        org = create_organization(
+            creator=self.user, name="Org One", country="IN", base_currency="INR"
+        )
+        rows = [(1, {"email": "new@example.com", "role": RoleType.VIEWER})]
+        with self.captureOnCommitCallbacks(execute=True):
+            results = list(
+                provisioning_service.provision_users(org=org, invited_by=self.user, rows=rows)
+            )
+        self.assertEqual(results[0]["status"], "created")
+        OrganizationInvite.objects.update(expires_at=timezone.now() - timedelta(days=1))
+        self.assertEqual(invite_service.purge_expired_invites()["expired"], 1)
+
+        with self.assertRaisesMessage(ValueError, "current role"):
+            invite_service.invite_user(
+                org=org, email="new@example.com", role=RoleType.ORG_ADMIN, invited_by=self.user
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            invite = invite_service.invite_user(
+                org=org, email="New@example.com", role=RoleType.VIEWER, invited_by=self.user
+            )
+        # A pending member with a live invite still cannot be invited twice.
+        with self.assertRaises(ValueError):
+            invite_service.invite_user(
+                org=org, email="new@example.com", role=RoleType.VIEWER, invited_by=self.user
+            )
+
+        invite_service.accept_invite(token=invite.token, password="StrongPass123")
+        member = get_user_model().objects.get(email="new@example.com")
+        self.assertTrue(member.check_password("StrongPass123"))
+        self.assertEqual(UserRole.objects.filter(user=member, org=org).count(), 1)
+        with self.assertRaisesMessage(ValueError, "already a member"):
+            invite_service.invite_user(
+                org=org, email="new@example.com", role=RoleType.VIEWER, invited_by=self.user
+            )
+
+    def test_admin_lists_invites_with_cursor_pages_and_status_filter(self):
+        org = create_organization(
+            creator=self.user, name="Org One", country="IN", base_currency="INR"
+        )
+        invites = [
+            invite_service.invite_user(
+                org=org,
+                email=f"user{index}@example.com",
+                role=RoleType.VIEWER,
+                invited_by=self.user,
+            )
+            for index in range(5)
+        ]
+        OrganizationInvite.objects.filter(pk=invites[0].pk).update(status=InviteStatus.ACTIVE)
+        headers = self._auth_headers(user=self.user, org_id=org.org_id, role=RoleType.ORG_ADMIN)
+
+        seen = []
+        url = f"{self.invite_url}?page_size=2"
+        while url:
+            response = self.client.get(url, **headers)
+            self.assertEqual(response.status_code, 200)
+            payload = response.json()
+            seen.extend(row["email"] for row in payload["results"])
+            url = payload["next"]
+        self.assertEqual(seen, [f"user{index}@example.com" for index in reversed(range(5))])
+        self.assertNotIn("token_hash", payload["results"][0])
+
+        response = self.client.get(
+            self.invite_url, {"status": InviteStatus.INVITED}, **headers
+        )
+        self.assertEqual(
+            [row["email"] for row in response.json()["results"]],
+            [f"user{index}@example.com" for index in reversed(range(1, 5))],
+        )
+
+        response = self.client.get(self.invite_url, {"status": "BOGUS"}, **headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_non_admin_cannot_list_invites(self):
+        org = create_organization(
+            creator=self.user, name="Org One", country="IN", base_currency="INR"
+        )
+        member = get_user_model().objects.create_user(
+            username="viewer",
+            email="viewer@example.com",
+            password="pass1234",
+            primary_role=RoleType.VIEWER,
+        )
+        UserRole.objects.create(user=member, org=org, role=RoleType.VIEWER)
+        headers = self._auth_headers(user=member, org_id=org.org_id, role=RoleType.VIEWER)
+
+        response = self.client.get(self.invite_url, **headers)
+
+        self.assertEqual(response.status_code, 403)
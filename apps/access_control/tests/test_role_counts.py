@@ -0,0 +1,135 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import OrganizationRoleCount, UserRole
+from apps.access_control.services import role_count_service
+from apps.accounts.services.registration_service import register_user
+from apps.organizations.services.organization_service import create_organization
+from apps.organizations.utils import is_last_active_admin
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+)
+class RoleCountTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.member = User.objects.create_user(
+            username="member",
+            email="member@example.com",
+            password="pass1234",
+            primary_role=RoleType.VIEWER,
+        )
+        self.org = create_organization(
+            creator=self.admin, name="Org One", country="US", base_currency="USD"
+        )
+
+    def _counts(self):
+        return {
+            role: (counts["members"], counts["active"])
+            for role, counts in role_count_service.counts_for_org(self.org.org_id).items()
+            if counts["members"]
+        }
+
+    def test_counts_follow_membership_changes(self):
+        self.assertEqual(self._counts(), {RoleType.ORG_ADMIN: (1, 1)})
+
+        membership = UserRole.objects.create(
+            user=self.member, org=self.org, role=RoleType.VIEWER
+        )
+        self.assertEqual(self._counts()[RoleType.VIEWER], (1, 1))
+
+        membership = UserRole.objects.get(pk=membership.pk)
+        membership.role = RoleType.ORG_ADMIN
+        membership.save()
+        self.assertEqual(self._counts(), {RoleType.ORG_ADMIN: (2, 2)})
+
+        membership.delete()
+        self.assertEqual(self._counts(), {RoleType.ORG_ADMIN: (1, 1)})
+
+    def test_counts_follow_user_activation(self):
+        UserRole.objects.create(user=self.member, org=self.org, role=RoleType.VIEWER)
+        member = get_user_model().objects.get(pk=self.member.pk)
+
+        member.is_active = False
+        member.save(update_fields=["is_active"])
+        self.assertEqual(self._counts()[RoleType.VIEWER], (1, 0))
+
+        member.is_active = True
+        member.save()
+        self.assertEqual(self._counts()[RoleType.VIEWER], (1, 1))
+
+    def test_stale_instances_are_counted_against_the_stored_row(self):
+        membership = UserRole.objects.create(
+            user=self.member, org=self.org, role=RoleType.VIEWER
+        )
+        first, second = (get_user_model().objects.get(pk=self.member.pk) for _ in range(2))
+        for user in (first, second):
+            user.is_active = False
+            user.save(update_fields=["is_active"])
+        self.assertEqual(self._counts()[RoleType.VIEWER], (1, 0))
+
+        stale = UserRole.objects.get(pk=membership.pk)
+        for instance in (membership, stale):
+            instance.role = RoleType.ORG_ADMIN
+            instance.save()
+        self.assertEqual(self._counts(), {RoleType.ORG_ADMIN: (2, 1)})
+
+    def test_bulk_user_delete_deactivates_and_counts(self):
+        UserRole.objects.create(user=self.member, org=self.org, role=RoleType.VIEWER)
+        users = get_user_model().objects.filter(pk=self.member.pk)
+
+        users.delete()
+        users.delete()
+
+        self.assertFalse(users.get().is_active)
+        self.assertEqual(self._counts()[RoleType.VIEWER], (1, 0))
+
+    def test_registration_counts_membership_once(self):
+        register_user(
+            username="buyer",
+            email="buyer@example.com",
+            password="pass1234",
+            role=RoleType.VIEWER,
+            org_id=self.org.org_id,
+        )
+        self.assertEqual(self._counts()[RoleType.VIEWER], (1, 1))
+
+        with self.assertRaisesMessage(ValueError, "Organization not found."):
+            register_user(
+                username="ghost",
+                email="ghost@example.com",
+                password="pass1234",
+                role=RoleType.VIEWER,
+                org_id="org_missing",
+            )
+        self.assertFalse(get_user_model().objects.filter(username="ghost").exists())
+
+    def test_rebuild_repairs_drift(self):
+        OrganizationRoleCount.objects.filter(org=self.org).update(active_count=7)
+
+        call_command("rebuild_role_counts", org_ids=[self.org.org_id], stdout=StringIO())
+
+        self.assertEqual(self._counts(), {RoleType.ORG_ADMIN: (1, 1)})
+
+    def test_last_admin_check_reads_one_row(self):
+        membership = (
+            UserRole.objects.select_related("user").get(user=self.admin, org=self.org)
+        )
+        with self.assertNumQueries(1):
+            self.assertTrue(is_last_active_admin(self.org.org_id, membership))
+
+        UserRole.objects.create(user=self.member, org=self.org, role=RoleType.ORG_ADMIN)
+        self.assertFalse(is_last_active_admin(self.org.org_id, membership))
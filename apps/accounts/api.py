@@ -1,23 +1,29 @@
-from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth import authenticate
 from django.db import transaction
 from rest_framework import status
 from rest_framework.decorators import api_view, authentication_classes, permission_classes
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView
 
 from shared.logging import get_logger
+from shared.serialization import compile_serializer
 
 from apps.access_control.domain.enums import RoleType
 from apps.access_control.models import UserRole
-from apps.access_control.repositories.user_role_repository import UserRoleRepository
+from apps.organizations.domain.enums import OrganizationStatus
 from apps.organizations.models import Organization
 from apps.accounts.models import UserStatus
 
+from .authentication import UNAVAILABLE_ORG_MESSAGES
+
 from .serializers import (
+    MembershipSerializer,
+    OrganizationSwitchSerializer,
     TokenResponseSerializer,
     UserCreateSerializer,
     UserLoginSerializer,
@@ -25,9 +31,18 @@ from .serializers import (
     UserResponseSerializer,
 )
 from .services.auth_token_service import issue_setup_token_pair, issue_token_pair
+from .services.registration_service import UserAlreadyExistsError, register_user
 
 logger = get_logger(__name__)
-User = get_user_model()
+
+# MembershipSerializer field -> UserRole.values() key.
+MEMBERSHIP_ROW_SOURCES = {
+    "org_id": "org_id",
+    "name": "org__name",
+    "status": "org__status",
+    "role": "role",
+    "assigned_at": "assigned_at",
+}
 
 
 @extend_schema(
@@ -47,30 +62,22 @@ def register_user_view(request):
     serializer = UserCreateSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
 
-    org_id = serializer.validated_data.get("org_id")
-    role = serializer.validated_data["role"]
-    organization = None
-
-    if org_id:
-        try:
-            organization = Organization.objects.get(org_id=org_id)
-        except Organization.DoesNotExist:
-            return Response({"detail": "Organization not found."}, status=status.HTTP_400_BAD_REQUEST)
-
-    with transaction.atomic():
-        user = User(
+    try:
+        registration = register_user(
             username=serializer.validated_data["username"],
             email=serializer.validated_data["email"],
-            primary_role=role,
+            password=serializer.validated_data["password"],
+            role=serializer.validated_data["role"],
+            org_id=serializer.validated_data.get("org_id"),
             first_name=serializer.validated_data.get("first_name", ""),
             last_name=serializer.validated_data.get("last_name", ""),
         )
-        user.set_password(serializer.validated_data["password"])
-        user.save()
-
-        if organization:
-            UserRoleRepository.assign_role(user=user, org=organization, role=role)
+    except UserAlreadyExistsError as exc:
+        return Response({exc.field: [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
+    except ValueError as exc:
+        return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
+    user = registration.user
     logger.info("User registered", extra={"user_id": user.id})
 
     response_data = {
@@ -83,23 +90,14 @@ def register_user_view(request):
         "date_joined": user.date_joined,
     }
 
-    if organization:
-        membership_role = (
-            UserRole.objects.filter(user=user, org=organization)
-            .values_list("role", flat=True)
-            .first()
-        ) or role
-        tokens = issue_token_pair(
-            user_id=user.id,
-            org_id=organization.org_id,
-            role=membership_role,
-        )
+    if registration.org_id:
+        tokens = issue_token_pair(user=user, org_id=registration.org_id, role=registration.role)
         response_data["access_token"] = tokens["access_token"]
         response_data["refresh_token"] = tokens["refresh_token"]
-        response_data["org_id"] = organization.org_id
-        response_data["role"] = membership_role
+        response_data["org_id"] = registration.org_id
+        response_data["role"] = registration.role
     else:
-        tokens = issue_setup_token_pair(user_id=user.id)
+        tokens = issue_setup_token_pair(user=user)
         response_data["access_token"] = tokens["access_token"]
         response_data["refresh_token"] = tokens["refresh_token"]
 
@@ -254,3 +252,94 @@ def logout_view(request):
         )
 
     return Response({"detail": "Logout successful."}, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    summary="List memberships",
+    description=(
+        "List the organizations the authenticated user belongs to, most recently joined "
+        "first. Works with setup tokens and with tokens for any of the user's orgs."
+    ),
+    responses={200: MembershipSerializer(many=True)},
+)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def list_memberships_view(request):
+    """List the current user's organization memberships."""
+    rows = (
+        UserRole.objects.filter(user_id=request.user.id)
+        .exclude(org__status=OrganizationStatus.DELETED)
+        .order_by("-assigned_at")
+        .values(*MEMBERSHIP_ROW_SOURCES.values())
+    )
+    serializer = compile_serializer(MembershipSerializer, sources=MEMBERSHIP_ROW_SOURCES)
+    return Response(serializer.many(rows), status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    summary="Switch organization",
+    description=(
+        "Exchange a valid refresh token for a token pair scoped to another organization "
+        "the user belongs to, without re-entering the password. The presented refresh "
+        "token is revoked."
+    ),
+    request=OrganizationSwitchSerializer,
+    responses={200: TokenResponseSerializer},
+)
+@api_view(["POST"])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def switch_organization_view(request):
+    """Mint an org-scoped token pair for another membership from a refresh token."""
+    serializer = OrganizationSwitchSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    org_id = serializer.validated_data["org_id"]
+
+    try:
+        refresh = RefreshToken(serializer.validated_data["refresh_token"])
+    except TokenError:
+        return Response(
+            {"detail": "Invalid or expired refresh token."},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+
+    # One lookup on uniq_user_org yields the role, the org status and the user.
+    membership = (
+        UserRole.objects.select_related("org", "user")
+        .filter(user_id=refresh[jwt_settings.USER_ID_CLAIM], org_id=org_id)
+        .first()
+    )
+    if membership is None:
+        return Response(
+            {"detail": "User does not belong to the specified organization."},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+    user = membership.user
+    if not user.is_active or user.status != UserStatus.ACTIVE:
+        return Response({"detail": "User is inactive."}, status=status.HTTP_403_FORBIDDEN)
+    unavailable = UNAVAILABLE_ORG_MESSAGES.get(membership.org.status)
+    if unavailable:
+        return Response({"detail": unavailable}, status=status.HTTP_403_FORBIDDEN)
+
+    with transaction.atomic():
+        # The presented refresh token is spent, as on logout. If a concurrent
+        # switch already revoked it, treat this one as reuse.
+        _, revoked = refresh.blacklist()
+        if not revoked:
+            return Response(
+                {"detail": "Invalid or expired refresh token."},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+        tokens = issue_token_pair(user=user, org_id=org_id, role=membership.role)
+    logger.info(
+        "Organization switched",
+        extra={"user_id": user.id, "org_id": org_id},
+    )
+    response = {
+        "access_token": tokens["access_token"],
+        "refresh_token": tokens["refresh_token"],
+        "user_id": user.id,
+        "org_id": org_id,
+        "role": membership.role,
+    }
+    return Response(response, status=status.HTTP_200_OK)
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.exceptions import AuthenticationFailed, PermissionDenied
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from apps.access_control.models import UserRole
 from apps.accounts.models import UserStatus
+from apps.organizations.domain.enums import OrganizationStatus
+
+from .services import membership_cache
+
+UNAVAILABLE_ORG_MESSAGES = {
+    OrganizationStatus.SUSPENDED: "Organization is suspended.",
+    OrganizationStatus.DELETED: "Organization has been deleted.",
+}
+
 
 class OrgTokenAuthentication(JWTAuthentication):
 
@@ -33,18 +41,17 @@ class OrgTokenAuthentication(JWTAuthentication):
                 raise AuthenticationFailed("Token role does not match request.")
             return (user, validated_token)
 
-        membership = (
-            UserRole.objects.select_related("org")
-            .filter(user=user, org_id=org_id)
-            .first()
-        )
+        membership = membership_cache.get_membership(user.pk, org_id)
         if membership is None:
             raise AuthenticationFailed("Token org context is invalid.")
         if membership.role != role:
             raise AuthenticationFailed("Token role is invalid.")
+        unavailable = UNAVAILABLE_ORG_MESSAGES.get(membership.org_status)
+        if unavailable:
+            raise PermissionDenied(unavailable)
 
         request.org_id = org_id
-        request.organization = membership.org
+        request.organization = membership.build_organization()
         request.organization_role = membership.role
 
         return (user, validated_token)
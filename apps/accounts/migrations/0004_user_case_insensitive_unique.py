@@ -0,0 +1,46 @@
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_insensitive_duplicates(apps, schema_editor):
+    """Fail with the clashing values instead of a bare constraint error.
+
+    Users that differ only by letter case must be merged or renamed by hand;
+    picking a survivor automatically could lock the wrong person out.
+    """
+    User = apps.get_model("accounts", "User")
+    clashes = []
+    for field in ("username", "email"):
+        duplicates = (
+            User.objects.annotate(value=Lower(field))
+            .values("value")
+            .annotate(total=Count("id"))
+            .filter(total__gt=1)
+            .order_by("value")
+            .values_list("value", flat=True)
+        )
+        clashes.extend(f"{field}={value!r}" for value in duplicates[:50])
+    if clashes:
+        raise RuntimeError(
+            "Users differ only by letter case; merge or rename them before adding the "
+            "case-insensitive unique constraints: " + ", ".join(clashes)
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0003_merge_0002_user_primary_role_0002_user_status"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_insensitive_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(Lower("username"), name="uniq_user_username_ci"),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(Lower("email"), name="uniq_user_email_ci"),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+INDEX_NAME = "idx_user_username_lower_prefix"
+
+
+def create_prefix_index(apps, schema_editor):
+    # Invite username generation filters on LOWER(username) LIKE 'base%'. The
+    # unique Lower() index cannot serve LIKE under a non-C collation; a
+    # text_pattern_ops index on the same expression can. PostgreSQL only.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = schema_editor.quote_name(apps.get_model("accounts", "User")._meta.db_table)
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON {table} (LOWER(username) text_pattern_ops)"
+    )
+
+
+def drop_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0004_user_case_insensitive_unique"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_index, drop_prefix_index),
+    ]
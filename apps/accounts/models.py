@@ -3,7 +3,8 @@ from __future__ import annotations
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import PermissionsMixin, UserManager as DjangoUserManager
 from django.contrib.auth.validators import UnicodeUsernameValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 from apps.access_control.domain.enums import RoleType
@@ -15,8 +16,17 @@ class UserStatus(models.TextChoices):
 
 
 class UserQuerySet(models.QuerySet):
-    def delete(self):  # pragma: no cover - used for safety
-        return self.update(status=UserStatus.INACTIVE, is_active=False)
+    def delete(self):
+        """Deactivate instead of deleting, keeping the org role counts in step."""
+        from apps.access_control.services import role_count_service
+
+        with transaction.atomic():
+            deactivated = list(
+                self.filter(is_active=True).select_for_update().values_list("id", flat=True)
+            )
+            updated = self.update(status=UserStatus.INACTIVE, is_active=False)
+            role_count_service.count_activation_changes(deactivated, sign=-1)
+        return updated
 
 
 class UserManager(DjangoUserManager.from_queryset(UserQuerySet)):
@@ -89,10 +99,21 @@ class User(AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = "user"
         verbose_name_plural = "users"
+        constraints = [
+            # Registration relies on these instead of checking for duplicates first.
+            models.UniqueConstraint(Lower("username"), name="uniq_user_username_ci"),
+            models.UniqueConstraint(Lower("email"), name="uniq_user_email_ci"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - convenience only
         return self.username
 
+    def save(self, *args, **kwargs):
+        # Role-count receivers lock the stored row in pre_save; the write must
+        # share their transaction.
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+
     def get_full_name(self) -> str:
         full_name = f"{self.first_name} {self.last_name}".strip()
         return full_name
@@ -1,11 +1,8 @@
-from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 
 from apps.access_control.domain.enums import RoleType
 
-User = get_user_model()
-
 
 class UserCreateSerializer(serializers.Serializer):
     username = serializers.CharField(max_length=150, allow_blank=False, trim_whitespace=True)
@@ -20,15 +17,11 @@ class UserCreateSerializer(serializers.Serializer):
         normalized = value.strip()
         if not normalized:
             raise serializers.ValidationError("Username cannot be empty.")
-        if User.objects.filter(username__iexact=normalized).exists():
-            raise serializers.ValidationError("A user with that username already exists.")
+        # Uniqueness is enforced by the database; see registration_service.
         return normalized
 
     def validate_email(self, value: str) -> str:
-        normalized = value.strip().lower()
-        if User.objects.filter(email__iexact=normalized).exists():
-            raise serializers.ValidationError("A user with that email already exists.")
-        return normalized
+        return value.strip().lower()
 
     def validate_password(self, value: str) -> str:
         validate_password(value)
@@ -91,3 +84,16 @@ class TokenResponseSerializer(serializers.Serializer):
     user_id = serializers.IntegerField()
     org_id = serializers.CharField()
     role = serializers.CharField()
+
+
+class MembershipSerializer(serializers.Serializer):
+    org_id = serializers.CharField()
+    name = serializers.CharField()
+    status = serializers.CharField()
+    role = serializers.CharField()
+    assigned_at = serializers.DateTimeField()
+
+
+class OrganizationSwitchSerializer(serializers.Serializer):
+    refresh_token = serializers.CharField(allow_blank=False)
+    org_id = serializers.CharField(allow_blank=False, trim_whitespace=True)
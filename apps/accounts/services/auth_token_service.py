@@ -14,9 +14,14 @@ def _build_refresh_token(*, user, org_id: str | None = None, role: str | None =
     return refresh
 
 
-def issue_setup_token_pair(*, user_id: int) -> dict[str, str]:
+def _resolve_user(user_id: int | None, user):
+    # Callers that already hold the user pass it to skip the re-fetch.
+    return user if user is not None else User.objects.get(id=user_id)
+
+
+def issue_setup_token_pair(*, user_id: int | None = None, user=None) -> dict[str, str]:
     """Issue tokens without org context for post-register setup (e.g. create org)."""
-    user = User.objects.get(id=user_id)
+    user = _resolve_user(user_id, user)
     refresh = _build_refresh_token(user=user)
     return {
         "access_token": str(refresh.access_token),
@@ -33,8 +38,10 @@ def issue_token(*, user_id: int, org_id: str, role: str) -> str:
     return str(refresh.access_token)
 
 
-def issue_token_pair(*, user_id: int, org_id: str, role: str) -> dict[str, str]:
-    user = User.objects.get(id=user_id)
+def issue_token_pair(
+    *, user_id: int | None = None, org_id: str, role: str, user=None
+) -> dict[str, str]:
+    user = _resolve_user(user_id, user)
     refresh = _build_refresh_token(user=user, org_id=org_id, role=role)
     return {
         "access_token": str(refresh.access_token),
@@ -0,0 +1,82 @@
+"""Per-process cache of the membership and org context resolved for each token.
+
+``OrgTokenAuthentication`` needs the caller's role and organization (including
+its status) on every request. Entries live in an ``L1Cache`` for
+``MEMBERSHIP_CACHE_TTL_SECONDS`` and are invalidated across all API and Celery
+processes through the invalidation bus whenever the organization or the
+membership changes (see ``apps.organizations.signals``), so a suspension takes
+effect within moments rather than after the TTL.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from django.conf import settings
+
+from shared.invalidation import L1Cache, get_bus
+
+from apps.access_control.models import UserRole
+from apps.organizations.cache_scopes import membership_scope, org_scope
+from apps.organizations.models import Organization
+
+_ORG_FIELDS = tuple(field.attname for field in Organization._meta.concrete_fields)
+
+
+@dataclass(frozen=True)
+class MembershipContext:
+    org_id: str
+    role: str
+    org_status: str
+    org_values: Tuple[Any, ...]
+
+    def build_organization(self) -> Organization:
+        """A fresh ``Organization`` per request, so callers may mutate and save it."""
+        return Organization.from_db("default", _ORG_FIELDS, self.org_values)
+
+
+cache = L1Cache(
+    "accounts.memberships",
+    ttl=getattr(settings, "MEMBERSHIP_CACHE_TTL_SECONDS", 30),
+    max_entries=getattr(settings, "MEMBERSHIP_CACHE_MAX_ENTRIES", 50_000),
+)
+
+
+def _load(user_id: int, org_id: str) -> Optional[MembershipContext]:
+    membership = (
+        UserRole.objects.select_related("org")
+        .filter(user_id=user_id, org_id=org_id)
+        .first()
+    )
+    if membership is None:
+        return None
+    org = membership.org
+    return MembershipContext(
+        org_id=org.org_id,
+        role=membership.role,
+        org_status=org.status,
+        org_values=tuple(getattr(org, attname) for attname in _ORG_FIELDS),
+    )
+
+
+def get_membership(user_id: int, org_id: str) -> Optional[MembershipContext]:
+    """Cached membership for ``user_id`` in ``org_id``, or ``None`` if not a member."""
+    if cache.ttl <= 0:
+        return _load(user_id, org_id)
+    return cache.get_or_load(
+        (user_id, org_id),
+        lambda: _load(user_id, org_id),
+        scopes=(org_scope(org_id), membership_scope(user_id, org_id)),
+    )
+
+
+def invalidate(*, org_id: str, user_id: Optional[int] = None) -> None:
+    """Invalidate one membership, or with ``user_id=None`` every membership of the org."""
+    if user_id is None:
+        get_bus().invalidate(org_scope(org_id))
+    else:
+        get_bus().invalidate(membership_scope(user_id, org_id))
+
+
+def clear() -> None:
+    cache.clear()
@@ -0,0 +1,95 @@
+"""Self-service registration in three queries.
+
+Username and email uniqueness are enforced by the case-insensitive unique
+constraints on ``User`` rather than checked up front; a violation surfaces
+as an ``IntegrityError`` and is mapped back to a field error. The membership
+for ``org_id`` is a plain insert, since a brand-new user cannot have one,
+and the org's role-count update doubles as its existence check. The view's
+refresh-token insert makes four, the accepted ``accounts.register`` baseline.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+
+from apps.access_control.models import UserRole
+from apps.access_control.services import role_count_service
+
+User = get_user_model()
+
+# Unique constraints on User mapped to the request field and message they report.
+UNIQUE_FIELD_ERRORS = {
+    "username": "A user with that username already exists.",
+    "email": "A user with that email already exists.",
+}
+
+
+class UserAlreadyExistsError(ValueError):
+    """The username or email (``field``) is taken, case-insensitively."""
+
+    def __init__(self, field: str):
+        self.field = field
+        super().__init__(UNIQUE_FIELD_ERRORS[field])
+
+
+@dataclass(frozen=True)
+class Registration:
+    user: User
+    org_id: Optional[str] = None
+    role: Optional[str] = None
+
+
+def unique_violation_field(exc: IntegrityError) -> Optional[str]:
+    # PostgreSQL names the violated constraint; SQLite only names it in the message.
+    diag = getattr(exc.__cause__, "diag", None)
+    detail = (getattr(diag, "constraint_name", None) or str(exc)).lower()
+    for field in UNIQUE_FIELD_ERRORS:
+        if field in detail:
+            return field
+    return None
+
+
+def register_user(
+    *,
+    username: str,
+    email: str,
+    password: str,
+    role: str,
+    org_id: Optional[str] = None,
+    first_name: str = "",
+    last_name: str = "",
+) -> Registration:
+    """Create the user and, with ``org_id``, their membership.
+
+    Raises ``UserAlreadyExistsError`` when the username or email is taken
+    and ``ValueError`` when the organization does not exist.
+    """
+    user = User(
+        username=username,
+        email=email,
+        primary_role=role,
+        first_name=first_name,
+        last_name=last_name,
+    )
+    user.set_password(password)
+    try:
+        with transaction.atomic():
+            # Counting the membership first also checks that the org exists.
+            if org_id and not role_count_service.add_member(org_id, role):
+                raise ValueError("Organization not found.")
+            user.save(force_insert=True)
+            if org_id:
+                # bulk_create skips the role-count receivers; add_member counted it.
+                UserRole.objects.bulk_create([UserRole(user=user, org_id=org_id, role=role)])
+    except IntegrityError as exc:
+        field = unique_violation_field(exc)
+        if field is None:
+            raise
+        raise UserAlreadyExistsError(field) from exc
+
+    if org_id:
+        return Registration(user=user, org_id=org_id, role=role)
+    return Registration(user=user)
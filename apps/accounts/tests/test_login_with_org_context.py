@@ -53,6 +53,19 @@ class LoginWithOrgContextTests(TestCase):
         self.assertTrue(payload["access_token"])
         self.assertTrue(payload["refresh_token"])
 
+    @override_settings(COMPRESSION_MIN_SIZE=0)
+    def test_login_response_is_not_compressed(self):
+        response = self.client.post(
+            "/api/accounts/login",
+            {"username": self.user.username, "password": self.password},
+            format="json",
+            HTTP_ACCEPT_ENCODING="gzip",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertTrue(response.json()["refresh_token"])
+
     def test_login_requires_org_id_when_multiple_memberships(self):
         create_organization(
             creator=self.user,
@@ -0,0 +1,99 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import UserRole
+from apps.accounts.services import membership_cache
+from apps.accounts.services.auth_token_service import issue_token
+from apps.organizations.domain.enums import OrganizationStatus
+from apps.organizations.services.organization_service import create_organization
+from shared.invalidation import InMemoryBroker, InMemoryTransport, InvalidationBus, set_bus
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+)
+class MembershipCacheTests(TestCase):
+    def setUp(self):
+        self.broker = InMemoryBroker()
+        set_bus(InvalidationBus(InMemoryTransport(self.broker)))
+        self.addCleanup(set_bus, None)
+        membership_cache.clear()
+        self.addCleanup(membership_cache.clear)
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.user, name="Org One", country="US", base_currency="USD"
+        )
+        token = issue_token(user_id=self.user.id, org_id=self.org.org_id, role=RoleType.ORG_ADMIN)
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    def _get_settings(self):
+        return self.client.get("/api/organizations/settings", **self.headers)
+
+    def test_membership_is_cached_between_requests(self):
+        self.assertEqual(self._get_settings().status_code, 200)
+
+        with mock.patch.object(membership_cache, "_load") as load:
+            response = self._get_settings()
+
+        load.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["org_id"], self.org.org_id)
+
+    def test_suspended_org_is_rejected_before_view(self):
+        self.assertEqual(self._get_settings().status_code, 200)
+        self.org.status = OrganizationStatus.SUSPENDED
+        self.org.save(update_fields=["status"])
+
+        with mock.patch("apps.organizations.api.compile_serializer") as compile_serializer:
+            response = self._get_settings()
+
+        compile_serializer.assert_not_called()
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()["detail"], "Organization is suspended.")
+
+    def test_deleted_org_is_rejected_on_exempt_endpoints(self):
+        self.org.delete()
+
+        response = self.client.get("/api/dashboard/me", **self.headers)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()["detail"], "Organization has been deleted.")
+
+    def test_invalidation_from_another_process_drops_entries(self):
+        membership_cache.get_membership(self.user.id, self.org.org_id)
+        other_process = InvalidationBus(InMemoryTransport(self.broker))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other_process.invalidate(f"org:{self.org.org_id}")
+
+        with mock.patch.object(membership_cache, "_load", return_value=None) as load:
+            membership_cache.get_membership(self.user.id, self.org.org_id)
+        load.assert_called_once_with(self.user.id, self.org.org_id)
+
+    def test_invalidation_is_published_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            membership_cache.invalidate(org_id=self.org.org_id, user_id=self.user.id)
+
+        self.assertEqual(self.broker.published, [[f"membership:{self.user.id}:{self.org.org_id}"]])
+
+    def test_role_change_signal_invalidates_membership(self):
+        context = membership_cache.get_membership(self.user.id, self.org.org_id)
+        self.assertEqual(context.role, RoleType.ORG_ADMIN)
+        role = UserRole.objects.get(user=self.user, org=self.org)
+        role.role = RoleType.VIEWER
+        role.save(update_fields=["role"])
+
+        context = membership_cache.get_membership(self.user.id, self.org.org_id)
+        self.assertEqual(context.role, RoleType.VIEWER)
@@ -0,0 +1,139 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import UserRole
+from apps.accounts.services.auth_token_service import issue_setup_token_pair, issue_token_pair
+from apps.core.tests.query_baseline import count_queries
+from apps.organizations.domain.enums import OrganizationStatus
+from apps.organizations.services.organization_service import create_organization
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+)
+class MembershipsAndOrgSwitchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.user, name="Org One", country="US", base_currency="USD"
+        )
+        owner = get_user_model().objects.create_user(
+            username="owner",
+            email="owner@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.other_org = create_organization(
+            creator=owner, name="Org Two", country="US", base_currency="USD"
+        )
+        UserRole.objects.create(
+            user=self.user, org=self.other_org, role=RoleType.FINANCE
+        )
+        self.tokens = issue_token_pair(
+            user=self.user, org_id=self.org.org_id, role=RoleType.ORG_ADMIN
+        )
+
+    def _switch(self, org_id, refresh_token=None):
+        return self.client.post(
+            "/api/accounts/switch-org",
+            {"refresh_token": refresh_token or self.tokens["refresh_token"], "org_id": org_id},
+            format="json",
+        )
+
+    def test_lists_memberships_without_org_header(self):
+        response = self.client.get(
+            "/api/accounts/memberships",
+            HTTP_AUTHORIZATION=f"Bearer {self.tokens['access_token']}",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        memberships = {row["org_id"]: row for row in response.json()}
+        self.assertEqual(set(memberships), {self.org.org_id, self.other_org.org_id})
+        self.assertEqual(memberships[self.other_org.org_id]["role"], RoleType.FINANCE)
+        self.assertEqual(memberships[self.other_org.org_id]["name"], "Org Two")
+        self.assertEqual(memberships[self.org.org_id]["status"], OrganizationStatus.ACTIVE)
+
+    def test_deleted_orgs_are_not_listed(self):
+        self.other_org.soft_delete()
+        setup_tokens = issue_setup_token_pair(user=self.user)
+
+        response = self.client.get(
+            "/api/accounts/memberships",
+            HTTP_AUTHORIZATION=f"Bearer {setup_tokens['access_token']}",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["org_id"] for row in response.json()], [self.org.org_id])
+
+    def test_switch_mints_tokens_for_other_org(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self._switch(self.other_org.org_id)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["org_id"], self.other_org.org_id)
+        self.assertEqual(payload["role"], RoleType.FINANCE)
+        access = AccessToken(payload["access_token"])
+        self.assertEqual(access["org_id"], self.other_org.org_id)
+        self.assertEqual(RefreshToken(payload["refresh_token"])["role"], RoleType.FINANCE)
+        # Blacklist check, membership lookup, revoking the presented token
+        # (user, outstanding and blacklist lookups, blacklist insert) and the
+        # new outstanding-token insert.
+        self.assertEqual(count_queries(captured), 7)
+
+        response = self.client.get(
+            "/api/organizations/settings",
+            HTTP_AUTHORIZATION=f"Bearer {payload['access_token']}",
+            HTTP_X_ORG_ID=self.other_org.org_id,
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_switch_rejects_non_member_and_unavailable_orgs(self):
+        outsider_org = create_organization(
+            creator=get_user_model().objects.get(username="owner"),
+            name="Org Three",
+            country="US",
+            base_currency="USD",
+        )
+        response = self._switch(outsider_org.org_id)
+        self.assertEqual(response.status_code, 403)
+
+        self.other_org.status = OrganizationStatus.SUSPENDED
+        self.other_org.save(update_fields=["status"])
+        response = self._switch(self.other_org.org_id)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()["detail"], "Organization is suspended.")
+
+    def test_switch_rejects_blacklisted_refresh_token(self):
+        RefreshToken(self.tokens["refresh_token"]).blacklist()
+
+        response = self._switch(self.other_org.org_id)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_switch_revokes_the_presented_refresh_token(self):
+        switched = self._switch(self.other_org.org_id)
+        self.assertEqual(switched.status_code, 200)
+
+        self.assertEqual(self._switch(self.org.org_id).status_code, 401)
+        for refresh_token, expected in (
+            (self.tokens["refresh_token"], 401),
+            (switched.json()["refresh_token"], 200),
+        ):
+            response = self.client.post(
+                "/api/accounts/refresh", {"refresh": refresh_token}, format="json"
+            )
+            self.assertEqual(response.status_code, expected)
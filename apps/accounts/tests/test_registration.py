@@ -0,0 +1,99 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import UserRole
+from apps.accounts.services.registration_service import UserAlreadyExistsError, register_user
+from apps.core.tests.query_baseline import count_queries
+from apps.organizations.services.organization_service import create_organization
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+)
+class RegistrationServiceTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = get_user_model().objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.admin, name="Org One", country="US", base_currency="USD"
+        )
+
+    def _register(self, **overrides):
+        payload = {
+            "username": "finance",
+            "email": "finance@example.com",
+            "password": "SecurePass123!",
+            "role": RoleType.FINANCE,
+            "org_id": self.org.org_id,
+        }
+        payload.update(overrides)
+        return self.client.post("/api/accounts/register", payload, format="json")
+
+    def test_registration_with_org_takes_at_most_three_queries(self):
+        with CaptureQueriesContext(connection) as captured:
+            registration = register_user(
+                username="finance",
+                email="finance@example.com",
+                password="SecurePass123!",
+                role=RoleType.FINANCE,
+                org_id=self.org.org_id,
+            )
+
+        self.assertLessEqual(count_queries(captured), 3)
+        self.assertEqual(registration.role, RoleType.FINANCE)
+        self.assertTrue(
+            UserRole.objects.filter(user=registration.user, org=self.org, role=RoleType.FINANCE)
+            .exists()
+        )
+
+    def test_duplicate_username_differing_in_case_is_a_field_error(self):
+        response = self._register(username="ADMIN")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["username"], ["A user with that username already exists."]
+        )
+        self.assertEqual(get_user_model().objects.count(), 1)
+
+    def test_duplicate_email_is_a_field_error(self):
+        response = self._register(email="Admin@Example.com")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["email"], ["A user with that email already exists."])
+
+    def test_unknown_organization_is_rejected(self):
+        with self.assertRaises(ValueError):
+            register_user(
+                username="finance",
+                email="finance@example.com",
+                password="SecurePass123!",
+                role=RoleType.FINANCE,
+                org_id="org_missing",
+            )
+
+        response = self._register(org_id="org_missing")
+        self.assertEqual(response.json(), {"detail": "Organization not found."})
+
+    def test_integrity_error_maps_to_field(self):
+        get_user_model().objects.create_user(
+            username="other", email="taken@example.com", password="x", primary_role=RoleType.VIEWER
+        )
+        with self.assertRaises(UserAlreadyExistsError) as ctx:
+            register_user(
+                username="fresh",
+                email="taken@example.com",
+                password="SecurePass123!",
+                role=RoleType.ORG_ADMIN,
+            )
+        self.assertEqual(ctx.exception.field, "email")
@@ -7,4 +7,6 @@ urlpatterns = [
     path("accounts/login", api.login_view, name="accounts-login"),
     path("accounts/refresh", api.RefreshTokenView.as_view(), name="accounts-token-refresh"),
     path("accounts/logout", api.logout_view, name="accounts-logout"),
+    path("accounts/memberships", api.list_memberships_view, name="accounts-memberships"),
+    path("accounts/switch-org", api.switch_organization_view, name="accounts-switch-org"),
 ]
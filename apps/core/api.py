@@ -1,12 +1,16 @@
+from django.http import HttpResponse
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SpectacularAPIView
 
+from shared.http import etag_matches
 from shared.logging import get_logger
 
 from .serializers import CoreExampleResponseSerializer
+from .services import schema_service
 
 logger = get_logger(__name__)
 
@@ -22,3 +26,36 @@ def example_view(request):
     """Return a basic OK response for smoke testing."""
     logger.info("Example view hit", extra={"path": request.path})
     return Response({"status": "ok"}, status=status.HTTP_200_OK)
+
+
+class PrecomputedSchemaView(SpectacularAPIView):
+    """Serve the precomputed OpenAPI schema from memory with ETag revalidation.
+
+    Versioned or translated schema requests are generated on demand.
+    """
+
+    def _get_schema_response(self, request):
+        dynamic = (
+            self.api_version
+            or request.version
+            or request.GET.get("version")
+            or request.GET.get("lang")
+        )
+        if dynamic:
+            return super()._get_schema_response(request)
+
+        renderer = request.accepted_renderer
+        rendered = schema_service.get_rendered_schema(renderer)
+        if etag_matches(request, rendered.etag):
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            content_type = renderer.media_type
+            if renderer.charset:
+                content_type = f"{content_type}; charset={renderer.charset}"
+            response = HttpResponse(rendered.content, content_type=content_type)
+            response["Content-Disposition"] = (
+                f'inline; filename="{self._get_filename(request, None)}"'
+            )
+        response["ETag"] = rendered.etag
+        response["Cache-Control"] = "public, no-cache"
+        return response
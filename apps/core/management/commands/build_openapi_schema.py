@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.services import schema_service
+
+
+class Command(BaseCommand):
+    help = "Generate the OpenAPI schema served by /api/schema/ and write it to OPENAPI_SCHEMA_FILE."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=None,
+            help="Write to this path instead of OPENAPI_SCHEMA_FILE.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only verify the existing file is up to date; exit non-zero if it is stale.",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["file"]) if options["file"] else schema_service.get_schema_file()
+
+        if options["check"]:
+            if not schema_service.is_schema_file_fresh(path):
+                raise CommandError(f"OpenAPI schema at {path} is missing or stale.")
+            self.stdout.write(f"OpenAPI schema at {path} is up to date.")
+            return
+
+        schema_service.write_schema_file(path)
+        self.stdout.write(self.style.SUCCESS(f"OpenAPI schema written to {path}"))
@@ -0,0 +1,22 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks import synthetic
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk load deterministic synthetic organizations, users, memberships and invites "
+        "for scale testing. Writes to the configured database."
+    )
+
+    def add_arguments(self, parser):
+        synthetic.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        try:
+            config = synthetic.config_from_options(options)
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(json.dumps(synthetic.generate(config), indent=2))
@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from benchmarks import load
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database and load-test login, refresh, dashboard/me, "
+        "org users listing and invoice upload. Prints JSON results."
+    )
+
+    def add_arguments(self, parser):
+        load.add_arguments(parser)
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Also write the JSON results to this file.",
+        )
+
+    def handle(self, *args, **options):
+        results = load.run_isolated(
+            keepdb=options["keepdb"],
+            verbosity=max(options["verbosity"] - 1, 0),
+            orgs=options["orgs"],
+            users_per_org=options["users_per_org"],
+            invites_per_org=options["invites_per_org"],
+            iterations=options["iterations"],
+            scenarios=options["scenarios"],
+            seed=options["seed"],
+        )
+        body = json.dumps(results, indent=2)
+        if options["output"]:
+            Path(options["output"]).write_text(body + "\n")
+        self.stdout.write(body)
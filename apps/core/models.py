@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxMessage(models.Model):
+    """A side effect recorded in the same transaction as the change that caused it.
+
+    Written by ``outbox_service.enqueue`` and drained by ``outbox_service.relay``,
+    which hands each ``topic`` to its registered handler and deletes the row
+    once the handler's work has committed.
+    """
+
+    topic = models.CharField(max_length=100)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    failed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "outbox_messages"
+        indexes = [
+            # The relay only scans live rows; failed ones are kept for inspection.
+            models.Index(
+                fields=["available_at", "id"],
+                name="idx_outbox_available",
+                condition=models.Q(failed_at__isnull=True),
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - convenience only
+        return f"{self.topic} #{self.id}"
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from itertools import groupby
+from typing import Any, Callable, Iterable, Mapping
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from shared.logging import get_logger
+
+from ..models import OutboxMessage
+
+logger = get_logger(__name__)
+
+RELAY_MODES = ("celery", "sync")
+RETRY_FIELDS = ("attempts", "last_error", "available_at", "failed_at", "payload")
+
+Handler = Callable[[list[Any]], None]
+Redactor = Callable[[Any], Any]
+_handlers: dict[str, Handler] = {}
+_redactors: dict[str, Redactor] = {}
+
+
+def register_handler(topic: str, handler: Handler, *, redact: Redactor | None = None) -> None:
+    """Route ``topic`` to ``handler``; call from ``AppConfig.ready``.
+
+    Handlers receive every claimed payload of their topic as one list and run
+    inside the relay's transaction, so database writes they make commit
+    together with the removal of the outbox rows. Anything they publish
+    outside the database should wait for ``transaction.on_commit``. A row is
+    redelivered if the relay dies before committing, so handlers must
+    tolerate seeing a payload twice.
+
+    A message that runs out of attempts keeps only ``redact(payload)``, so
+    secrets do not sit in the dead-letter rows; without ``redact`` its
+    payload is emptied.
+    """
+    _handlers[topic] = handler
+    if redact is None:
+        _redactors.pop(topic, None)
+    else:
+        _redactors[topic] = redact
+
+
+def enqueue(topic: str, payload: Mapping[str, Any]) -> None:
+    enqueue_many(topic, [payload])
+
+
+def enqueue_many(topic: str, payloads: Iterable[Mapping[str, Any]]) -> None:
+    """Record side effects in the caller's transaction; they run only if it commits."""
+    messages = OutboxMessage.objects.bulk_create(
+        [OutboxMessage(topic=topic, payload=dict(payload)) for payload in payloads]
+    )
+    if messages:
+        transaction.on_commit(_wake_relay)
+
+
+def _wake_relay() -> None:
+    """Start draining now instead of at the next scheduled relay run.
+
+    Only an optimization: if publishing fails, or the process dies before it
+    gets here, the beat-scheduled ``relay_outbox`` picks the rows up.
+    """
+    mode = getattr(settings, "OUTBOX_RELAY_MODE", "celery")
+    if mode not in RELAY_MODES:
+        raise ValueError(f"Unknown OUTBOX_RELAY_MODE {mode!r}.")
+    if mode == "sync":
+        drain()
+        return
+    from ..tasks import relay_outbox
+
+    try:
+        relay_outbox.delay()
+    except Exception:
+        logger.warning("Outbox relay task not published; left for the schedule", exc_info=True)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    seconds = settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1)
+    return timedelta(seconds=min(seconds, settings.OUTBOX_RETRY_MAX_SECONDS))
+
+
+def _run(handler: Handler, messages: list[OutboxMessage]) -> Exception | None:
+    try:
+        with transaction.atomic():
+            handler([message.payload for message in messages])
+    except Exception as exc:
+        return exc
+    return None
+
+
+def _redacted(topic: str, payload: Any) -> Any:
+    redact = _redactors.get(topic)
+    if redact is not None:
+        try:
+            return redact(payload)
+        except Exception:
+            logger.warning("Outbox payload redaction failed", exc_info=True, extra={"topic": topic})
+    return {}
+
+
+def _back_off(messages: list[OutboxMessage], exc: Exception, now) -> None:
+    for message in messages:
+        message.attempts += 1
+        message.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+        if message.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            message.failed_at = now
+            message.payload = _redacted(message.topic, message.payload)
+        else:
+            message.available_at = now + retry_delay(message.attempts)
+
+
+def relay(batch_size: int | None = None) -> int:
+    """Claim up to ``batch_size`` due messages and hand them to their handlers.
+
+    Rows are locked with ``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent
+    relays split the backlog instead of queueing behind each other. Each
+    topic's handler runs once per batch in its own savepoint. On success its
+    rows are deleted in the same transaction. If the batch fails, each message
+    is retried alone so only the failing ones are backed off; after
+    ``OUTBOX_MAX_ATTEMPTS`` those are marked failed, redacted and left in
+    place. Returns the number of messages claimed.
+    """
+    batch_size = batch_size or settings.OUTBOX_RELAY_BATCH_SIZE
+    now = timezone.now()
+    with transaction.atomic():
+        messages = list(
+            OutboxMessage.objects.filter(failed_at__isnull=True, available_at__lte=now)
+            .select_for_update(skip_locked=True)
+            .order_by("available_at", "id")[:batch_size]
+        )
+        if not messages:
+            return 0
+
+        done: list[int] = []
+        retry: list[OutboxMessage] = []
+        by_topic = sorted(messages, key=lambda message: (message.topic, message.id))
+        for topic, grouped in groupby(by_topic, key=lambda message: message.topic):
+            group = list(grouped)
+            handler = _handlers.get(topic)
+            if handler is None:
+                failures = [(group, LookupError(f"No outbox handler registered for {topic!r}."))]
+            else:
+                error = _run(handler, group)
+                if error is None:
+                    done.extend(message.id for message in group)
+                    continue
+                failures = [(group, error)]
+                if len(group) > 1:
+                    # One bad payload must not cost the whole group an attempt.
+                    failures = []
+                    for message in group:
+                        error = _run(handler, [message])
+                        if error is None:
+                            done.append(message.id)
+                        else:
+                            failures.append(([message], error))
+
+            for failed, error in failures:
+                logger.warning(
+                    "Outbox handler failed",
+                    exc_info=error,
+                    extra={"topic": topic, "message_count": len(failed)},
+                )
+                _back_off(failed, error, now)
+                retry.extend(failed)
+
+        if done:
+            OutboxMessage.objects.filter(id__in=done).delete()
+        if retry:
+            OutboxMessage.objects.bulk_update(retry, RETRY_FIELDS)
+    return len(messages)
+
+
+def drain(max_batches: int | None = None) -> int:
+    """Relay batches until the backlog is empty or ``max_batches`` have run."""
+    batch_size = settings.OUTBOX_RELAY_BATCH_SIZE
+    max_batches = max_batches or settings.OUTBOX_RELAY_MAX_BATCHES
+    total = 0
+    for _ in range(max_batches):
+        claimed = relay(batch_size)
+        total += claimed
+        if claimed < batch_size:
+            break
+    return total
@@ -0,0 +1,155 @@
+"""Precomputed OpenAPI schema.
+
+The schema is generated at deploy time by ``manage.py build_openapi_schema``
+and written to ``OPENAPI_SCHEMA_FILE`` together with a fingerprint of the
+modules it is derived from (URLconfs, API views, serializers, and the models,
+enums and paginators that feed field types and response shapes).  At
+runtime the file is loaded once per process; if it is missing or its
+fingerprint no longer matches the code, the schema is regenerated in-process
+instead of serving a stale document.  Rendered bytes are memoized per format.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.utils import timezone
+from drf_spectacular.settings import spectacular_settings
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA_MODULE_SUFFIXES = ("urls", "api", "serializers", "models", "pagination", "domain.enums")
+
+
+@dataclass(frozen=True)
+class RenderedSchema:
+    content: bytes
+    etag: str
+
+
+_lock = threading.Lock()
+_document: Optional[dict[str, Any]] = None
+_fingerprint: Optional[str] = None
+_rendered: dict[str, RenderedSchema] = {}
+
+
+def get_schema_file() -> Path:
+    return Path(getattr(settings, "OPENAPI_SCHEMA_FILE"))
+
+
+def _schema_modules() -> list[str]:
+    modules = [settings.ROOT_URLCONF]
+    for app_config in apps.get_app_configs():
+        if not app_config.name.startswith("apps."):
+            continue
+        for suffix in _SCHEMA_MODULE_SUFFIXES:
+            modules.append(f"{app_config.name}.{suffix}")
+    return modules
+
+
+def compute_fingerprint() -> str:
+    """Hash the sources and settings the schema is generated from."""
+    digest = hashlib.sha256()
+    digest.update(repr(sorted(settings.SPECTACULAR_SETTINGS.items())).encode())
+    for name in _schema_modules():
+        try:
+            module = import_module(name)
+        except ModuleNotFoundError:
+            continue
+        source_file = getattr(module, "__file__", None)
+        if not source_file:
+            continue
+        digest.update(name.encode())
+        digest.update(Path(source_file).read_bytes())
+    return digest.hexdigest()
+
+
+def generate_schema() -> dict[str, Any]:
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+    # Round-trip through JSON so lazy strings and other rich types become
+    # plain values, exactly as they would be after loading the schema file.
+    return json.loads(json.dumps(schema, cls=JSONEncoder))
+
+
+def write_schema_file(path: Optional[Path] = None) -> Path:
+    path = path or get_schema_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "fingerprint": compute_fingerprint(),
+        "generated_at": timezone.now().isoformat(),
+        "schema": generate_schema(),
+    }
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+    tmp_path.replace(path)
+    return path
+
+
+def read_schema_file(path: Optional[Path] = None) -> Optional[dict[str, Any]]:
+    path = path or get_schema_file()
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.exception("Unreadable OpenAPI schema file", extra={"path": str(path)})
+        return None
+
+
+def is_schema_file_fresh(path: Optional[Path] = None) -> bool:
+    payload = read_schema_file(path)
+    return payload is not None and payload.get("fingerprint") == compute_fingerprint()
+
+
+def _load() -> tuple[dict[str, Any], str]:
+    fingerprint = compute_fingerprint()
+    payload = read_schema_file()
+    if payload is not None and payload.get("fingerprint") == fingerprint:
+        return payload["schema"], fingerprint
+
+    logger.warning(
+        "Precomputed OpenAPI schema missing or stale; generating in-process",
+        extra={"path": str(get_schema_file())},
+    )
+    return generate_schema(), fingerprint
+
+
+def get_rendered_schema(renderer: BaseRenderer) -> RenderedSchema:
+    """Return schema bytes for ``renderer``, rendering at most once per process."""
+    global _document, _fingerprint
+    key = renderer.media_type
+    rendered = _rendered.get(key)
+    if rendered is not None:
+        return rendered
+
+    with _lock:
+        rendered = _rendered.get(key)
+        if rendered is not None:
+            return rendered
+        if _document is None:
+            _document, _fingerprint = _load()
+        content = renderer.render(_document, renderer_context={})
+        etag = '"%s"' % hashlib.sha256(f"{_fingerprint}:{key}".encode()).hexdigest()[:40]
+        rendered = RenderedSchema(content=content, etag=etag)
+        _rendered[key] = rendered
+    return rendered
+
+
+def reset_cache() -> None:
+    global _document, _fingerprint
+    with _lock:
+        _document = None
+        _fingerprint = None
+        _rendered.clear()
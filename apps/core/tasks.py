@@ -9,3 +9,14 @@ logger = get_logger(__name__)
 def health_check(self):
     logger.info("Health check task started")
     return "ok"
+
+
+@shared_task(ignore_result=True)
+def relay_outbox():
+    """Drain the transactional outbox; scheduled by ``CELERY_BEAT_SCHEDULE`` and woken on commit."""
+    from .services import outbox_service
+
+    relayed = outbox_service.drain()
+    if relayed:
+        logger.info("Outbox messages relayed", extra={"relayed_count": relayed})
+    return relayed
@@ -0,0 +1,85 @@
+"""Checked-in SQL query-count baseline for canonical API scenarios.
+
+Tests call :meth:`QueryCountBaselineMixin.assertQueryBaseline` with a scenario
+name and a callable. The number of queries it issues is compared with
+``query_counts.json``: more queries than recorded fails the test, fewer
+passes. Run the suite with ``UPDATE_QUERY_BASELINE=1`` to rewrite the file
+after an intentional change or to lock in a reduction.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+BASELINE_FILE = Path(__file__).with_name("query_counts.json")
+
+# Savepoint bookkeeping depends on how deeply the test runner nests atomic
+# blocks, not on the code under test, so it is left out of the counts.
+_IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def _update_requested() -> bool:
+    return os.environ.get("UPDATE_QUERY_BASELINE", "").strip().lower() in {"1", "true", "yes"}
+
+
+def load_baseline() -> dict[str, int]:
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def count_queries(captured: CaptureQueriesContext) -> int:
+    return sum(
+        1
+        for query in captured.captured_queries
+        if not query["sql"].lstrip().upper().startswith(_IGNORED_PREFIXES)
+    )
+
+
+class QueryCountBaselineMixin:
+    """TestCase mixin comparing per-scenario query counts with the baseline file."""
+
+    _recorded_query_counts: dict[str, int]
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._recorded_query_counts = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        if _update_requested() and cls._recorded_query_counts:
+            baseline = load_baseline()
+            baseline.update(cls._recorded_query_counts)
+            BASELINE_FILE.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
+        super().tearDownClass()
+
+    def assertQueryBaseline(self, scenario: str, func, *args, **kwargs):
+        with CaptureQueriesContext(connection) as captured:
+            result = func(*args, **kwargs)
+        executed = count_queries(captured)
+
+        if _update_requested():
+            self._recorded_query_counts[scenario] = executed
+            return result
+
+        baseline = load_baseline()
+        if scenario not in baseline:
+            self.fail(
+                f"No query-count baseline for {scenario!r} ({executed} queries). "
+                "Re-run with UPDATE_QUERY_BASELINE=1 to record it."
+            )
+        expected = baseline[scenario]
+        if executed > expected:
+            statements = "\n".join(
+                f"  {index}. {query['sql']}"
+                for index, query in enumerate(captured.captured_queries, start=1)
+            )
+            self.fail(
+                f"{scenario!r} issued {executed} queries, baseline is {expected}.\n{statements}"
+            )
+        return result
@@ -0,0 +1,59 @@
+from django.test import SimpleTestCase, override_settings
+
+from sourceright.celery import app
+from sourceright.celery_queues import LateAckAnnotation, queue_for, worker_arguments
+
+
+class TaskRoutingTests(SimpleTestCase):
+    def test_tasks_are_routed_by_module(self):
+        self.assertEqual(queue_for("apps.notifications.tasks.send_email"), "email")
+        self.assertEqual(queue_for("apps.invoices.tasks.ingest_invoice"), "ingest")
+        self.assertEqual(queue_for("apps.core.tasks.health_check"), "maintenance")
+        self.assertEqual(
+            queue_for("apps.access_control.tasks.purge_expired_invites"), "maintenance"
+        )
+        self.assertEqual(queue_for("apps.core.tasks.relay_outbox"), "email")
+        self.assertEqual(queue_for("apps.accounts.tasks.unrouted"), "default")
+
+    def test_published_task_uses_routed_queue(self):
+        route = app.amqp.router.route({}, "apps.core.tasks.health_check")
+        self.assertEqual(route["queue"].name, "maintenance")
+
+    def test_late_acks_only_for_late_ack_queues(self):
+        annotation = LateAckAnnotation()
+
+        class FakeTask:
+            name = "apps.invoices.tasks.ingest_invoice"
+
+        self.assertEqual(
+            annotation.annotate(FakeTask), {"acks_late": True, "reject_on_worker_lost": True}
+        )
+        FakeTask.name = "apps.notifications.tasks.send_email"
+        self.assertIsNone(annotation.annotate(FakeTask))
+
+    def test_registered_maintenance_task_acks_late(self):
+        from apps.core.tasks import health_check
+
+        self.assertTrue(health_check.acks_late)
+
+
+class WorkerProfileTests(SimpleTestCase):
+    @override_settings(
+        CELERY_WORKER_PROFILES={
+            "email": {"queues": ["email"], "concurrency": 8, "prefetch_multiplier": 4}
+        }
+    )
+    def test_worker_arguments(self):
+        self.assertEqual(
+            worker_arguments("email"),
+            ["-Q", "email", "-n", "email@%h", "--concurrency", "8", "--prefetch-multiplier", "4"],
+        )
+        with self.assertRaises(ValueError):
+            worker_arguments("reports")
+
+    def test_all_profile_consumes_every_routed_queue(self):
+        from django.conf import settings
+
+        routed = {route["queue"] for route in settings.CELERY_TASK_ROUTES.values()}
+        all_queues = set(settings.CELERY_WORKER_PROFILES["all"]["queues"])
+        self.assertTrue(routed | {settings.CELERY_TASK_DEFAULT_QUEUE} <= all_queues)
@@ -0,0 +1,30 @@
+from django.test import TestCase, override_settings
+
+from benchmarks import load
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+class LoadBenchmarkTests(TestCase):
+    def test_run_reports_every_scenario_without_errors(self):
+        results = load.run(orgs=2, users_per_org=3, invites_per_org=2, iterations=4)
+
+        self.assertEqual(results["seeded_orgs"], 2)
+        self.assertEqual(set(results["scenarios"]), set(load.SCENARIOS))
+        for name, stats in results["scenarios"].items():
+            with self.subTest(scenario=name):
+                self.assertEqual(stats["requests"], 4)
+                self.assertEqual(stats["errors"], 0)
+                self.assertGreaterEqual(stats["latency_ms"]["p99"], stats["latency_ms"]["p50"])
+                self.assertGreater(stats["queries"]["max"], 0)
+
+    def test_percentile_uses_nearest_rank(self):
+        values = [float(value) for value in range(1, 101)]
+
+        self.assertEqual(load.percentile(values, 50), 50.0)
+        self.assertEqual(load.percentile(values, 99), 99.0)
+        self.assertEqual(load.percentile([], 95), 0.0)
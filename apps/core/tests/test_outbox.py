@@ -0,0 +1,203 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.services.invite_service import INVITE_EMAILS_TOPIC, invite_user
+from apps.core import tasks
+from apps.core.models import OutboxMessage
+from apps.core.services import outbox_service
+from apps.core.tests.query_baseline import count_queries
+from apps.notifications.models import EmailDelivery
+from apps.organizations.services.organization_service import create_organization
+
+
+@override_settings(
+    OUTBOX_RELAY_MODE="celery",
+    OUTBOX_RELAY_BATCH_SIZE=500,
+    OUTBOX_RELAY_MAX_BATCHES=10,
+    OUTBOX_MAX_ATTEMPTS=3,
+    OUTBOX_RETRY_BASE_SECONDS=5,
+    OUTBOX_RETRY_MAX_SECONDS=600,
+)
+class OutboxRelayTests(TestCase):
+    def setUp(self):
+        self.handled = []
+        handlers = mock.patch.dict(
+            outbox_service._handlers,
+            {
+                "test.ok": self.handled.append,
+                "test.broken": self._broken,
+                "test.picky": self._picky,
+            },
+        )
+        handlers.start()
+        self.addCleanup(handlers.stop)
+
+    def _broken(self, payloads):
+        # Writes made by a failing handler are rolled back with its savepoint.
+        OutboxMessage.objects.create(topic="test.ok", payload={"leaked": True})
+        raise RuntimeError("handler down")
+
+    def _picky(self, payloads):
+        if any(payload.get("bad") for payload in payloads):
+            raise ValueError("bad payload")
+        self.handled.append(payloads)
+
+    def test_messages_are_only_written_with_their_transaction(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                outbox_service.enqueue("test.ok", {"n": 1})
+                raise RuntimeError("rollback")
+
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_commit_wakes_the_relay_once_per_enqueue(self):
+        with mock.patch.object(tasks.relay_outbox, "delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                outbox_service.enqueue_many("test.ok", [{"n": 1}, {"n": 2}])
+                delay.assert_not_called()
+
+        delay.assert_called_once_with()
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+        self.assertEqual(self.handled, [])
+
+    def test_unpublished_wake_up_leaves_rows_for_the_schedule(self):
+        with mock.patch.object(tasks.relay_outbox, "delay", side_effect=OSError("broker down")):
+            with self.captureOnCommitCallbacks(execute=True):
+                outbox_service.enqueue("test.ok", {"n": 1})
+
+        self.assertEqual(tasks.relay_outbox(), 1)
+        self.assertEqual(self.handled, [[{"n": 1}]])
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_handler_gets_the_whole_batch_in_constant_queries(self):
+        outbox_service.enqueue_many("test.ok", ({"n": n} for n in range(200)))
+
+        with CaptureQueriesContext(connection) as captured:
+            relayed = outbox_service.relay()
+
+        self.assertEqual(relayed, 200)
+        self.assertEqual(self.handled, [[{"n": n} for n in range(200)]])
+        # Claim and delete, whatever the batch size.
+        self.assertEqual(count_queries(captured), 2)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_drain_walks_the_backlog_in_batches(self):
+        outbox_service.enqueue_many("test.ok", ({"n": n} for n in range(5)))
+
+        with self.settings(OUTBOX_RELAY_BATCH_SIZE=2):
+            self.assertEqual(outbox_service.drain(), 5)
+
+        self.assertEqual([len(batch) for batch in self.handled], [2, 2, 1])
+
+    def test_failed_topic_backs_off_without_blocking_others(self):
+        outbox_service.enqueue("test.broken", {"n": 1})
+        outbox_service.enqueue("test.ok", {"n": 2})
+        outbox_service.enqueue("test.unknown", {"n": 3})
+
+        self.assertEqual(outbox_service.relay(), 3)
+
+        self.assertEqual(self.handled, [[{"n": 2}]])
+        broken = OutboxMessage.objects.get(topic="test.broken")
+        self.assertEqual(broken.attempts, 1)
+        self.assertIn("RuntimeError: handler down", broken.last_error)
+        self.assertGreater(broken.available_at, timezone.now() + timedelta(seconds=4))
+        unknown = OutboxMessage.objects.get(topic="test.unknown")
+        self.assertIn("LookupError", unknown.last_error)
+        self.assertFalse(OutboxMessage.objects.filter(topic="test.ok").exists())
+        # Not due again yet.
+        self.assertEqual(outbox_service.relay(), 0)
+
+    def test_failed_batch_is_retried_per_message(self):
+        outbox_service.enqueue_many("test.picky", [{"n": 1}, {"n": 2, "bad": True}, {"n": 3}])
+
+        self.assertEqual(outbox_service.relay(), 3)
+
+        self.assertEqual(self.handled, [[{"n": 1}], [{"n": 3}]])
+        bad = OutboxMessage.objects.get()
+        self.assertEqual((bad.payload, bad.attempts), ({"n": 2, "bad": True}, 1))
+        self.assertIn("ValueError: bad payload", bad.last_error)
+
+    def test_message_fails_after_max_attempts(self):
+        outbox_service.enqueue("test.broken", {"n": 1, "token": "secret"})
+
+        for _ in range(3):
+            OutboxMessage.objects.update(available_at=timezone.now())
+            outbox_service.relay()
+
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.attempts, 3)
+        self.assertIsNotNone(message.failed_at)
+        # Dead letters do not keep payloads without a registered redactor.
+        self.assertEqual(message.payload, {})
+        OutboxMessage.objects.update(available_at=timezone.now())
+        self.assertEqual(outbox_service.relay(), 0)
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_DELIVERY_MODE="sync",
+    OUTBOX_RELAY_MODE="celery",
+)
+class InviteOutboxTests(TestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.admin, name="Org One", country="US", base_currency="USD"
+        )
+
+    def test_invite_email_is_sent_by_the_relay_not_the_request(self):
+        with mock.patch.object(tasks.relay_outbox, "delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                for index in range(3):
+                    invite_user(
+                        org=self.org,
+                        email=f"invitee{index}@example.com",
+                        role=RoleType.VIEWER,
+                        invited_by=self.admin,
+                    )
+
+        self.assertEqual(delay.call_count, 3)
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(OutboxMessage.objects.count(), 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(outbox_service.drain(), 3)
+
+        self.assertFalse(OutboxMessage.objects.exists())
+        self.assertEqual(EmailDelivery.objects.count(), 3)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            [f"invitee{index}@example.com" for index in range(3)],
+        )
+
+    @override_settings(OUTBOX_MAX_ATTEMPTS=1)
+    def test_dead_lettered_invite_email_drops_its_token(self):
+        invite = invite_user(
+            org=self.org, email="invitee@example.com", role=RoleType.VIEWER, invited_by=self.admin
+        )
+        broken = mock.Mock(side_effect=RuntimeError("renderer down"))
+        with mock.patch.dict(outbox_service._handlers, {INVITE_EMAILS_TOPIC: broken}):
+            self.assertEqual(outbox_service.relay(), 1)
+
+        message = OutboxMessage.objects.get()
+        self.assertIsNotNone(message.failed_at)
+        self.assertEqual(
+            message.payload, {"org_name": "Org One", "invites": ["invitee@example.com"]}
+        )
+        self.assertNotIn(invite.token, str(message.payload))
@@ -0,0 +1,207 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import UserRole
+from apps.access_control.services.invite_service import invite_user
+from apps.accounts.services.auth_token_service import issue_token
+from apps.organizations.services.organization_service import create_organization
+
+from . import query_baseline
+from .query_baseline import QueryCountBaselineMixin
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class EndpointQueryCountTests(QueryCountBaselineMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.password = "pass1234"
+        self.admin = self._create_user("admin", RoleType.ORG_ADMIN)
+        self.org = create_organization(
+            creator=self.admin, name="SourceRight", country="US", base_currency="USD"
+        )
+        self.vendor = self._create_user("vendor", RoleType.VENDOR)
+        UserRole.objects.create(user=self.vendor, org=self.org, role=RoleType.VENDOR)
+        for index in range(5):
+            member = self._create_user(f"member{index}", RoleType.VIEWER)
+            UserRole.objects.create(user=member, org=self.org, role=RoleType.VIEWER)
+
+    def _create_user(self, username, role):
+        return get_user_model().objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            password=self.password,
+            primary_role=role,
+        )
+
+    def _auth_headers(self, user, role):
+        token = issue_token(user_id=user.id, org_id=self.org.org_id, role=role)
+        return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    def _request(self, method, url, data=None, *, expected_status, **headers):
+        response = getattr(self.client, method)(url, data, format="json", **headers)
+        self.assertEqual(response.status_code, expected_status, response.content)
+        return response
+
+    def test_login(self):
+        self.assertQueryBaseline(
+            "accounts.login",
+            self._request,
+            "post",
+            "/api/accounts/login",
+            {"username": "admin", "password": self.password},
+            expected_status=200,
+        )
+
+    def test_register_with_org(self):
+        self.assertQueryBaseline(
+            "accounts.register",
+            self._request,
+            "post",
+            "/api/accounts/register",
+            {
+                "username": "finance",
+                "email": "finance@example.com",
+                "password": "SecurePass123!",
+                "role": RoleType.FINANCE,
+                "org_id": self.org.org_id,
+            },
+            expected_status=201,
+        )
+
+    def test_create_organization(self):
+        self.assertQueryBaseline(
+            "organizations.create",
+            self._request,
+            "post",
+            "/api/organizations",
+            {
+                "name": "Acme",
+                "country": "US",
+                "base_currency": "USD",
+                "created_by_id": self.admin.id,
+            },
+            expected_status=201,
+        )
+
+    def test_dashboard_me(self):
+        self.assertQueryBaseline(
+            "dashboard.me",
+            self._request,
+            "get",
+            "/api/dashboard/me",
+            expected_status=200,
+            **self._auth_headers(self.admin, RoleType.ORG_ADMIN),
+        )
+
+    def test_organization_users(self):
+        self.assertQueryBaseline(
+            "organizations.users",
+            self._request,
+            "get",
+            "/api/organizations/users",
+            expected_status=200,
+            **self._auth_headers(self.admin, RoleType.ORG_ADMIN),
+        )
+
+    def test_organization_settings(self):
+        self.assertQueryBaseline(
+            "organizations.settings",
+            self._request,
+            "get",
+            "/api/organizations/settings",
+            expected_status=200,
+            **self._auth_headers(self.admin, RoleType.ORG_ADMIN),
+        )
+
+    def test_invite_user(self):
+        self.assertQueryBaseline(
+            "organizations.invite",
+            self._request,
+            "post",
+            "/api/organizations/invites",
+            {"email": "invitee@example.com", "role": RoleType.VIEWER},
+            expected_status=201,
+            **self._auth_headers(self.admin, RoleType.ORG_ADMIN),
+        )
+
+    def test_list_invites(self):
+        for index in range(3):
+            invite_user(
+                org=self.org,
+                email=f"invitee{index}@example.com",
+                role=RoleType.VIEWER,
+                invited_by=self.admin,
+            )
+
+        self.assertQueryBaseline(
+            "organizations.invites_list",
+            self._request,
+            "get",
+            "/api/organizations/invites?status=INVITED",
+            expected_status=200,
+            **self._auth_headers(self.admin, RoleType.ORG_ADMIN),
+        )
+
+    def test_accept_invite(self):
+        invite = invite_user(
+            org=self.org, email="invitee@example.com", role=RoleType.VIEWER, invited_by=self.admin
+        )
+
+        self.assertQueryBaseline(
+            "organizations.accept_invite",
+            self._request,
+            "post",
+            "/api/organizations/invites/accept",
+            {"token": invite.token, "password": "SecurePass123!"},
+            expected_status=200,
+        )
+
+    def test_invoice_upload(self):
+        self.assertQueryBaseline(
+            "invoices.upload",
+            self._request,
+            "post",
+            "/api/vendor/invoices/upload",
+            {"invoice_id": "inv-001", "amount": 1200},
+            expected_status=201,
+            **self._auth_headers(self.vendor, RoleType.VENDOR),
+        )
+
+    def test_list_invoices(self):
+        self.assertQueryBaseline(
+            "invoices.list",
+            self._request,
+            "get",
+            "/api/internal/invoices",
+            expected_status=200,
+            **self._auth_headers(self.admin, RoleType.ORG_ADMIN),
+        )
+
+    def test_create_vendor(self):
+        self.assertQueryBaseline(
+            "vendors.create",
+            self._request,
+            "post",
+            "/api/internal/vendors",
+            {"name": "Acme"},
+            expected_status=201,
+            **self._auth_headers(self.admin, RoleType.ORG_ADMIN),
+        )
+
+    @mock.patch.dict("os.environ", {"UPDATE_QUERY_BASELINE": ""})
+    def test_guard_fails_when_queries_exceed_baseline(self):
+        with mock.patch.object(query_baseline, "load_baseline", return_value={"probe": 0}):
+            with self.assertRaises(AssertionError):
+                self.assertQueryBaseline("probe", get_user_model().objects.count)
@@ -0,0 +1,86 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from apps.core.services import schema_service
+
+
+class PrecomputedSchemaTests(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.schema_file = Path(self.tmpdir.name) / "openapi-schema.json"
+        override = override_settings(OPENAPI_SCHEMA_FILE=str(self.schema_file))
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(self.tmpdir.cleanup)
+        schema_service.reset_cache()
+        self.addCleanup(schema_service.reset_cache)
+
+    def test_build_command_writes_fresh_schema(self):
+        call_command("build_openapi_schema", stdout=StringIO())
+
+        payload = json.loads(self.schema_file.read_text())
+        self.assertEqual(payload["fingerprint"], schema_service.compute_fingerprint())
+        self.assertIn("/api/dashboard/me", payload["schema"]["paths"])
+        call_command("build_openapi_schema", "--check", stdout=StringIO())
+
+    def test_fingerprint_covers_sources_of_field_types_and_shapes(self):
+        modules = schema_service._schema_modules()
+
+        for name in (
+            "apps.access_control.domain.enums",
+            "apps.organizations.models",
+            "apps.organizations.pagination",
+        ):
+            self.assertIn(name, modules)
+
+    def test_invite_listing_declares_cursor_envelope(self):
+        schema = schema_service.generate_schema()
+
+        response = schema["paths"]["/api/organizations/invites"]["get"]["responses"]["200"]
+        ref = response["content"]["application/json"]["schema"]["$ref"]
+        page = schema["components"]["schemas"][ref.rsplit("/", 1)[-1]]
+        self.assertEqual(set(page["properties"]), {"next", "previous", "results"})
+        self.assertEqual(page["properties"]["results"]["type"], "array")
+
+    def test_check_fails_for_stale_schema(self):
+        self.schema_file.write_text(json.dumps({"fingerprint": "old", "schema": {}}))
+
+        with self.assertRaises(CommandError):
+            call_command("build_openapi_schema", "--check", stdout=StringIO())
+
+    def test_view_serves_precomputed_schema_without_regenerating(self):
+        call_command("build_openapi_schema", stdout=StringIO())
+
+        with mock.patch.object(schema_service, "generate_schema") as generate:
+            response = self.client.get("/api/schema/?format=json")
+            second = self.client.get("/api/schema/?format=json")
+
+        generate.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/vnd.oai.openapi+json")
+        self.assertIn("/api/dashboard/me", json.loads(response.content)["paths"])
+        self.assertEqual(second.content, response.content)
+
+    def test_matching_etag_returns_not_modified(self):
+        first = self.client.get("/api/schema/")
+
+        response = self.client.get("/api/schema/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], first["ETag"])
+
+    def test_stale_schema_file_is_regenerated_in_process(self):
+        self.schema_file.write_text(
+            json.dumps({"fingerprint": "old", "schema": {"openapi": "3.0.3", "paths": {}}})
+        )
+
+        response = self.client.get("/api/schema/?format=json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("/api/dashboard/me", json.loads(response.content)["paths"])
@@ -0,0 +1,51 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Count
+from django.test import TestCase
+
+from apps.access_control.models import OrganizationInvite, UserRole
+from apps.organizations.models import Organization
+from benchmarks import synthetic
+
+
+class SyntheticDataTests(TestCase):
+    def _dataset(self, **overrides):
+        config = synthetic.SyntheticConfig(orgs=10, users=400, seed=3, **overrides)
+        return synthetic.SyntheticDataset(config, first_user_id=1000, password_hash="x")
+
+    def test_same_seed_replays_identical_rows(self):
+        first, second = self._dataset(), self._dataset()
+
+        self.assertEqual(list(first.users()), list(second.users()))
+        self.assertEqual(list(first.memberships()), list(second.memberships()))
+        self.assertEqual(list(first.invites()), list(second.invites()))
+        self.assertNotEqual(
+            list(first.memberships()), list(self._dataset(skew=0.0).memberships())
+        )
+
+    def test_memberships_match_primary_roles_and_are_skewed(self):
+        dataset = self._dataset(multi_org_ratio=0.0)
+        roles = {row[0]: row[8] for row in dataset.users()}
+        sizes = {}
+        for user_id, org_id, role, _ in dataset.memberships():
+            self.assertEqual(role, roles[user_id])
+            sizes[org_id] = sizes.get(org_id, 0) + 1
+
+        self.assertGreater(sizes[dataset.org_ids[0]], 5 * sizes[dataset.org_ids[-1]])
+
+    def test_generate_loads_all_tables(self):
+        result = synthetic.generate(
+            synthetic.SyntheticConfig(orgs=5, users=60, invites_per_org=3, batch_size=25)
+        )
+
+        self.assertEqual(get_user_model().objects.count(), 60)
+        self.assertEqual(Organization.objects.count(), 5)
+        self.assertEqual(UserRole.objects.count(), result["tables"]["user_roles"]["rows"])
+        self.assertEqual(
+            OrganizationInvite.objects.count(), result["tables"]["organization_invites"]["rows"]
+        )
+        self.assertFalse(
+            UserRole.objects.values("user", "org").annotate(n=Count("id")).filter(n__gt=1).exists()
+        )
+        creator = get_user_model().objects.get(id=result["first_user_id"])
+        self.assertEqual(creator.primary_role, "ORG_ADMIN")
+        self.assertTrue(creator.check_password(synthetic.SyntheticConfig().password))
@@ -6,7 +6,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
 
-from .serializers import MeOrganizationSerializer, MeResponseSerializer, MeUserSerializer
+from shared.http import etag_matches
+from shared.serialization import compile_serializer
+
+from .serializers import MeResponseSerializer
+from .services import me_cache
 
 
 @extend_schema(
@@ -14,9 +18,10 @@ from .serializers import MeOrganizationSerializer, MeResponseSerializer, MeUserS
     description=(
         "Returns the authenticated user and their current organization. "
         "Call after login to hydrate Redux/store. "
-        "Organization and role are null when using a setup token (e.g. before creating an org)."
+        "Organization and role are null when using a setup token (e.g. before creating an org). "
+        "Responses carry an ETag; send it back in If-None-Match to get a 304 when nothing changed."
     ),
-    responses={200: MeResponseSerializer},
+    responses={200: MeResponseSerializer, 304: None},
 )
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
@@ -25,14 +30,29 @@ def me_view(request):
     user = request.user
     organization = getattr(request, "organization", None)
     role = getattr(request, "organization_role", None)
+    org_id = organization.org_id if organization else None
+
+    headers = {"Cache-Control": "private, no-cache"}
+    # Without versions (cache unreachable) the response is rendered uncached
+    # and carries no ETag.
+    versions = me_cache.get_versions(user_id=user.id, org_id=org_id)
+    payload = None
+    if versions is not None:
+        etag = me_cache.build_etag(user_id=user.id, org_id=org_id, role=role, versions=versions)
+        headers["ETag"] = etag
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        payload = me_cache.get_body(user_id=user.id, org_id=org_id, versions=versions)
 
-    user_data = MeUserSerializer(user).data
-    org_data = MeOrganizationSerializer(organization).data if organization else None
+    if payload is None:
+        payload = compile_serializer(MeResponseSerializer).to_representation(
+            {
+                "user": user,
+                "organization": organization,
+                "role": role,
+            }
+        )
+        if versions is not None:
+            me_cache.set_body(user_id=user.id, org_id=org_id, versions=versions, body=payload)
 
-    payload = {
-        "user": user_data,
-        "organization": org_data,
-        "role": role,
-    }
-    serializer = MeResponseSerializer(payload)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    return Response(payload, status=status.HTTP_200_OK, headers=headers)
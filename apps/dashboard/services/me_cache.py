@@ -0,0 +1,137 @@
+"""Per-(user, org) response cache for GET /api/dashboard/me.
+
+Cached bodies are keyed by version counters instead of being deleted on
+change: bumping the user or org version makes every older body unreachable,
+and the same versions double as the response ETag so revalidation needs no
+serializer work at all.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+_USER_VERSION_KEY = "dashboard:me:user:{user_id}:version"
+_ORG_VERSION_KEY = "dashboard:me:org:{org_id}:version"
+_BODY_KEY = "dashboard:me:body:{user_id}:{org_id}:{user_version}:{org_version}"
+_NO_ORG = "-"
+
+
+def _body_timeout() -> int:
+    return int(getattr(settings, "ME_CACHE_TIMEOUT_SECONDS", 300))
+
+
+def _fresh_version() -> int:
+    # Seed versions from the clock so an evicted counter never restarts at a
+    # value that an older cached body was stored under.
+    return time.time_ns()
+
+
+def _user_version_key(user_id: int) -> str:
+    return _USER_VERSION_KEY.format(user_id=user_id)
+
+
+def _org_version_key(org_id: str) -> str:
+    return _ORG_VERSION_KEY.format(org_id=org_id)
+
+
+def _bump(key: str) -> None:
+    """Best-effort: a cache outage must not fail the write that triggered it.
+
+    A missed bump leaves bodies stale for at most ``ME_CACHE_TIMEOUT_SECONDS``.
+    """
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _fresh_version(), timeout=None)
+    except Exception:
+        logger.warning("Failed to bump /me cache version", exc_info=True, extra={"cache_key": key})
+
+
+def get_versions(*, user_id: int, org_id: Optional[str]) -> Optional[tuple[int, int]]:
+    """Return (user_version, org_version), initialising missing counters.
+
+    ``None`` when the cache is unreachable; callers then render uncached.
+    """
+    keys = [_user_version_key(user_id)]
+    if org_id:
+        keys.append(_org_version_key(org_id))
+
+    try:
+        values = cache.get_many(keys)
+        missing = [key for key in keys if key not in values]
+        for key in missing:
+            cache.add(key, _fresh_version(), timeout=None)
+        if missing:
+            values.update(cache.get_many(missing))
+    except Exception:
+        logger.warning("/me cache unavailable", exc_info=True)
+        return None
+
+    user_version = values.get(keys[0], 0)
+    org_version = values.get(keys[1], 0) if org_id else 0
+    return user_version, org_version
+
+
+def build_etag(
+    *, user_id: int, org_id: Optional[str], role: Optional[str], versions: tuple[int, int]
+) -> str:
+    raw = f"{user_id}:{org_id or _NO_ORG}:{role or _NO_ORG}:{versions[0]}:{versions[1]}"
+    return '"%s"' % hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _body_key(*, user_id: int, org_id: Optional[str], versions: tuple[int, int]) -> str:
+    return _BODY_KEY.format(
+        user_id=user_id,
+        org_id=org_id or _NO_ORG,
+        user_version=versions[0],
+        org_version=versions[1],
+    )
+
+
+def get_body(
+    *, user_id: int, org_id: Optional[str], versions: tuple[int, int]
+) -> Optional[dict[str, Any]]:
+    try:
+        return cache.get(_body_key(user_id=user_id, org_id=org_id, versions=versions))
+    except Exception:
+        logger.warning("/me cache unavailable", exc_info=True)
+        return None
+
+
+def set_body(
+    *, user_id: int, org_id: Optional[str], versions: tuple[int, int], body: dict[str, Any]
+) -> None:
+    try:
+        cache.set(
+            _body_key(user_id=user_id, org_id=org_id, versions=versions),
+            body,
+            timeout=_body_timeout(),
+        )
+    except Exception:
+        logger.warning("/me cache unavailable", exc_info=True)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Invalidate /me bodies for a user (profile or membership changes).
+
+    The bump waits for the transaction to commit; bumping earlier would let a
+    concurrent reader cache the pre-commit body under the new version.
+    """
+    key = _user_version_key(user_id)
+    transaction.on_commit(lambda: _bump(key))
+
+
+def invalidate_org(org_id: str) -> None:
+    """Invalidate /me bodies for every member of an organization, after commit."""
+    key = _org_version_key(org_id)
+    transaction.on_commit(lambda: _bump(key))
@@ -0,0 +1,36 @@
+"""Invalidate cached /me responses when the data they render changes."""
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.access_control.models import UserRole
+from apps.organizations.models import Organization
+
+from .services import me_cache
+
+# Saves that only touch these fields do not change the /me payload.
+_IGNORED_USER_FIELDS = frozenset({"last_login", "password"})
+
+
+@receiver(post_save, sender=get_user_model(), dispatch_uid="dashboard_me_user_saved")
+def invalidate_me_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields and set(update_fields) <= _IGNORED_USER_FIELDS:
+        return
+    me_cache.invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=Organization, dispatch_uid="dashboard_me_org_saved")
+def invalidate_me_on_org_save(sender, instance, created, **kwargs):
+    if created:
+        return
+    me_cache.invalidate_org(instance.pk)
+
+
+@receiver(post_save, sender=UserRole, dispatch_uid="dashboard_me_role_saved")
+@receiver(post_delete, sender=UserRole, dispatch_uid="dashboard_me_role_deleted")
+def invalidate_me_on_role_change(sender, instance, **kwargs):
+    me_cache.invalidate_user(instance.user_id)
@@ -0,0 +1,150 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.repositories.user_role_repository import UserRoleRepository
+from apps.accounts.services.auth_token_service import issue_token
+from apps.organizations.services.organization_service import create_organization
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD", "INR"],
+    ALLOWED_COUNTRIES=["US", "IN"],
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class MeResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = "/api/dashboard/me"
+        self.user = get_user_model().objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.user, name="Org One", country="US", base_currency="USD"
+        )
+
+    def _auth_headers(self, role=RoleType.ORG_ADMIN):
+        token = issue_token(user_id=self.user.id, org_id=self.org.org_id, role=role)
+        return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.client.get(self.url, **self._auth_headers())
+        self.assertEqual(first.status_code, 200)
+
+        with mock.patch("apps.dashboard.api.compile_serializer") as compile_serializer:
+            second = self.client.get(self.url, **self._auth_headers())
+
+        compile_serializer.assert_not_called()
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_matching_etag_returns_not_modified(self):
+        first = self.client.get(self.url, **self._auth_headers())
+
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=first["ETag"], **self._auth_headers()
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], first["ETag"])
+
+    def test_profile_change_invalidates_cache(self):
+        first = self.client.get(self.url, **self._auth_headers())
+
+        self.user.first_name = "Ada"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save(update_fields=["first_name"])
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=first["ETag"], **self._auth_headers()
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(response.json()["user"]["first_name"], "Ada")
+
+    def test_last_login_update_keeps_cache(self):
+        first = self.client.get(self.url, **self._auth_headers())
+
+        self.user.save(update_fields=["last_login"])
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=first["ETag"], **self._auth_headers()
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_org_settings_change_invalidates_cache(self):
+        first = self.client.get(self.url, **self._auth_headers())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                "/api/organizations/settings",
+                {"base_currency": "INR"},
+                format="json",
+                **self._auth_headers(),
+            )
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=first["ETag"], **self._auth_headers()
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["organization"]["base_currency"], "INR")
+
+    def test_role_change_invalidates_cache(self):
+        first = self.client.get(self.url, **self._auth_headers())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserRoleRepository.assign_role(user=self.user, org=self.org, role=RoleType.FINANCE)
+        response = self.client.get(
+            self.url,
+            HTTP_IF_NONE_MATCH=first["ETag"],
+            **self._auth_headers(role=RoleType.FINANCE),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["role"], RoleType.FINANCE)
+
+    def test_invalidation_waits_for_commit(self):
+        first = self.client.get(self.url, **self._auth_headers())
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.user.first_name = "Ada"
+            self.user.save(update_fields=["first_name"])
+            # Uncommitted: readers keep the old version and body.
+            before_commit = self.client.get(
+                self.url, HTTP_IF_NONE_MATCH=first["ETag"], **self._auth_headers()
+            )
+        self.assertEqual(before_commit.status_code, 304)
+
+        for callback in callbacks:
+            callback()
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=first["ETag"], **self._auth_headers()
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_cache_outage_does_not_fail_writes(self):
+        with mock.patch.object(cache, "incr", side_effect=ConnectionError("redis down")):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.user.first_name = "Ada"
+                self.user.save(update_fields=["first_name"])
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, "Ada")
+
+    def test_cache_outage_serves_uncached_response(self):
+        with mock.patch.object(cache, "get_many", side_effect=ConnectionError("redis down")):
+            response = self.client.get(self.url, **self._auth_headers())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+        self.assertEqual(response.json()["user"]["id"], self.user.id)
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0001_email_deliveries"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emaildelivery",
+            index=models.Index(
+                condition=models.Q(("status__in", ["SENT", "FAILED"])),
+                fields=["created_at"],
+                name="idx_email_deliveries_final",
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+
+from .domain.enums import DeliveryStatus
+
+
+class EmailDelivery(models.Model):
+    """One message to one recipient, with its delivery state.
+
+    Rows are written by ``email_service.send_email`` and moved through
+    ``PENDING -> SENDING -> SENT | FAILED`` by ``email_service.deliver``. While
+    ``SENDING``, ``next_attempt_at`` is the claim's lease expiry. Bodies are
+    blanked once a row is final, and final rows are purged after
+    ``EMAIL_DELIVERY_RETENTION_DAYS``.
+    """
+
+    recipient = models.EmailField()
+    from_email = models.CharField(max_length=254)
+    subject = models.CharField(max_length=998)
+    body = models.TextField()
+    html_body = models.TextField(blank=True, default="")
+    status = models.CharField(
+        max_length=20,
+        choices=DeliveryStatus.choices,
+        default=DeliveryStatus.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "email_deliveries"
+        indexes = [
+            # Sweep scans (see ``tasks.deliver_due_emails``) only touch these rows.
+            models.Index(
+                fields=["next_attempt_at"],
+                name="idx_email_deliveries_due",
+                condition=models.Q(
+                    status__in=[DeliveryStatus.PENDING, DeliveryStatus.SENDING]
+                ),
+            ),
+            # Retention purges (see ``tasks.purge_email_deliveries``).
+            models.Index(
+                fields=["created_at"],
+                name="idx_email_deliveries_final",
+                condition=models.Q(status__in=[DeliveryStatus.SENT, DeliveryStatus.FAILED]),
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - convenience only
+        return f"{self.recipient} ({self.status})"
+
+    @property
+    def domain(self) -> str:
+        return self.recipient.rpartition("@")[2].lower()
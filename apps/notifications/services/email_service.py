@@ -1,13 +1,329 @@
 from __future__ import annotations
 
-from typing import Iterable
+import smtplib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Mapping, Optional, Sequence
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
 
+from shared.logging import get_logger
+from shared.ratelimit import get_backend, parse_rate
 
-def send_email(*, subject: str, message: str, recipients: Iterable[str], from_email: str | None = None) -> int:
-    resolved_from = from_email or getattr(
-        settings, "DEFAULT_FROM_EMAIL", "noreply@sourceright.local"
+from ..domain.enums import DeliveryStatus
+from ..models import EmailDelivery
+from . import template_registry
+
+logger = get_logger(__name__)
+
+DELIVERY_MODES = ("celery", "sync")
+STATE_FIELDS = ("status", "attempts", "last_error", "next_attempt_at", "sent_at")
+FINAL_STATUSES = (DeliveryStatus.SENT, DeliveryStatus.FAILED)
+
+
+@dataclass
+class DeliveryReport:
+    sent: list[int] = field(default_factory=list)
+    failed: list[int] = field(default_factory=list)
+    # Still PENDING after this run: failed attempts awaiting retry and
+    # deliveries deferred by a domain rate limit.
+    retrying: list[int] = field(default_factory=list)
+    retry_at: Optional[datetime] = None
+
+    def add_retry(self, delivery: EmailDelivery) -> None:
+        self.retrying.append(delivery.id)
+        if self.retry_at is None or delivery.next_attempt_at < self.retry_at:
+            self.retry_at = delivery.next_attempt_at
+
+
+def _resolve_from(from_email: str | None) -> str:
+    return from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@sourceright.local")
+
+
+def _queue(deliveries: list[EmailDelivery]) -> list[EmailDelivery]:
+    deliveries = EmailDelivery.objects.bulk_create(deliveries)
+    ids = [delivery.id for delivery in deliveries]
+    if ids:
+        transaction.on_commit(lambda: dispatch(ids))
+    return deliveries
+
+
+def send_email(
+    *,
+    subject: str,
+    message: str,
+    recipients: Iterable[str],
+    from_email: str | None = None,
+    html_message: str | None = None,
+) -> list[EmailDelivery]:
+    """Record one delivery per recipient and dispatch them once the transaction commits.
+
+    Nothing is sent in the caller's thread unless ``EMAIL_DELIVERY_MODE`` is
+    ``"sync"``; delivery state is tracked on the returned rows.
+    """
+    resolved_from = _resolve_from(from_email)
+    return _queue(
+        [
+            EmailDelivery(
+                recipient=recipient,
+                from_email=resolved_from,
+                subject=subject,
+                body=message,
+                html_body=html_message or "",
+            )
+            for recipient in dict.fromkeys(recipients)
+        ]
+    )
+
+
+def send_templated_emails(
+    *,
+    template: str,
+    recipients: Iterable[tuple[str, Mapping[str, Any]]],
+    shared_context: Mapping[str, Any] | None = None,
+    from_email: str | None = None,
+) -> list[EmailDelivery]:
+    """Render ``template`` per ``(recipient, context)`` and queue it like ``send_email``.
+
+    The compiled template and ``shared_context`` are reused across the whole
+    fan-out (see ``template_registry``), and all rows go out in one insert.
+    """
+    recipients = list(recipients)
+    rendered = template_registry.get(template).render_many(
+        (context for _, context in recipients), shared_context
+    )
+    resolved_from = _resolve_from(from_email)
+    return _queue(
+        [
+            EmailDelivery(
+                recipient=recipient,
+                from_email=resolved_from,
+                subject=email.subject,
+                body=email.text,
+                html_body=email.html,
+            )
+            for (recipient, _), email in zip(recipients, rendered)
+        ]
+    )
+
+
+def dispatch(delivery_ids: Sequence[int]) -> None:
+    """Hand deliveries to the email queue in ``EMAIL_DELIVERY_BATCH_SIZE`` chunks.
+
+    A failed publish is only logged: the rows stay ``PENDING`` and the
+    ``deliver_due_emails`` sweep sends them.
+    """
+    from ..tasks import deliver_emails
+
+    mode = getattr(settings, "EMAIL_DELIVERY_MODE", "celery")
+    if mode not in DELIVERY_MODES:
+        raise ValueError(f"Unknown EMAIL_DELIVERY_MODE {mode!r}.")
+    batch_size = settings.EMAIL_DELIVERY_BATCH_SIZE
+    for start in range(0, len(delivery_ids), batch_size):
+        chunk = list(delivery_ids[start:start + batch_size])
+        if mode == "sync":
+            deliver(chunk)
+            continue
+        try:
+            deliver_emails.delay(chunk)
+        except Exception:
+            logger.warning(
+                "Email delivery task not published; left for the sweep",
+                exc_info=True,
+                extra={"delivery_count": len(chunk)},
+            )
+
+
+def claim(
+    delivery_ids: Sequence[int] | None = None, *, limit: int | None = None
+) -> list[EmailDelivery]:
+    """Lease due deliveries to this worker and return them.
+
+    Claimed rows move to ``SENDING`` with ``next_attempt_at`` set to the end
+    of the lease, so a worker that dies mid-batch only delays them. Rows
+    locked by another claim are skipped rather than waited on.
+    """
+    now = timezone.now()
+    due = EmailDelivery.objects.filter(
+        status__in=[DeliveryStatus.PENDING, DeliveryStatus.SENDING],
+        next_attempt_at__lte=now,
+    )
+    if delivery_ids is not None:
+        due = due.filter(id__in=delivery_ids)
+    with transaction.atomic():
+        rows = due.select_for_update(skip_locked=True).order_by("next_attempt_at", "id")
+        deliveries = list(rows[: limit or settings.EMAIL_DELIVERY_BATCH_SIZE])
+        if not deliveries:
+            return []
+        lease_until = now + timedelta(seconds=settings.EMAIL_DELIVERY_LEASE_SECONDS)
+        EmailDelivery.objects.filter(id__in=[delivery.id for delivery in deliveries]).update(
+            status=DeliveryStatus.SENDING, next_attempt_at=lease_until
+        )
+    for delivery in deliveries:
+        delivery.status = DeliveryStatus.SENDING
+        delivery.next_attempt_at = lease_until
+    return deliveries
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after the ``attempts``-th failure."""
+    seconds = settings.EMAIL_RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1)
+    return timedelta(seconds=min(seconds, settings.EMAIL_RETRY_MAX_SECONDS))
+
+
+def _domain_rate(domain: str):
+    limits = getattr(settings, "EMAIL_DOMAIN_RATE_LIMITS", {})
+    value = limits.get(domain) or limits.get("*")
+    return parse_rate(value) if value else None
+
+
+def _domain_retry_after(domain: str) -> Optional[timedelta]:
+    """Take one token from the domain's bucket; the wait if it is empty.
+
+    The limiter fails open, as the API limiter does: losing Redis should
+    slow nothing down.
+    """
+    rate = _domain_rate(domain)
+    if rate is None:
+        return None
+    try:
+        result = get_backend().consume(f"email:domain:{domain}", rate)
+    except Exception:
+        logger.warning("Email rate limiter unavailable", exc_info=True, extra={"domain": domain})
+        return None
+    if result.allowed:
+        return None
+    return timedelta(milliseconds=result.retry_after_ms)
+
+
+def _build_message(delivery: EmailDelivery, connection) -> EmailMultiAlternatives:
+    message = EmailMultiAlternatives(
+        subject=delivery.subject,
+        body=delivery.body,
+        from_email=delivery.from_email,
+        to=[delivery.recipient],
+        connection=connection,
+    )
+    if delivery.html_body:
+        message.attach_alternative(delivery.html_body, "text/html")
+    return message
+
+
+def _reset(connection) -> None:
+    try:
+        connection.close()
+    except Exception:
+        logger.debug("Email connection close failed", exc_info=True)
+
+
+def _is_permanent(exc: Exception) -> bool:
+    # A 5xx for the recipient will not change on retry; other errors (including
+    # a misconfigured sender or credentials) are retried until attempts run out.
+    return isinstance(exc, smtplib.SMTPRecipientsRefused) and all(
+        code >= 500 for code, _ in exc.recipients.values()
+    )
+
+
+def deliver(
+    delivery_ids: Sequence[int] | None = None, *, limit: int | None = None
+) -> DeliveryReport:
+    """Claim due deliveries and send them over a single backend connection.
+
+    Each message goes through ``send_messages`` on the held connection, so the
+    SMTP session is reused across the batch while every delivery keeps its
+    own outcome. Failures are retried with exponential backoff until
+    ``EMAIL_DELIVERY_MAX_ATTEMPTS``; a permanent SMTP rejection fails at once.
+    Deliveries over their domain's rate are put back without using an attempt.
+
+    Bodies are blanked once a delivery is final (sent or failed): rendered
+    messages can carry secrets such as invite tokens, which must not outlive
+    the send. Final rows are removed by ``purge_deliveries``.
+    """
+    report = DeliveryReport()
+    deliveries = claim(delivery_ids, limit=limit)
+    if not deliveries:
+        return report
+
+    throttled: dict[str, datetime] = {}
+    connection = get_connection(fail_silently=False)
+    try:
+        for delivery in deliveries:
+            now = timezone.now()
+            domain = delivery.domain
+            if domain not in throttled:
+                wait = _domain_retry_after(domain)
+                if wait is not None:
+                    throttled[domain] = now + wait
+            if domain in throttled:
+                delivery.status = DeliveryStatus.PENDING
+                delivery.next_attempt_at = throttled[domain]
+                report.add_retry(delivery)
+                continue
+
+            delivery.attempts += 1
+            try:
+                connection.open()
+                connection.send_messages([_build_message(delivery, connection)])
+            except Exception as exc:
+                delivery.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+                exhausted = delivery.attempts >= settings.EMAIL_DELIVERY_MAX_ATTEMPTS
+                if exhausted or _is_permanent(exc):
+                    delivery.status = DeliveryStatus.FAILED
+                    report.failed.append(delivery.id)
+                else:
+                    delivery.status = DeliveryStatus.PENDING
+                    delivery.next_attempt_at = now + retry_delay(delivery.attempts)
+                    report.add_retry(delivery)
+                if not isinstance(exc, smtplib.SMTPRecipientsRefused):
+                    # The session may be unusable; the next message reconnects.
+                    _reset(connection)
+            else:
+                delivery.status = DeliveryStatus.SENT
+                delivery.sent_at = now
+                delivery.last_error = ""
+                report.sent.append(delivery.id)
+    finally:
+        _reset(connection)
+        EmailDelivery.objects.bulk_update(deliveries, STATE_FIELDS)
+        finished = report.sent + report.failed
+        if finished:
+            EmailDelivery.objects.filter(id__in=finished).update(body="", html_body="")
+
+    if report.failed:
+        logger.warning(
+            "Email deliveries failed",
+            extra={"failed_count": len(report.failed), "delivery_ids": report.failed},
+        )
+    return report
+
+
+def purge_deliveries(
+    *,
+    now=None,
+    batch_size: int | None = None,
+    max_batches: int = 100,
+) -> int:
+    """Delete sent and failed deliveries older than ``EMAIL_DELIVERY_RETENTION_DAYS``.
+
+    Same batching as ``invite_service.purge_expired_invites``: bounded per run,
+    the next run picks up the remainder.
+    """
+    now = now or timezone.now()
+    batch_size = batch_size or settings.EMAIL_DELIVERY_PURGE_BATCH_SIZE
+    retention = timedelta(days=settings.EMAIL_DELIVERY_RETENTION_DAYS)
+    queryset = EmailDelivery.objects.filter(
+        status__in=FINAL_STATUSES, created_at__lte=now - retention
     )
-    return send_mail(subject, message, resolved_from, list(recipients))
+    purged = 0
+    for _ in range(max_batches):
+        ids = list(queryset.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        deleted, _ = EmailDelivery.objects.filter(id__in=ids).delete()
+        purged += deleted
+        if len(ids) < batch_size:
+            break
+    return purged
@@ -0,0 +1,104 @@
+"""Notification templates, compiled once per process.
+
+A notification named ``<name>`` is a directory ``notifications/<name>/`` on
+the template path holding ``subject.txt``, ``body.txt`` and, optionally,
+``body.html``. The first ``get(name)`` parses all three; later calls reuse the
+compiled nodes. Plain-text parts render without autoescaping.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import Context, Template, TemplateDoesNotExist, engines
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    subject: str
+    text: str
+    html: str
+
+
+@dataclass(frozen=True)
+class NotificationTemplate:
+    name: str
+    subject: Template
+    text: Template
+    html: Optional[Template]
+
+    def render_many(
+        self,
+        contexts: Iterable[Mapping[str, Any]],
+        shared: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[RenderedEmail]:
+        """Render once per item of ``contexts``, layered over ``shared``.
+
+        The shared context is built once and each item is pushed onto it for
+        its render and popped after, so a fan-out costs one dict push per
+        message rather than a parse or a context copy.
+        """
+        plain = Context(dict(shared or {}), autoescape=False)
+        markup = Context(dict(shared or {}))
+        for context in contexts:
+            with plain.push(context):
+                # Header-safe: template newlines must not reach the Subject.
+                subject = " ".join(self.subject.render(plain).split())
+                text = self.text.render(plain)
+            html = ""
+            if self.html is not None:
+                with markup.push(context):
+                    html = self.html.render(markup)
+            yield RenderedEmail(subject=subject, text=text, html=html)
+
+    def render(
+        self, context: Mapping[str, Any], shared: Optional[Mapping[str, Any]] = None
+    ) -> RenderedEmail:
+        return next(self.render_many([context], shared))
+
+
+_templates: dict[str, NotificationTemplate] = {}
+_lock = threading.Lock()
+
+
+def _compile(name: str) -> NotificationTemplate:
+    engine = engines["django"].engine
+
+    def load(part: str, required: bool = True) -> Optional[Template]:
+        try:
+            return engine.get_template(f"notifications/{name}/{part}")
+        except TemplateDoesNotExist:
+            if required:
+                raise
+            return None
+
+    return NotificationTemplate(
+        name=name,
+        subject=load("subject.txt"),
+        text=load("body.txt"),
+        html=load("body.html", required=False),
+    )
+
+
+def get(name: str) -> NotificationTemplate:
+    template = _templates.get(name)
+    if template is None:
+        with _lock:
+            template = _templates.get(name)
+            if template is None:
+                template = _templates[name] = _compile(name)
+    return template
+
+
+def clear() -> None:
+    with _lock:
+        _templates.clear()
+
+
+@receiver(setting_changed)
+def _clear_on_template_settings_change(*, setting, **kwargs) -> None:
+    if setting == "TEMPLATES":
+        clear()
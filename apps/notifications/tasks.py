@@ -0,0 +1,44 @@
+from celery import shared_task
+from django.conf import settings
+
+from shared.logging import get_logger
+
+from .services import email_service
+
+logger = get_logger(__name__)
+
+# Upper bound on batches per sweep so one run cannot monopolise a worker.
+SWEEP_MAX_BATCHES = 50
+
+
+@shared_task(ignore_result=True)
+def deliver_emails(delivery_ids):
+    """Send one batch over a single connection; re-queue its retries for when they are due."""
+    report = email_service.deliver(delivery_ids)
+    if report.retrying:
+        deliver_emails.apply_async((report.retrying,), eta=report.retry_at)
+    return {"sent": len(report.sent), "failed": len(report.failed)}
+
+
+@shared_task(ignore_result=True)
+def deliver_due_emails():
+    """Scheduled by ``CELERY_BEAT_SCHEDULE``; sends whatever is due, including expired leases."""
+    sent = failed = 0
+    for _ in range(SWEEP_MAX_BATCHES):
+        report = email_service.deliver(limit=settings.EMAIL_DELIVERY_BATCH_SIZE)
+        sent += len(report.sent)
+        failed += len(report.failed)
+        if len(report.sent) + len(report.failed) + len(report.retrying) == 0:
+            break
+    if sent or failed:
+        logger.info("Due emails delivered", extra={"sent_count": sent, "failed_count": failed})
+    return {"sent": sent, "failed": failed}
+
+
+@shared_task(ignore_result=True)
+def purge_email_deliveries():
+    """Scheduled by ``CELERY_BEAT_SCHEDULE``; drops final deliveries past retention."""
+    purged = email_service.purge_deliveries()
+    if purged:
+        logger.info("Email deliveries purged", extra={"purged_count": purged})
+    return purged
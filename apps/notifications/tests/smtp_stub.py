@@ -0,0 +1,83 @@
+"""Minimal in-process SMTP server for delivery tests.
+
+Speaks just enough SMTP for ``smtplib`` (no extensions, no TLS), counts
+connections and records accepted messages. Recipients in ``reject`` get a 550.
+"""
+from __future__ import annotations
+
+import socketserver
+import threading
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self._reply("220 stub ESMTP")
+        recipients: list[str] = []
+        data: list[bytes] | None = None
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            if data is not None:
+                if line.rstrip(b"\r\n") == b".":
+                    with server.lock:
+                        server.messages.append((recipients, b"".join(data)))
+                    recipients, data = [], None
+                    self._reply("250 OK")
+                else:
+                    data.append(line)
+                continue
+            command = line.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO", "NOOP", "RSET"):
+                recipients = [] if verb == "RSET" else recipients
+                self._reply("250 stub")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip().strip("<>")
+                if address in server.reject:
+                    self._reply("550 No such user")
+                else:
+                    recipients.append(address)
+                    self._reply("250 OK")
+            elif verb == "DATA":
+                data = []
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class SMTPStub(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, reject: tuple[str, ...] = ()) -> None:
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages: list[tuple[list[str], bytes]] = []
+        self.reject = set(reject)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self) -> "SMTPStub":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,226 @@
+import smtplib
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend as LocmemBackend
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.notifications import tasks
+from apps.notifications.domain.enums import DeliveryStatus
+from apps.notifications.models import EmailDelivery
+from apps.notifications.services import email_service
+from shared.ratelimit import InMemoryTokenBucketBackend, set_backend
+
+from .smtp_stub import SMTPStub
+
+
+class DisconnectingBackend(LocmemBackend):
+    def send_messages(self, messages):
+        raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_DELIVERY_MODE="sync",
+    EMAIL_DELIVERY_BATCH_SIZE=100,
+    EMAIL_DELIVERY_MAX_ATTEMPTS=3,
+    EMAIL_RETRY_BASE_SECONDS=30,
+    EMAIL_RETRY_MAX_SECONDS=3600,
+    EMAIL_DOMAIN_RATE_LIMITS={},
+    DEFAULT_FROM_EMAIL="noreply@sourceright.local",
+)
+class EmailDeliveryTests(TestCase):
+    def _send(self, *recipients, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            deliveries = email_service.send_email(
+                subject="Hello", message="Body", recipients=recipients, **kwargs
+            )
+        return EmailDelivery.objects.filter(id__in=[delivery.id for delivery in deliveries])
+
+    def test_sync_mode_sends_and_records_state(self):
+        deliveries = self._send("a@example.com", "b@example.com", "a@example.com")
+
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox), ["a@example.com", "b@example.com"]
+        )
+        self.assertEqual(
+            set(deliveries.values_list("status", "attempts")), {(DeliveryStatus.SENT, 1)}
+        )
+        self.assertTrue(all(delivery.sent_at for delivery in deliveries))
+        # Bodies may carry secrets (invite tokens); they do not outlive the send.
+        self.assertEqual(set(deliveries.values_list("body", "html_body")), {("", "")})
+
+    def test_html_body_is_sent_as_alternative(self):
+        self._send("a@example.com", html_message="<p>Body</p>")
+
+        self.assertEqual(mail.outbox[0].alternatives, [("<p>Body</p>", "text/html")])
+
+    @override_settings(EMAIL_DELIVERY_MODE="celery", EMAIL_DELIVERY_BATCH_SIZE=2)
+    def test_celery_mode_publishes_one_task_per_batch_after_commit(self):
+        with mock.patch.object(tasks.deliver_emails, "delay") as delay:
+            with self.captureOnCommitCallbacks() as callbacks:
+                deliveries = email_service.send_email(
+                    subject="Hello",
+                    message="Body",
+                    recipients=["a@example.com", "b@example.com", "c@example.com"],
+                )
+            delay.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        ids = [delivery.id for delivery in deliveries]
+        self.assertEqual([call.args[0] for call in delay.call_args_list], [ids[:2], ids[2:]])
+        self.assertEqual(mail.outbox, [])
+        self.assertFalse(EmailDelivery.objects.exclude(status=DeliveryStatus.PENDING).exists())
+
+    @override_settings(EMAIL_DELIVERY_MODE="celery")
+    def test_unpublished_deliveries_are_sent_by_the_sweep(self):
+        with mock.patch.object(tasks.deliver_emails, "delay", side_effect=OSError("broker down")):
+            deliveries = self._send("a@example.com")
+
+        self.assertEqual(deliveries.get().status, DeliveryStatus.PENDING)
+        self.assertEqual(tasks.deliver_due_emails(), {"sent": 1, "failed": 0})
+        self.assertEqual(deliveries.get().status, DeliveryStatus.SENT)
+
+    @override_settings(EMAIL_BACKEND=f"{__name__}.DisconnectingBackend")
+    def test_failures_back_off_exponentially_then_fail(self):
+        delivery = self._send("a@example.com").get()
+        self.assertEqual(delivery.status, DeliveryStatus.PENDING)
+        self.assertEqual(delivery.attempts, 1)
+        self.assertIn("SMTPServerDisconnected", delivery.last_error)
+        first_delay = delivery.next_attempt_at - timezone.now()
+        self.assertTrue(timedelta(seconds=25) < first_delay <= timedelta(seconds=30))
+
+        # Not due yet.
+        self.assertEqual(email_service.deliver([delivery.id]).retrying, [])
+
+        EmailDelivery.objects.filter(id=delivery.id).update(next_attempt_at=timezone.now())
+        report = email_service.deliver([delivery.id])
+        delivery.refresh_from_db()
+        self.assertEqual(report.retrying, [delivery.id])
+        self.assertEqual(delivery.attempts, 2)
+        self.assertGreater(delivery.next_attempt_at - timezone.now(), timedelta(seconds=55))
+
+        EmailDelivery.objects.filter(id=delivery.id).update(next_attempt_at=timezone.now())
+        report = email_service.deliver([delivery.id])
+        delivery.refresh_from_db()
+        self.assertEqual(report.failed, [delivery.id])
+        self.assertEqual((delivery.status, delivery.attempts), (DeliveryStatus.FAILED, 3))
+        self.assertEqual(delivery.body, "")
+
+    @override_settings(EMAIL_BACKEND=f"{__name__}.DisconnectingBackend")
+    def test_pending_retries_keep_their_body(self):
+        delivery = self._send("a@example.com").get()
+
+        self.assertEqual(delivery.status, DeliveryStatus.PENDING)
+        self.assertEqual(delivery.body, "Body")
+
+    @override_settings(EMAIL_DELIVERY_RETENTION_DAYS=30)
+    def test_purge_removes_only_old_final_deliveries(self):
+        def delivery(status, age_days):
+            row = EmailDelivery.objects.create(
+                recipient="a@example.com",
+                from_email="noreply@sourceright.local",
+                subject="Hello",
+                body="",
+                status=status,
+            )
+            EmailDelivery.objects.filter(id=row.id).update(
+                created_at=timezone.now() - timedelta(days=age_days)
+            )
+            return row.id
+
+        old_sent = delivery(DeliveryStatus.SENT, 31)
+        old_failed = delivery(DeliveryStatus.FAILED, 31)
+        recent_sent = delivery(DeliveryStatus.SENT, 1)
+        old_pending = delivery(DeliveryStatus.PENDING, 31)
+
+        self.assertEqual(tasks.purge_email_deliveries(), 2)
+        self.assertEqual(
+            set(EmailDelivery.objects.values_list("id", flat=True)), {recent_sent, old_pending}
+        )
+        self.assertFalse(EmailDelivery.objects.filter(id__in=[old_sent, old_failed]).exists())
+
+    def test_retry_delay_is_capped(self):
+        with self.settings(EMAIL_RETRY_MAX_SECONDS=100):
+            self.assertEqual(email_service.retry_delay(1), timedelta(seconds=30))
+            self.assertEqual(email_service.retry_delay(2), timedelta(seconds=60))
+            self.assertEqual(email_service.retry_delay(3), timedelta(seconds=100))
+
+    def test_domain_rate_limit_defers_without_using_an_attempt(self):
+        set_backend(InMemoryTokenBucketBackend())
+        self.addCleanup(set_backend, None)
+
+        with self.settings(EMAIL_DOMAIN_RATE_LIMITS={"example.com": "2/m", "*": "100/m"}):
+            deliveries = self._send(
+                "a@example.com", "b@example.com", "c@example.com", "d@other.example"
+            )
+
+        deferred = deliveries.get(status=DeliveryStatus.PENDING)
+        self.assertEqual(deferred.recipient, "c@example.com")
+        self.assertEqual(deferred.attempts, 0)
+        self.assertGreater(deferred.next_attempt_at, timezone.now())
+        self.assertEqual(deliveries.filter(status=DeliveryStatus.SENT).count(), 3)
+
+    def test_sweep_reclaims_expired_leases(self):
+        delivery = EmailDelivery.objects.create(
+            recipient="a@example.com",
+            from_email="noreply@sourceright.local",
+            subject="Hello",
+            body="Body",
+            status=DeliveryStatus.SENDING,
+            next_attempt_at=timezone.now() - timedelta(seconds=1),
+        )
+        leased = EmailDelivery.objects.create(
+            recipient="b@example.com",
+            from_email="noreply@sourceright.local",
+            subject="Hello",
+            body="Body",
+            status=DeliveryStatus.SENDING,
+            next_attempt_at=timezone.now() + timedelta(minutes=5),
+        )
+
+        self.assertEqual(tasks.deliver_due_emails(), {"sent": 1, "failed": 0})
+        delivery.refresh_from_db()
+        leased.refresh_from_db()
+        self.assertEqual(delivery.status, DeliveryStatus.SENT)
+        self.assertEqual(leased.status, DeliveryStatus.SENDING)
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+    EMAIL_HOST="127.0.0.1",
+    EMAIL_USE_TLS=False,
+    EMAIL_HOST_USER="",
+    EMAIL_HOST_PASSWORD="",
+    EMAIL_DELIVERY_MODE="sync",
+    EMAIL_DELIVERY_MAX_ATTEMPTS=3,
+    EMAIL_DOMAIN_RATE_LIMITS={},
+)
+class SMTPDeliveryTests(TestCase):
+    def _send(self, stub, recipients):
+        with self.settings(EMAIL_PORT=stub.port):
+            with self.captureOnCommitCallbacks(execute=True):
+                email_service.send_email(subject="Hello", message="Body", recipients=recipients)
+
+    def test_batch_reuses_one_connection(self):
+        recipients = [f"user{index}@example.com" for index in range(5)]
+        with SMTPStub() as stub:
+            self._send(stub, recipients)
+
+        self.assertEqual(stub.connections, 1)
+        self.assertEqual([message[0] for message in stub.messages], [[r] for r in recipients])
+        self.assertEqual(EmailDelivery.objects.filter(status=DeliveryStatus.SENT).count(), 5)
+
+    def test_rejected_recipient_fails_without_breaking_the_batch(self):
+        with SMTPStub(reject=("bad@example.com",)) as stub:
+            self._send(stub, ["a@example.com", "bad@example.com", "b@example.com"])
+
+        self.assertEqual(stub.connections, 1)
+        self.assertEqual(len(stub.messages), 2)
+        rejected = EmailDelivery.objects.get(recipient="bad@example.com")
+        self.assertEqual((rejected.status, rejected.attempts), (DeliveryStatus.FAILED, 1))
+        self.assertIn("SMTPRecipientsRefused", rejected.last_error)
+        self.assertEqual(EmailDelivery.objects.filter(status=DeliveryStatus.SENT).count(), 2)
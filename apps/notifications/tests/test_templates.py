@@ -0,0 +1,103 @@
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.core import mail
+from django.template import Engine
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.access_control.services import invite_service
+from apps.notifications.models import EmailDelivery
+from apps.notifications.services import email_service, template_registry
+
+TEST_TEMPLATES = [
+    {
+        **settings.TEMPLATES[0],
+        "DIRS": [Path(__file__).resolve().parent / "templates"],
+    }
+]
+
+
+@override_settings(TEMPLATES=TEST_TEMPLATES)
+class TemplateRegistryTests(SimpleTestCase):
+    def setUp(self):
+        template_registry.clear()
+
+    def test_templates_compile_once_per_process(self):
+        original = Engine.get_template
+        with mock.patch.object(Engine, "get_template", autospec=True, side_effect=original) as load:
+            template = template_registry.get("plain_only")
+            rendered = list(
+                template_registry.get("plain_only").render_many(
+                    ({"name": f"user{index}"} for index in range(1000)), {"team": "Ops"}
+                )
+            )
+
+        self.assertIs(template_registry.get("plain_only"), template)
+        # subject.txt, body.txt and the missing body.html.
+        self.assertEqual(load.call_count, 3)
+        self.assertEqual(len(rendered), 1000)
+        self.assertEqual(rendered[999].text, "Hi user999 & Ops\n")
+
+    def test_plain_parts_are_not_escaped_and_subject_is_one_line(self):
+        rendered = template_registry.get("plain_only").render({"name": "<Ann>"}, {"team": "R&D"})
+
+        self.assertEqual(rendered.subject, "Hello <Ann>")
+        self.assertEqual(rendered.text, "Hi <Ann> & R&D\n")
+        self.assertEqual(rendered.html, "")
+
+    def test_per_message_context_does_not_leak(self):
+        rendered = list(
+            template_registry.get("plain_only").render_many(
+                [{"name": "Ann", "team": "Sales"}, {"name": "Bob"}], {"team": "Ops"}
+            )
+        )
+
+        self.assertEqual(
+            [email.text for email in rendered], ["Hi Ann & Sales\n", "Hi Bob & Ops\n"]
+        )
+
+    def test_html_part_is_autoescaped(self):
+        rendered = template_registry.get("organization_invite").render(
+            {"token": "t<1>", "link": None}, {"org_name": "A & B"}
+        )
+
+        self.assertEqual(rendered.subject, "You're invited to A & B")
+        self.assertIn("accept: t<1>", rendered.text)
+        self.assertIn("<strong>A &amp; B</strong>", rendered.html)
+        self.assertIn("<code>t&lt;1&gt;</code>", rendered.html)
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_DELIVERY_MODE="sync",
+    EMAIL_DOMAIN_RATE_LIMITS={},
+    INVITE_ACCEPT_URL_BASE="https://app.example.com/invites/accept",
+)
+class TemplatedEmailTests(TestCase):
+    def test_invite_fan_out_renders_each_recipient(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invite_service.send_invite_emails(
+                org_name="Acme",
+                invites=[(f"user{index}@example.com", f"token{index}") for index in range(3)],
+            )
+
+        self.assertEqual(EmailDelivery.objects.count(), 3)
+        self.assertEqual(len(mail.outbox), 3)
+        for index, message in enumerate(sorted(mail.outbox, key=lambda m: m.to[0])):
+            link = f"https://app.example.com/invites/accept/?token=token{index}"
+            self.assertEqual(message.subject, "You're invited to Acme")
+            self.assertIn(f"Accept your invite here: {link}", message.body)
+            self.assertIn(f'<a href="{link}">', message.alternatives[0][0])
+
+    def test_send_templated_emails_queues_one_row_per_recipient(self):
+        deliveries = email_service.send_templated_emails(
+            template="organization_invite",
+            recipients=[("a@example.com", {"token": "x"}), ("b@example.com", {"token": "y"})],
+            shared_context={"org_name": "Acme"},
+        )
+
+        self.assertEqual(
+            [delivery.recipient for delivery in deliveries], ["a@example.com", "b@example.com"]
+        )
+        self.assertIn("accept: y", deliveries[1].body)
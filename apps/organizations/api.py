@@ -1,21 +1,30 @@
+import io
+import json
+
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction, IntegrityError
+from django.http import HttpResponse
 
 from shared.logging import get_logger
+from shared.serialization import compile_serializer
 
-from apps.access_control.domain.enums import RoleType
+from apps.access_control.domain.enums import InviteStatus, RoleType
 from apps.accounts.models import UserStatus
 from apps.access_control.serializers import (
     OrganizationInviteAcceptSerializer,
     OrganizationInviteCreateSerializer,
+    OrganizationInviteListSerializer,
+    OrganizationInvitePageSerializer,
     OrganizationInviteResponseSerializer,
 )
+from apps.access_control.repositories.invite_repository import OrganizationInviteRepository
 from apps.access_control.services.invite_service import accept_invite, invite_user
 from apps.access_control.models import UserRole
 
@@ -25,14 +34,41 @@ from .serializers import (
     OrganizationResponseSerializer,
     OrganizationSettingsSerializer,
     OrganizationSettingsUpdateSerializer,
+    OrganizationUserBulkStatusResponseSerializer,
+    OrganizationUserBulkStatusSerializer,
     OrganizationUserSerializer,
+    ProvisionedUserRowSerializer,
 )
+from .pagination import InviteCursorPagination
 from .services.organization_service import create_organization
-from .utils import build_user_payload, get_user_role, is_last_active_admin, require_org_admin
+from .services.provisioning_service import parse_lines, provision_users
+from .services.user_status_service import set_users_active
+from .utils import build_user_payload, is_last_active_admin, require_org_admin
 
 logger = get_logger(__name__)
 User = get_user_model()
 
+# OrganizationUserSerializer field -> UserRole.values() key.
+ORGANIZATION_USER_ROW_SOURCES = {
+    "id": "user_id",
+    "username": "user__username",
+    "email": "user__email",
+    "first_name": "user__first_name",
+    "last_name": "user__last_name",
+    "is_active": "user__is_active",
+    "role": "role",
+}
+# OrganizationInviteListSerializer fields, fetched with .values() and nothing more.
+INVITE_LIST_FIELDS = (
+    "id",
+    "email",
+    "role",
+    "status",
+    "invited_at",
+    "expires_at",
+    "accepted_at",
+)
+
 
 @extend_schema(
     summary="Create organization",
@@ -136,15 +172,8 @@ def organization_settings_view(request):
 
     organization = request.organization
     if request.method == "GET":
-        serializer = OrganizationSettingsSerializer(
-            {
-                "org_id": organization.org_id,
-                "base_currency": organization.base_currency,
-                "country": organization.country,
-                "timezone": organization.timezone,
-            }
-        )
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data = compile_serializer(OrganizationSettingsSerializer).to_representation(organization)
+        return Response(data, status=status.HTTP_200_OK)
 
     guard = require_org_admin(request)
     if guard:
@@ -157,15 +186,8 @@ def organization_settings_view(request):
         setattr(organization, field, value)
     organization.save(update_fields=list(serializer.validated_data.keys()))
 
-    response_serializer = OrganizationSettingsSerializer(
-        {
-            "org_id": organization.org_id,
-            "base_currency": organization.base_currency,
-            "country": organization.country,
-            "timezone": organization.timezone,
-        }
-    )
-    return Response(response_serializer.data, status=status.HTTP_200_OK)
+    data = compile_serializer(OrganizationSettingsSerializer).to_representation(organization)
+    return Response(data, status=status.HTTP_200_OK)
 
 
 @extend_schema(
@@ -181,25 +203,102 @@ def list_organization_users_view(request):
     if guard:
         return guard
 
-    roles_qs = (
-        UserRole.objects.filter(org_id=request.organization.org_id)
-        .select_related("user")
-        .order_by("user_id", "role")
+    # uniq_user_org guarantees one membership row per user, so rows can be
+    # paginated in the database and projected without loading User models.
+    rows = (
+        UserRole.scoped.order_by("user_id")
+        .values(*ORGANIZATION_USER_ROW_SOURCES.values())
     )
 
-    user_map = {}
-    for membership in roles_qs:
-        user = membership.user
-        if user.id in user_map:
-            continue
-        user_map[user.id] = build_user_payload(user, membership.role)
+    paginator = PageNumberPagination()
+    page = paginator.paginate_queryset(rows, request)
+    serializer = compile_serializer(
+        OrganizationUserSerializer, sources=ORGANIZATION_USER_ROW_SOURCES
+    )
+    return paginator.get_paginated_response(serializer.many(page))
 
-    users = list(user_map.values())
 
-    paginator = PageNumberPagination()
-    page = paginator.paginate_queryset(users, request)
-    serializer = OrganizationUserSerializer(page, many=True)
-    return paginator.get_paginated_response(serializer.data)
+@extend_schema(
+    summary="Bulk provision organization users",
+    description=(
+        "Create users in the current organization from NDJSON, one JSON object per line "
+        "(email, role, and optional username, first_name, last_name, password). Users "
+        "without a password get an invite. Returns one NDJSON result per line, in line "
+        "order, then a summary line (admin-only)."
+    ),
+    request={"application/x-ndjson": ProvisionedUserRowSerializer},
+    responses={200: None},
+)
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def provision_organization_users_view(request):
+    """Bulk-create users in the current organization from NDJSON."""
+    guard = require_org_admin(request)
+    if guard:
+        return guard
+
+    # Read the raw stream: request.body is capped at DATA_UPLOAD_MAX_MEMORY_SIZE.
+    # The body is buffered so the row limit can be answered before any user is
+    # written; byte and line caps bound that buffer.
+    max_rows = getattr(settings, "PROVISIONING_MAX_ROWS", 10_000)
+    max_bytes = getattr(settings, "PROVISIONING_MAX_BYTES", 16 * 1024 * 1024)
+    max_line_bytes = getattr(settings, "PROVISIONING_MAX_LINE_BYTES", 4096)
+    too_large = Response(
+        {"detail": f"Provisioning requests are limited to {max_bytes} bytes."},
+        status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    )
+    try:
+        content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > max_bytes:
+        return too_large
+
+    lines = []
+    row_count = 0
+    bytes_read = 0
+    # Room for the line plus its CRLF; anything longer is cut off and rejected.
+    body = request.stream or io.BytesIO()
+    while line := body.readline(max_line_bytes + 2):
+        bytes_read += len(line)
+        if bytes_read > max_bytes:
+            return too_large
+        if len(line.rstrip(b"\r\n")) > max_line_bytes:
+            return Response(
+                {"detail": f"Line {len(lines) + 1} is longer than {max_line_bytes} bytes."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        lines.append(line)
+        if line.strip():
+            row_count += 1
+            if row_count > max_rows:
+                return Response(
+                    {"detail": f"At most {max_rows} users can be provisioned per request."},
+                    status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                )
+    if not row_count:
+        return Response({"detail": "No users to provision."}, status=status.HTTP_400_BAD_REQUEST)
+
+    # Provision everything before responding, so a failure surfaces as error
+    # rows (or a 500) instead of a truncated 200 mid-stream.
+    organization = request.organization
+    results = sorted(
+        provision_users(org=organization, invited_by=request.user, rows=parse_lines(lines)),
+        key=lambda result: result["line"],
+    )
+    counts = {"created": 0, "error": 0}
+    for result in results:
+        counts[result["status"]] += 1
+    logger.info(
+        "Organization users provisioned",
+        extra={
+            "org_id": organization.org_id,
+            "users_created": counts["created"],
+            "rows_failed": counts["error"],
+        },
+    )
+    body = "".join(json.dumps(result) + "\n" for result in [*results, {"summary": counts}])
+    return HttpResponse(body, content_type="application/x-ndjson")
 
 
 @extend_schema(
@@ -216,7 +315,7 @@ def deactivate_organization_user_view(request, user_id: int):
         return guard
 
     membership = (
-        UserRole.objects.filter(org_id=request.organization.org_id, user_id=user_id)
+        UserRole.scoped.filter(user_id=user_id)
         .select_related("user")
         .first()
     )
@@ -224,19 +323,21 @@ def deactivate_organization_user_view(request, user_id: int):
         return Response({"detail": "User not found in organization."}, status=404)
 
     user = membership.user
-    if user.id == request.user.id and is_last_active_admin(request.organization.org_id, user.id):
-        return Response(
-            {"detail": "Cannot deactivate the last active organization admin."},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    if user.is_active or user.status != UserStatus.INACTIVE:
-        user.is_active = False
-        user.status = UserStatus.INACTIVE
-        user.save(update_fields=["is_active", "status"])
-
-    role = get_user_role(request.organization.org_id, user.id)
-    serializer = OrganizationUserSerializer(build_user_payload(user, role))
+    with transaction.atomic():
+        if user.id == request.user.id and is_last_active_admin(
+            request.organization.org_id, membership
+        ):
+            return Response(
+                {"detail": "Cannot deactivate the last active organization admin."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if user.is_active or user.status != UserStatus.INACTIVE:
+            user.is_active = False
+            user.status = UserStatus.INACTIVE
+            user.save(update_fields=["is_active", "status"])
+
+    serializer = OrganizationUserSerializer(build_user_payload(user, membership.role))
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -254,7 +355,7 @@ def reactivate_organization_user_view(request, user_id: int):
         return guard
 
     membership = (
-        UserRole.objects.filter(org_id=request.organization.org_id, user_id=user_id)
+        UserRole.scoped.filter(user_id=user_id)
         .select_related("user")
         .first()
     )
@@ -267,20 +368,96 @@ def reactivate_organization_user_view(request, user_id: int):
         user.status = UserStatus.ACTIVE
         user.save(update_fields=["is_active", "status"])
 
-    role = get_user_role(request.organization.org_id, user.id)
-    serializer = OrganizationUserSerializer(build_user_payload(user, role))
+    serializer = OrganizationUserSerializer(build_user_payload(user, membership.role))
     return Response(serializer.data, status=status.HTTP_200_OK)
 
+
+def _set_organization_users_active(request, *, active: bool):
+    guard = require_org_admin(request)
+    if guard:
+        return guard
+
+    serializer = OrganizationUserBulkStatusSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    org_id = request.organization.org_id
+    try:
+        rows = set_users_active(
+            org_id=org_id, user_ids=serializer.validated_data["user_ids"], active=active
+        )
+    except ValueError as exc:
+        return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+    logger.info(
+        "Organization users reactivated" if active else "Organization users deactivated",
+        extra={"org_id": org_id, "user_count": len(rows)},
+    )
+    results = compile_serializer(
+        OrganizationUserSerializer, sources=ORGANIZATION_USER_ROW_SOURCES
+    ).many(rows)
+    return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    operation_id="api_organizations_users_bulk_deactivate",
+    summary="Bulk deactivate organization users",
+    description=(
+        "Deactivate up to 1000 users of the current organization at once. Fails without "
+        "changes if any id is not a member or no active admin would remain (admin-only)."
+    ),
+    request=OrganizationUserBulkStatusSerializer,
+    responses={200: OrganizationUserBulkStatusResponseSerializer},
+)
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def bulk_deactivate_organization_users_view(request):
+    """Deactivate several users in the current organization."""
+    return _set_organization_users_active(request, active=False)
+
+
+@extend_schema(
+    operation_id="api_organizations_users_bulk_reactivate",
+    summary="Bulk reactivate organization users",
+    description=(
+        "Reactivate up to 1000 users of the current organization at once. Fails without "
+        "changes if any id is not a member (admin-only)."
+    ),
+    request=OrganizationUserBulkStatusSerializer,
+    responses={200: OrganizationUserBulkStatusResponseSerializer},
+)
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def bulk_reactivate_organization_users_view(request):
+    """Reactivate several users in the current organization."""
+    return _set_organization_users_active(request, active=True)
+
+
 @extend_schema(
+    methods=["GET"],
+    summary="List organization invites",
+    description=(
+        "List the current organization's invites, newest first, with cursor pagination "
+        "(page_size up to 200). Filter with status=INVITED|ACTIVE (admin-only)."
+    ),
+    parameters=[
+        OpenApiParameter("status", str, enum=InviteStatus.values, required=False),
+        OpenApiParameter("page_size", int, required=False),
+    ],
+    responses={200: OrganizationInvitePageSerializer},
+)
+@extend_schema(
+    methods=["POST"],
     summary="Invite organization user",
     description="Invite a user to the current organization (admin-only).",
     request=OrganizationInviteCreateSerializer,
     responses={201: OrganizationInviteResponseSerializer},
 )
-@api_view(["POST"])
+@api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def invite_user_view(request):
-    """Invite a user to the current organization."""
+    """List invites of, or invite a user to, the current organization."""
+    if request.method == "GET":
+        return _list_invites(request)
+
     if getattr(request, "organization", None) is None:
         return Response(
             {"detail": "Organization context is required."},
@@ -314,6 +491,28 @@ def invite_user_view(request):
     return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
 
+def _list_invites(request):
+    guard = require_org_admin(request)
+    if guard:
+        return guard
+
+    invite_status = request.query_params.get("status")
+    if invite_status is not None and invite_status not in InviteStatus.values:
+        return Response(
+            {"status": [f"Must be one of: {', '.join(InviteStatus.values)}."]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    serializer = compile_serializer(OrganizationInviteListSerializer)
+    rows = OrganizationInviteRepository.list_for_current_org(
+        status=invite_status,
+        fields=INVITE_LIST_FIELDS,
+    )
+    paginator = InviteCursorPagination()
+    page = paginator.paginate_queryset(rows, request)
+    return paginator.get_paginated_response(serializer.many(page))
+
+
 @extend_schema(
     summary="Accept organization invite",
     description="Accept an organization invite using the invite token.",
@@ -0,0 +1,9 @@
+"""Invalidation-bus scope names for data cached from this app (see ``shared.invalidation``)."""
+
+
+def org_scope(org_id: str) -> str:
+    return f"org:{org_id}"
+
+
+def membership_scope(user_id: int, org_id: str) -> str:
+    return f"membership:{user_id}:{org_id}"
@@ -4,10 +4,13 @@ from typing import Iterable
 
 from django.conf import settings
 from django.http import JsonResponse
-from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.exceptions import AuthenticationFailed, PermissionDenied
+
+from shared.logging.context import reset_tenant_id, set_tenant_id
 
 from apps.access_control.domain.enums import RoleType
 from apps.accounts.authentication import OrgTokenAuthentication
+from apps.organizations.tenancy import reset_current_org_id, set_current_org_id
 
 SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
 
@@ -33,6 +36,21 @@ def _is_exempt(path: str, exemptions: Iterable[str]) -> bool:
     return False
 
 
+def _token_org_id(request) -> str | None:
+    """``org_id`` claim of a valid bearer token, without loading the user."""
+    token_auth = OrgTokenAuthentication()
+    header = token_auth.get_header(request)
+    if header is None:
+        return None
+    try:
+        raw_token = token_auth.get_raw_token(header)
+        if raw_token is None:
+            return None
+        return token_auth.get_validated_token(raw_token).get("org_id") or None
+    except AuthenticationFailed:
+        return None
+
+
 class OrganizationContextMiddleware:
     """Enforce org context for API requests to prevent cross-tenant access."""
 
@@ -41,13 +59,15 @@ class OrganizationContextMiddleware:
 
     def __call__(self, request):
         if not self._should_enforce(request):
-            return self.get_response(request)
+            return self._call_unenforced(request)
 
         token_auth = OrgTokenAuthentication()
         try:
             auth_result = token_auth.authenticate(request)
         except AuthenticationFailed as exc:
             return JsonResponse({"detail": str(exc.detail)}, status=401)
+        except PermissionDenied as exc:
+            return JsonResponse({"detail": str(exc.detail)}, status=403)
         if not auth_result:
             return JsonResponse(
                 {"detail": "Authentication credentials were not provided."},
@@ -73,7 +93,29 @@ class OrganizationContextMiddleware:
                 status=403,
             )
 
-        return self.get_response(request)
+        org_id = request.organization.org_id
+        request.tenant_id = org_id
+        tenant_token = set_tenant_id(org_id)
+        org_token = set_current_org_id(org_id)
+        try:
+            return self.get_response(request)
+        finally:
+            reset_current_org_id(org_token)
+            reset_tenant_id(tenant_token)
+
+    def _call_unenforced(self, request):
+        # Nothing is enforced here, but a presented org token still attributes
+        # log lines and per-tenant metrics. Scoped queries stay unbound: the
+        # membership behind the claim has not been checked.
+        org_id = _token_org_id(request)
+        if org_id is None:
+            return self.get_response(request)
+        request.tenant_id = org_id
+        tenant_token = set_tenant_id(org_id)
+        try:
+            return self.get_response(request)
+        finally:
+            reset_tenant_id(tenant_token)
 
     def _should_enforce(self, request) -> bool:
         path = request.path
@@ -3,13 +3,20 @@ from __future__ import annotations
 from django.conf import settings
 from django.db import models
 
+from shared.invalidation import get_bus
+
+from .cache_scopes import org_scope
 from .domain.enums import OrganizationStatus
 from .domain.identifiers import generate_org_id
 
 
 class OrganizationQuerySet(models.QuerySet):
     def delete(self):  # pragma: no cover - used for safety
-        return self.update(status=OrganizationStatus.DELETED)
+        # update() sends no post_save, so invalidate cached org context explicitly.
+        org_ids = list(self.values_list("org_id", flat=True))
+        updated = self.update(status=OrganizationStatus.DELETED)
+        get_bus().invalidate(*(org_scope(org_id) for org_id in org_ids))
+        return updated
 
 
 class Organization(models.Model):
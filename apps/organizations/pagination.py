@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination
+
+
+class InviteCursorPagination(CursorPagination):
+    """Keyset pages over an org's invites, newest first.
+
+    The cursor encodes the last ``invited_at`` seen, so every page is an
+    index range scan on ``(org, [status,] -invited_at, -id)`` however deep it is.
+    """
+
+    ordering = ("-invited_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
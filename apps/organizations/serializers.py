@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from django.contrib.auth import get_user_model
+from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 
+from apps.access_control.domain.enums import RoleType
+
 from .models import Organization
 from .validation import (
     get_allowed_countries,
@@ -14,6 +18,8 @@ from .validation import (
     validate_in_allowed,
 )
 
+User = get_user_model()
+
 
 class OrganizationCreateSerializer(serializers.Serializer):
     name = serializers.CharField(allow_blank=False, trim_whitespace=True)
@@ -138,3 +144,57 @@ class OrganizationUserSerializer(serializers.Serializer):
     last_name = serializers.CharField(allow_blank=True)
     is_active = serializers.BooleanField()
     role = serializers.CharField()
+
+
+class OrganizationUserBulkStatusSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+    )
+
+
+class OrganizationUserBulkStatusResponseSerializer(serializers.Serializer):
+    results = OrganizationUserSerializer(many=True)
+
+
+class ProvisionedUserRowSerializer(serializers.Serializer):
+    """One NDJSON line of a bulk provisioning request.
+
+    Without ``password`` the user gets an unusable password and an invite,
+    and sets a password by accepting it.
+    """
+
+    email = serializers.EmailField(max_length=254)
+    role = serializers.ChoiceField(choices=RoleType.choices)
+    username = serializers.CharField(
+        required=False,
+        allow_blank=False,
+        trim_whitespace=True,
+        max_length=150,
+        validators=[User.username_validator],
+    )
+    first_name = serializers.CharField(
+        required=False, allow_blank=True, trim_whitespace=True, max_length=150
+    )
+    last_name = serializers.CharField(
+        required=False, allow_blank=True, trim_whitespace=True, max_length=150
+    )
+    password = serializers.CharField(required=False, allow_blank=False, write_only=True)
+
+    def validate_email(self, value: str) -> str:
+        return value.strip().lower()
+
+    def validate(self, attrs):
+        # Without a username the email doubles as one, so it must fit that column too.
+        if not attrs.get("username"):
+            if len(attrs["email"]) > 150:
+                raise serializers.ValidationError(
+                    {"username": "Required when the email is longer than 150 characters."}
+                )
+            attrs["username"] = attrs["email"]
+        return attrs
+
+    def validate_password(self, value: str) -> str:
+        validate_password(value)
+        return value
@@ -4,6 +4,7 @@ from django.db import transaction
 
 from apps.access_control.domain.enums import RoleType
 from apps.access_control.repositories.user_role_repository import UserRoleRepository
+from apps.access_control.services import role_count_service
 
 from ..repositories.organization_repository import OrganizationRepository
 
@@ -20,6 +21,7 @@ def create_organization(
             timezone=timezone,
             created_by=creator,
         )
+        role_count_service.ensure_rows(organization.org_id)
         UserRoleRepository.assign_role(
             user=creator,
             org=organization,
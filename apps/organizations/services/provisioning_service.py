@@ -0,0 +1,222 @@
+"""Bulk user provisioning for an organization from NDJSON rows.
+
+Rows are validated one by one and written in batches of
+``PROVISIONING_BATCH_SIZE``: one query finds taken usernames/emails, then
+users, memberships and invites are inserted with ``bulk_create``. Supplied
+passwords are hashed in a process pool of ``PROVISIONING_HASH_WORKERS``;
+rows without one get an unusable password and an invite instead. Each row
+yields one result dict; a row the database rejects becomes an error result
+rather than aborting the rows around it.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from shared import password_hashing
+from shared.logging import get_logger
+
+from apps.access_control.domain.enums import InviteStatus
+from apps.access_control.domain.invite_tokens import generate_invite_token, hash_invite_token
+from apps.access_control.models import OrganizationInvite, UserRole
+from apps.access_control.services import role_count_service
+from apps.access_control.services.invite_service import enqueue_invite_emails
+from apps.accounts.services.registration_service import UNIQUE_FIELD_ERRORS, unique_violation_field
+
+from ..serializers import ProvisionedUserRowSerializer
+
+logger = get_logger(__name__)
+User = get_user_model()
+
+ALREADY_INVITED = "This email has already been invited to the organization."
+NOT_SAVED = "The user could not be saved; retry this row."
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    return password_hashing.hash_passwords(
+        passwords, workers=getattr(settings, "PROVISIONING_HASH_WORKERS", 0)
+    )
+
+
+def parse_lines(lines: Iterable[bytes]) -> Iterator[tuple[int, Any]]:
+    """``(line_number, payload)`` per non-blank line; payload is ``None`` if not a JSON object."""
+    for number, raw in enumerate(lines, start=1):
+        text = raw.strip()
+        if not text:
+            continue
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            payload = None
+        yield number, payload if isinstance(payload, dict) else None
+
+
+def _error(line: int, errors: dict) -> dict:
+    return {"line": line, "status": "error", "errors": errors}
+
+
+def provision_users(*, org, invited_by, rows: Iterable[tuple[int, Any]]) -> Iterator[dict]:
+    """Create users and memberships in ``org``; yields one result per row."""
+    batch_size = getattr(settings, "PROVISIONING_BATCH_SIZE", 500)
+    batch: list[tuple[int, dict]] = []
+    for line, payload in rows:
+        if payload is None:
+            yield _error(line, {"non_field_errors": ["Line is not a JSON object."]})
+            continue
+        serializer = ProvisionedUserRowSerializer(data=payload)
+        if not serializer.is_valid():
+            yield _error(line, serializer.errors)
+            continue
+        batch.append((line, serializer.validated_data))
+        if len(batch) >= batch_size:
+            yield from _write_batch_or_fail(org, invited_by, batch)
+            batch = []
+    if batch:
+        yield from _write_batch_or_fail(org, invited_by, batch)
+
+
+def _write_batch_or_fail(org, invited_by, batch: list[tuple[int, dict]]) -> list[dict]:
+    try:
+        return _write_batch(org, invited_by, batch)
+    except DatabaseError:
+        # Raised before anything in the batch was written (inserts fail row by row).
+        logger.exception("Provisioning batch failed", extra={"org_id": org.org_id})
+        return [_error(line, {"non_field_errors": [NOT_SAVED]}) for line, _ in batch]
+
+
+def _drop_conflicts(org, batch: list[tuple[int, dict]]) -> tuple[list, list[dict]]:
+    """Split off rows whose username/email is taken, in the DB or earlier in the batch."""
+    lowered = [row["username"].lower() for _, row in batch]
+    emails = [row["email"] for _, row in batch]
+    taken = set()
+    for username, email in (
+        User.objects.annotate(username_lower=Lower("username"), email_lower=Lower("email"))
+        .filter(Q(username_lower__in=lowered) | Q(email_lower__in=emails))
+        .values_list("username_lower", "email_lower")
+    ):
+        taken.update({("username", username), ("email", email)})
+
+    invite_emails = [row["email"] for _, row in batch if not row.get("password")]
+    invited = set()
+    if invite_emails:
+        invited = set(
+            OrganizationInvite.objects.filter(org=org, email__in=invite_emails)
+            .values_list("email", flat=True)
+        )
+
+    accepted, errors = [], []
+    for (line, row), username in zip(batch, lowered):
+        keys = {"username": username, "email": row["email"]}
+        conflict = next((field for field, key in keys.items() if (field, key) in taken), None)
+        if conflict:
+            errors.append(_error(line, {conflict: [UNIQUE_FIELD_ERRORS[conflict]]}))
+            continue
+        if not row.get("password") and row["email"] in invited:
+            errors.append(_error(line, {"email": [ALREADY_INVITED]}))
+            continue
+        taken.update(keys.items())
+        accepted.append((line, row))
+    return accepted, errors
+
+
+def _build_user(row: dict, password_hash: Optional[str]):
+    user = User(
+        username=row["username"],
+        email=row["email"],
+        primary_role=row["role"],
+        first_name=row.get("first_name", ""),
+        last_name=row.get("last_name", ""),
+    )
+    if password_hash is None:
+        user.set_unusable_password()
+    else:
+        user.password = password_hash
+    return user
+
+
+def _insert(org, invited_by, rows: list[tuple[int, dict]], hashes: dict[int, str]) -> list[dict]:
+    users = User.objects.bulk_create(
+        [_build_user(row, hashes.get(line)) for line, row in rows]
+    )
+    UserRole.objects.bulk_create(
+        [UserRole(user=user, org=org, role=row["role"]) for user, (_, row) in zip(users, rows)]
+    )
+    # bulk_create sends no post_save, so maintain the role counts here.
+    for org_id, deltas in role_count_service.membership_deltas(
+        (org.org_id, row["role"], True) for _, row in rows
+    ).items():
+        role_count_service.apply_deltas(org_id, deltas)
+    tokens = {line: generate_invite_token() for line, _ in rows if line not in hashes}
+    invites = [
+        OrganizationInvite(
+            org=org,
+            email=row["email"],
+            role=row["role"],
+            token_hash=hash_invite_token(tokens[line]),
+            invited_by=invited_by,
+            status=InviteStatus.INVITED,
+        )
+        for line, row in rows
+        if line in tokens
+    ]
+    OrganizationInvite.objects.bulk_create(invites)
+    if invites:
+        enqueue_invite_emails(
+            org_name=org.name,
+            invites=[(invite.email, token) for invite, token in zip(invites, tokens.values())],
+        )
+
+    invited = {invite.email for invite in invites}
+    return [
+        {
+            "line": line,
+            "status": "created",
+            "user_id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "invited": user.email in invited,
+        }
+        for user, (line, _) in zip(users, rows)
+    ]
+
+
+def _write_batch(org, invited_by, batch: list[tuple[int, dict]]) -> list[dict]:
+    rows, results = _drop_conflicts(org, batch)
+    passwords = [(line, row["password"]) for line, row in rows if row.get("password")]
+    hashes = dict(zip((line for line, _ in passwords), hash_passwords([p for _, p in passwords])))
+
+    try:
+        with transaction.atomic():
+            results.extend(_insert(org, invited_by, rows, hashes))
+    except DatabaseError:
+        # Usually a concurrent insert took a username/email; retry row by row
+        # so only the offending rows fail.
+        for line, row in rows:
+            try:
+                with transaction.atomic():
+                    results.extend(_insert(org, invited_by, [(line, row)], hashes))
+            except DatabaseError as exc:
+                field = unique_violation_field(exc) if isinstance(exc, IntegrityError) else None
+                if field is None:
+                    logger.exception(
+                        "Provisioning row failed", extra={"org_id": org.org_id, "line": line}
+                    )
+                    results.append(_error(line, {"non_field_errors": [NOT_SAVED]}))
+                else:
+                    results.append(_error(line, {field: [UNIQUE_FIELD_ERRORS[field]]}))
+
+    logger.info(
+        "Provisioned user batch",
+        extra={
+            "org_id": org.org_id,
+            "rows": len(batch),
+            "users_created": sum(1 for result in results if result["status"] == "created"),
+        },
+    )
+    return sorted(results, key=lambda result: result["line"])
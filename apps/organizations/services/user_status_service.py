@@ -0,0 +1,97 @@
+"""Batch activation and deactivation of organization users.
+
+One locking select validates that every id is a member of the org and reads
+the rows returned to the caller; one ``UPDATE ... WHERE id IN (...)`` flips
+the users whose state actually changes. ``QuerySet.update`` sends no
+``post_save``, so the role counts are maintained here. Deactivation enforces
+the last-admin invariant once for the whole set against the locked
+``ORG_ADMIN`` count.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import UserRole
+from apps.access_control.services import role_count_service
+from apps.accounts.models import UserStatus
+
+User = get_user_model()
+
+MEMBER_ROW_FIELDS = (
+    "user_id",
+    "role",
+    "user__username",
+    "user__email",
+    "user__first_name",
+    "user__last_name",
+    "user__is_active",
+    "user__status",
+)
+
+LAST_ADMIN_ERROR = "Cannot deactivate the last active organization admin."
+
+
+def set_users_active(
+    *, org_id: str, user_ids: Iterable[int], active: bool
+) -> list[dict[str, Any]]:
+    """Activate or deactivate members of ``org_id``; returns their rows after the change.
+
+    Rows are ``MEMBER_ROW_FIELDS`` dicts ordered by ``user_id``. Raises
+    ``ValueError`` when an id is not a member of the org, or when
+    deactivation would leave the org without an active admin.
+    """
+    user_ids = sorted(set(user_ids))
+    target_status = UserStatus.ACTIVE if active else UserStatus.INACTIVE
+    with transaction.atomic():
+        if not active:
+            # Lock before reading memberships so concurrent deactivations of
+            # different admins cannot both pass the check.
+            active_admins = role_count_service.active_count(
+                org_id, RoleType.ORG_ADMIN, for_update=True
+            )
+        rows = list(
+            UserRole.objects.filter(org_id=org_id, user_id__in=user_ids)
+            .select_for_update(of=("user",))
+            .order_by("user_id")
+            .values(*MEMBER_ROW_FIELDS)
+        )
+        missing = set(user_ids).difference(row["user_id"] for row in rows)
+        if missing:
+            raise ValueError(
+                "Users not found in organization: "
+                + ", ".join(str(user_id) for user_id in sorted(missing))
+                + "."
+            )
+
+        if not active:
+            leaving_admins = sum(
+                1
+                for row in rows
+                if row["role"] == RoleType.ORG_ADMIN and row["user__is_active"]
+            )
+            if leaving_admins and active_admins - leaving_admins < 1:
+                raise ValueError(LAST_ADMIN_ERROR)
+
+        changed = [
+            row
+            for row in rows
+            if row["user__is_active"] != active or row["user__status"] != target_status
+        ]
+        if changed:
+            User.objects.filter(id__in=[row["user_id"] for row in changed]).update(
+                is_active=active, status=target_status
+            )
+            role_count_service.count_activation_changes(
+                [row["user_id"] for row in changed if row["user__is_active"] != active],
+                sign=1 if active else -1,
+            )
+
+    for row in rows:
+        row["user__is_active"] = active
+        row["user__status"] = target_status
+    return rows
+
@@ -0,0 +1,26 @@
+"""Publish invalidations for cached organization and membership data."""
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from shared.invalidation import get_bus
+
+from apps.access_control.models import UserRole
+
+from .cache_scopes import membership_scope, org_scope
+from .models import Organization
+
+
+@receiver(post_save, sender=Organization, dispatch_uid="invalidate_org_on_save")
+def invalidate_org_on_save(sender, instance, created, **kwargs):
+    if created:
+        return
+    get_bus().invalidate(org_scope(instance.pk))
+
+
+@receiver(post_save, sender=UserRole, dispatch_uid="invalidate_membership_on_save")
+@receiver(post_delete, sender=UserRole, dispatch_uid="invalidate_membership_on_delete")
+def invalidate_membership_on_change(sender, instance, **kwargs):
+    get_bus().invalidate(membership_scope(instance.user_id, instance.org_id))
+
@@ -0,0 +1,77 @@
+"""Current-tenant context for opt-in org scoping.
+
+The current org is its own context variable, separate from the logging tenant
+id: ``OrganizationContextMiddleware`` binds both for a request, and background
+jobs use :func:`tenant_context`. ``Model.scoped`` and ``for_current_org()``
+read it to add the ``org_id`` predicate and refuse to run without it; jobs
+that legitimately span tenants opt out with :func:`cross_tenant`.
+"""
+from __future__ import annotations
+
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_current_org_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_org_id", default=None
+)
+_cross_tenant_var: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "cross_tenant", default=False
+)
+
+
+class TenantContextMissing(RuntimeError):
+    """Raised for a ``scoped`` query outside any tenant context."""
+
+
+def get_current_org_id() -> Optional[str]:
+    return _current_org_id_var.get()
+
+
+def set_current_org_id(org_id: Optional[str]) -> contextvars.Token:
+    return _current_org_id_var.set(org_id)
+
+
+def reset_current_org_id(token: contextvars.Token) -> None:
+    _current_org_id_var.reset(token)
+
+
+def is_cross_tenant() -> bool:
+    return _cross_tenant_var.get()
+
+
+@contextmanager
+def tenant_context(org_id: str) -> Iterator[None]:
+    """Scope ``scoped`` queries in the block to ``org_id``."""
+    token = set_current_org_id(org_id)
+    try:
+        yield
+    finally:
+        reset_current_org_id(token)
+
+
+@contextmanager
+def cross_tenant() -> Iterator[None]:
+    """Disable automatic tenant filtering in the block (admin and maintenance jobs)."""
+    token = _cross_tenant_var.set(True)
+    try:
+        yield
+    finally:
+        _cross_tenant_var.reset(token)
+
+
+def resolve_scope_org_id() -> Optional[str]:
+    """Org id to filter on, or ``None`` inside :func:`cross_tenant`.
+
+    A scoped query outside both a tenant context and :func:`cross_tenant`
+    raises :class:`TenantContextMissing` rather than silently reading every
+    tenant's rows.
+    """
+    if _cross_tenant_var.get():
+        return None
+    org_id = _current_org_id_var.get()
+    if org_id is None:
+        raise TenantContextMissing(
+            "Scoped query without tenant context; use tenant_context() or cross_tenant()."
+        )
+    return org_id
@@ -201,3 +201,57 @@ class OrganizationSettingsTests(TestCase):
         self.assertEqual(invoice_payload["currency"], "INR")
         self.assertEqual(invoice_payload["country"], "IN")
         self.assertEqual(invoice_payload["timezone"], "Asia/Kolkata")
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+)
+class OrganizationUsersListTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = get_user_model().objects.create_user(
+            username="org-admin",
+            email="org-admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.admin,
+            name="Acme",
+            country="US",
+            base_currency="USD",
+        )
+        self.viewer = get_user_model().objects.create_user(
+            username="viewer",
+            email="viewer@example.com",
+            password="pass1234",
+            primary_role=RoleType.VIEWER,
+            first_name="Vic",
+        )
+        UserRoleRepository.assign_role(user=self.viewer, org=self.org, role=RoleType.VIEWER)
+        self.url = reverse("list-organization-users")
+
+    def test_admin_lists_org_users(self):
+        token = issue_token(
+            user_id=self.admin.id, org_id=self.org.org_id, role=RoleType.ORG_ADMIN
+        )
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["count"], 2)
+        self.assertEqual(
+            payload["results"][1],
+            {
+                "id": self.viewer.id,
+                "username": "viewer",
+                "email": "viewer@example.com",
+                "first_name": "Vic",
+                "last_name": "",
+                "is_active": True,
+                "role": RoleType.VIEWER,
+            },
+        )
@@ -0,0 +1,246 @@
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import OrganizationInvite, UserRole
+from apps.accounts.services.auth_token_service import issue_token
+from apps.core.tests.query_baseline import count_queries
+from apps.organizations.services import provisioning_service
+from apps.organizations.services.organization_service import create_organization
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+    PROVISIONING_HASH_WORKERS=0,
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_DELIVERY_MODE="sync",
+    OUTBOX_RELAY_MODE="sync",
+)
+class ProvisionUsersTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = get_user_model().objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.admin, name="Org One", country="US", base_currency="USD"
+        )
+        self.url = reverse("provision-organization-users")
+
+    def _post(self, rows, user=None, role=RoleType.ORG_ADMIN):
+        user = user or self.admin
+        token = issue_token(user_id=user.id, org_id=self.org.org_id, role=role)
+        body = "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows)
+        return self.client.post(
+            self.url,
+            body,
+            content_type="application/x-ndjson",
+            HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+
+    def _results(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = response.content.decode().splitlines()
+        return [json.loads(line) for line in lines]
+
+    def test_provisions_users_with_passwords_and_invites(self):
+        results = self._results(
+            self._post(
+                [
+                    {
+                        "email": "A@Example.com",
+                        "role": RoleType.FINANCE,
+                        "password": "SecurePass123!",
+                    },
+                    {"email": "b@example.com", "role": RoleType.VIEWER, "username": "bee"},
+                ]
+            )
+        )
+
+        self.assertEqual(results[-1], {"summary": {"created": 2, "error": 0}})
+        first, second = results[:2]
+        self.assertEqual(
+            (first["line"], first["username"], first["invited"]), (1, "a@example.com", False)
+        )
+        self.assertEqual((second["username"], second["invited"]), ("bee", True))
+
+        User = get_user_model()
+        self.assertTrue(User.objects.get(pk=first["user_id"]).check_password("SecurePass123!"))
+        self.assertFalse(User.objects.get(pk=second["user_id"]).has_usable_password())
+        self.assertEqual(
+            set(UserRole.objects.filter(org=self.org).values_list("user_id", "role")),
+            {
+                (self.admin.id, RoleType.ORG_ADMIN),
+                (first["user_id"], RoleType.FINANCE),
+                (second["user_id"], RoleType.VIEWER),
+            },
+        )
+        self.assertTrue(
+            OrganizationInvite.objects.filter(org=self.org, email="b@example.com")
+            .exists()
+        )
+
+    def test_invalid_and_conflicting_rows_are_reported_per_line(self):
+        results = self._results(
+            self._post(
+                [
+                    "not json",
+                    {"email": "ADMIN@example.com", "role": RoleType.VIEWER},
+                    {"email": "new@example.com", "role": "OWNER"},
+                    {"email": "dup@example.com", "role": RoleType.VIEWER},
+                    {"email": "Dup@example.com", "role": RoleType.VIEWER},
+                ]
+            )
+        )
+
+        by_line = {result["line"]: result for result in results[:-1]}
+        self.assertEqual(by_line[1]["status"], "error")
+        self.assertIn("email", by_line[2]["errors"])
+        self.assertIn("role", by_line[3]["errors"])
+        self.assertEqual(by_line[4]["status"], "created")
+        self.assertIn("username", by_line[5]["errors"])
+        self.assertEqual(results[-1], {"summary": {"created": 1, "error": 4}})
+
+    def test_values_too_long_for_their_columns_are_row_errors(self):
+        domain = f"{'b' * 60}.{'c' * 60}.com"
+        long_email = f"{'a' * 64}@{domain}"
+        results = self._results(
+            self._post(
+                [
+                    {"email": long_email, "role": RoleType.VIEWER},
+                    {"email": long_email, "role": RoleType.VIEWER, "username": "long"},
+                    {"email": f"{'a' * 64}@{'.'.join([domain] * 4)}", "role": RoleType.VIEWER},
+                    {"email": "c@example.com", "role": RoleType.VIEWER, "first_name": "x" * 151},
+                ]
+            )
+        )
+
+        by_line = {result["line"]: result for result in results[:-1]}
+        # The email becomes the username when none is given, so it must fit in 150 characters.
+        self.assertIn("username", by_line[1]["errors"])
+        self.assertEqual(by_line[2]["status"], "created")
+        self.assertIn("email", by_line[3]["errors"])
+        self.assertIn("first_name", by_line[4]["errors"])
+        self.assertEqual(results[-1], {"summary": {"created": 1, "error": 3}})
+
+    def test_database_errors_become_row_errors(self):
+        insert = provisioning_service._insert
+
+        def failing_insert(org, invited_by, rows, hashes):
+            if any(row["email"] == "broken@example.com" for _, row in rows):
+                raise DatabaseError("connection reset")
+            return insert(org, invited_by, rows, hashes)
+
+        with mock.patch.object(provisioning_service, "_insert", side_effect=failing_insert):
+            results = self._results(
+                self._post(
+                    [
+                        {"email": "ok@example.com", "role": RoleType.VIEWER},
+                        {"email": "broken@example.com", "role": RoleType.VIEWER},
+                    ]
+                )
+            )
+
+        self.assertEqual([result.get("line") for result in results[:-1]], [1, 2])
+        self.assertEqual(results[0]["status"], "created")
+        self.assertEqual(
+            results[1]["errors"], {"non_field_errors": [provisioning_service.NOT_SAVED]}
+        )
+        self.assertEqual(results[-1], {"summary": {"created": 1, "error": 1}})
+        self.assertFalse(get_user_model().objects.filter(email="broken@example.com").exists())
+
+    def test_batches_use_a_constant_number_of_queries(self):
+        rows = [
+            (
+                line,
+                {
+                    "email": f"user{line}@example.com",
+                    "role": RoleType.VIEWER,
+                    "password": "SecurePass123!",
+                },
+            )
+            for line in range(1, 101)
+        ]
+        with override_settings(PROVISIONING_BATCH_SIZE=50):
+            with CaptureQueriesContext(connection) as captured:
+                results = list(
+                    provisioning_service.provision_users(
+                        org=self.org, invited_by=self.admin, rows=rows
+                    )
+                )
+
+        self.assertEqual(len(results), 100)
+        self.assertTrue(all(result["status"] == "created" for result in results))
+        # Per batch: conflict lookup, user and membership inserts, role-count update.
+        self.assertLessEqual(count_queries(captured), 8)
+
+    def test_invites_are_emailed_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._results(self._post([{"email": "c@example.com", "role": RoleType.VIEWER}]))
+
+        self.assertEqual([message.to for message in mail.outbox], [["c@example.com"]])
+
+    def test_non_admin_is_rejected(self):
+        viewer = get_user_model().objects.create_user(
+            username="viewer",
+            email="viewer@example.com",
+            password="pass1234",
+            primary_role=RoleType.VIEWER,
+        )
+        UserRole.objects.create(user=viewer, org=self.org, role=RoleType.VIEWER)
+
+        response = self._post(
+            [{"email": "c@example.com", "role": RoleType.VIEWER}], user=viewer, role=RoleType.VIEWER
+        )
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(PROVISIONING_MAX_ROWS=1)
+    def test_row_limit(self):
+        response = self._post(
+            [{"email": f"u{index}@example.com", "role": RoleType.VIEWER} for index in range(2)]
+        )
+        self.assertEqual(response.status_code, 413)
+
+    @override_settings(PROVISIONING_MAX_BYTES=100)
+    def test_byte_limit(self):
+        response = self._post(
+            [{"email": f"u{index}@example.com", "role": RoleType.VIEWER} for index in range(3)]
+        )
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(get_user_model().objects.filter(email="u0@example.com").exists())
+
+    @override_settings(PROVISIONING_MAX_LINE_BYTES=64)
+    def test_overlong_line_is_rejected(self):
+        response = self._post(
+            [
+                {"email": "a@example.com", "role": RoleType.VIEWER},
+                {"email": "b@example.com", "role": RoleType.VIEWER, "first_name": "x" * 64},
+            ]
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Line 2", response.json()["detail"])
+
+
+class HashPasswordsTests(TestCase):
+    @override_settings(PROVISIONING_HASH_WORKERS=2)
+    def test_process_pool_hashes_match_inline_hashing(self):
+        from django.contrib.auth.hashers import check_password
+
+        hashes = provisioning_service.hash_passwords(["one", "two", "three"])
+
+        self.assertEqual(len(hashes), 3)
+        self.assertTrue(check_password("two", hashes[1]))
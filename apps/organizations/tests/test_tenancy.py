@@ -0,0 +1,98 @@
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import UserRole
+from apps.accounts.services.auth_token_service import issue_token
+from apps.organizations.middleware import OrganizationContextMiddleware
+from apps.organizations.services.organization_service import create_organization
+from apps.organizations.tenancy import (
+    TenantContextMissing,
+    cross_tenant,
+    get_current_org_id,
+    tenant_context,
+)
+from shared.logging.context import get_tenant_id
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+)
+class TenantScopedManagerTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin_one = User.objects.create_user(
+            username="admin1",
+            email="admin1@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.admin_two = User.objects.create_user(
+            username="admin2",
+            email="admin2@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org_one = create_organization(
+            creator=self.admin_one, name="Org One", country="US", base_currency="USD"
+        )
+        self.org_two = create_organization(
+            creator=self.admin_two, name="Org Two", country="US", base_currency="USD"
+        )
+
+    def test_scoped_queries_are_filtered_to_current_tenant(self):
+        with tenant_context(self.org_one.org_id):
+            org_ids = set(UserRole.scoped.values_list("org_id", flat=True))
+            foreign = UserRole.scoped.filter(user=self.admin_two).exists()
+            explicit = UserRole.objects.for_current_org().count()
+
+        self.assertEqual(org_ids, {self.org_one.org_id})
+        self.assertFalse(foreign)
+        self.assertEqual(explicit, 1)
+
+    def test_objects_and_related_managers_stay_unscoped(self):
+        with tenant_context(self.org_one.org_id):
+            everything = UserRole.objects.count()
+            related = self.admin_two.organization_roles.count()
+            with cross_tenant():
+                crossed = UserRole.scoped.count()
+
+        self.assertEqual(everything, 2)
+        self.assertEqual(related, 1)
+        self.assertEqual(crossed, 2)
+
+    def test_scoped_requires_tenant_context(self):
+        with self.assertRaises(TenantContextMissing):
+            UserRole.scoped.count()
+        with self.assertRaises(TenantContextMissing):
+            UserRole.objects.for_current_org()
+        self.assertEqual(UserRole.objects.count(), 2)
+        with cross_tenant():
+            self.assertEqual(UserRole.scoped.count(), 2)
+
+    def test_tenant_context_does_not_bind_logging_tenant(self):
+        with tenant_context(self.org_one.org_id):
+            self.assertEqual(get_current_org_id(), self.org_one.org_id)
+            self.assertIsNone(get_tenant_id())
+
+    def test_middleware_sets_tenant_for_request_only(self):
+        seen = []
+
+        def get_response(request):
+            seen.append((get_current_org_id(), get_tenant_id()))
+            return HttpResponse()
+
+        token = issue_token(
+            user_id=self.admin_one.id, org_id=self.org_one.org_id, role=RoleType.ORG_ADMIN
+        )
+        request = RequestFactory().get("/api/example", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response = OrganizationContextMiddleware(get_response)(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(seen, [(self.org_one.org_id, self.org_one.org_id)])
+        self.assertIsNone(get_current_org_id())
+        self.assertIsNone(get_tenant_id())
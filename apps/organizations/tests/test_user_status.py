@@ -0,0 +1,155 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import UserRole
+from apps.access_control.services import role_count_service
+from apps.accounts.models import UserStatus
+from apps.accounts.services.auth_token_service import issue_token
+from apps.core.tests.query_baseline import count_queries
+from apps.organizations.services.organization_service import create_organization
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+)
+class BulkUserStatusTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+        self.admin = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.admin, name="Org One", country="US", base_currency="USD"
+        )
+        self.other_org = create_organization(
+            creator=self.admin, name="Org Two", country="US", base_currency="USD"
+        )
+        self.members = []
+        for index in range(3):
+            member = User.objects.create_user(
+                username=f"member{index}",
+                email=f"member{index}@example.com",
+                password="pass1234",
+                primary_role=RoleType.VIEWER,
+            )
+            UserRole.objects.create(user=member, org=self.org, role=RoleType.VIEWER)
+            self.members.append(member)
+        UserRole.objects.create(
+            user=self.members[0], org=self.other_org, role=RoleType.FINANCE
+        )
+
+    def _post(self, name, user_ids, token=None):
+        token = token or issue_token(
+            user_id=self.admin.id, org_id=self.org.org_id, role=RoleType.ORG_ADMIN
+        )
+        return self.client.post(
+            reverse(name),
+            {"user_ids": user_ids},
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+
+    def _active(self, org, role):
+        return role_count_service.counts_for_org(org.org_id)[role]["active"]
+
+    def test_deactivates_and_reactivates_in_batch(self):
+        user_ids = [member.id for member in self.members]
+
+        response = self._post("bulk-deactivate-organization-users", user_ids)
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([row["id"] for row in results], user_ids)
+        self.assertTrue(all(row["is_active"] is False for row in results))
+        self.assertEqual(results[0]["role"], RoleType.VIEWER)
+        self.assertFalse(
+            get_user_model().objects.filter(id__in=user_ids, is_active=True).exists()
+        )
+        self.assertEqual(
+            set(
+                get_user_model()
+                .objects.filter(id__in=user_ids)
+                .values_list("status", flat=True)
+            ),
+            {UserStatus.INACTIVE},
+        )
+        self.assertEqual(self._active(self.org, RoleType.VIEWER), 0)
+        self.assertEqual(self._active(self.other_org, RoleType.FINANCE), 0)
+
+        response = self._post("bulk-reactivate-organization-users", user_ids)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(row["is_active"] for row in response.json()["results"]))
+        self.assertEqual(self._active(self.org, RoleType.VIEWER), 3)
+        self.assertEqual(self._active(self.other_org, RoleType.FINANCE), 1)
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        token = issue_token(user_id=self.admin.id, org_id=self.org.org_id, role=RoleType.ORG_ADMIN)
+        with CaptureQueriesContext(connection) as captured:
+            response = self._post(
+                "bulk-deactivate-organization-users",
+                [member.id for member in self.members],
+                token=token,
+            )
+
+        self.assertEqual(response.status_code, 200)
+        # Three auth/org-context queries, then: admin count lock, membership
+        # select, user UPDATE, cross-org membership select and one count
+        # UPDATE per affected (org, role).
+        self.assertEqual(count_queries(captured), 3 + 4 + 2)
+
+    def test_non_member_rejects_whole_batch(self):
+        outsider = get_user_model().objects.create_user(
+            username="outsider",
+            email="outsider@example.com",
+            password="pass1234",
+            primary_role=RoleType.VIEWER,
+        )
+
+        response = self._post(
+            "bulk-deactivate-organization-users", [self.members[0].id, outsider.id]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(str(outsider.id), response.json()["detail"])
+        self.members[0].refresh_from_db()
+        self.assertTrue(self.members[0].is_active)
+
+    def test_cannot_deactivate_every_active_admin(self):
+        response = self._post(
+            "bulk-deactivate-organization-users", [self.admin.id, self.members[0].id]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["detail"], "Cannot deactivate the last active organization admin."
+        )
+        self.admin.refresh_from_db()
+        self.assertTrue(self.admin.is_active)
+
+        UserRole.objects.filter(user=self.members[1], org=self.org).update(
+            role=RoleType.ORG_ADMIN
+        )
+        role_count_service.rebuild([self.org.org_id])
+        response = self._post("bulk-deactivate-organization-users", [self.admin.id])
+        self.assertEqual(response.status_code, 200)
+
+    def test_non_admin_forbidden(self):
+        token = issue_token(
+            user_id=self.members[0].id, org_id=self.org.org_id, role=RoleType.VIEWER
+        )
+        response = self._post(
+            "bulk-deactivate-organization-users", [self.members[1].id], token=token
+        )
+        self.assertEqual(response.status_code, 403)
@@ -10,6 +10,21 @@ urlpatterns = [
         name="organization-settings",
     ),
     path("organizations/users", api.list_organization_users_view, name="list-organization-users"),
+    path(
+        "organizations/users/provision",
+        api.provision_organization_users_view,
+        name="provision-organization-users",
+    ),
+    path(
+        "organizations/users/deactivate",
+        api.bulk_deactivate_organization_users_view,
+        name="bulk-deactivate-organization-users",
+    ),
+    path(
+        "organizations/users/reactivate",
+        api.bulk_reactivate_organization_users_view,
+        name="bulk-reactivate-organization-users",
+    ),
     path(
         "organizations/users/<int:user_id>/deactivate",
         api.deactivate_organization_user_view,
@@ -6,6 +6,7 @@ from rest_framework.response import Response
 
 from apps.access_control.domain.enums import RoleType
 from apps.access_control.models import UserRole
+from apps.access_control.services import role_count_service
 
 User = get_user_model()
 
@@ -44,8 +45,12 @@ def get_user_role(org_id: str, user_id: int) -> str | None:
     )
 
 
-def is_last_active_admin(org_id: str, user_id: int) -> bool:
-    active_admins = UserRole.objects.filter(
-        org_id=org_id, role=RoleType.ORG_ADMIN, user__is_active=True
-    )
-    return active_admins.count() == 1 and active_admins.filter(user_id=user_id).exists()
+def is_last_active_admin(org_id: str, membership) -> bool:
+    """Whether ``membership`` is the org's only active admin, from the materialized count.
+
+    Locks the org's ``ORG_ADMIN`` count row, so call it inside the transaction
+    that deactivates the user; concurrent deactivations then serialize.
+    """
+    if membership.role != RoleType.ORG_ADMIN or not membership.user.is_active:
+        return False
+    return role_count_service.active_count(org_id, RoleType.ORG_ADMIN, for_update=True) <= 1
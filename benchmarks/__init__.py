@@ -0,0 +1,35 @@
+"""In-repo performance benchmarks.
+
+Modules are runnable with ``python -m benchmarks.<name>`` and print JSON
+results so runs can be diffed between commits.
+"""
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+
+def setup_django() -> None:
+    """Configure Django for standalone benchmark scripts."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sourceright.settings.local")
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database(*, keepdb: bool = False, verbosity: int = 0) -> Iterator[None]:
+    """Run the block against a throwaway test database, like ``manage.py test``."""
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=verbosity, autoclobber=True, keepdb=keepdb)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity, keepdb=keepdb)
+        teardown_test_environment()
@@ -0,0 +1,143 @@
+"""Offset vs keyset (cursor) pagination of one organization's invites.
+
+Seeds ``--invites`` invites into a single organization, then pages through
+them both ways: ``LIMIT/OFFSET`` slices, as ``PageNumberPagination`` issues,
+and ``InviteCursorPagination`` as used by ``GET /api/organizations/invites``.
+Each strategy walks every page, unfiltered and with ``status=INVITED``::
+
+    python -m benchmarks.invite_listing --invites 100000 --page-size 200
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Any, Callable, Iterator, Optional
+
+from benchmarks import setup_django, test_database
+
+
+def seed_invites(org, invited_by, count: int, accepted_ratio: float, seed: int) -> None:
+    from apps.access_control.domain.enums import InviteStatus
+    from apps.access_control.domain.invite_tokens import hash_invite_token
+    from apps.access_control.models import OrganizationInvite
+
+    rng = random.Random(seed)
+    OrganizationInvite.objects.bulk_create(
+        (
+            OrganizationInvite(
+                org=org,
+                email=f"invitee{index}@bench.example.com",
+                role="VIEWER",
+                status=(
+                    InviteStatus.ACTIVE if rng.random() < accepted_ratio else InviteStatus.INVITED
+                ),
+                token_hash=hash_invite_token(f"bench-{seed}-{index}"),
+                invited_by=invited_by,
+            )
+            for index in range(count)
+        ),
+        batch_size=5000,
+    )
+
+
+def walk_offset(rows, page_size: int) -> Iterator[int]:
+    offset = 0
+    while True:
+        page = list(rows[offset:offset + page_size])
+        yield len(page)
+        if len(page) < page_size:
+            return
+        offset += page_size
+
+
+def walk_cursor(rows, page_size: int) -> Iterator[int]:
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from apps.organizations.pagination import InviteCursorPagination
+
+    factory = APIRequestFactory()
+    url: Optional[str] = f"/api/organizations/invites?page_size={page_size}"
+    while url:
+        paginator = InviteCursorPagination()
+        page = paginator.paginate_queryset(rows, Request(factory.get(url)))
+        yield len(page)
+        url = paginator.get_next_link()
+
+
+def _measure(walk: Callable[[Any, int], Iterator[int]], rows, page_size: int) -> dict[str, Any]:
+    durations = []
+    total = 0
+    pages = walk(rows, page_size)
+    while True:
+        started = time.perf_counter()
+        size = next(pages, None)
+        if size is None:
+            break
+        durations.append(time.perf_counter() - started)
+        total += size
+    return {
+        "pages": len(durations),
+        "rows": total,
+        "total_ms": round(sum(durations) * 1000, 1),
+        "first_page_ms": round(durations[0] * 1000, 3),
+        "median_page_ms": round(statistics.median(durations) * 1000, 3),
+        "last_page_ms": round(durations[-1] * 1000, 3),
+    }
+
+
+def run(invites: int, page_size: int, accepted_ratio: float, seed: int) -> dict[str, Any]:
+    from django.contrib.auth import get_user_model
+    from django.test import override_settings
+
+    from apps.access_control.domain.enums import InviteStatus
+    from apps.access_control.repositories.invite_repository import OrganizationInviteRepository
+    from apps.organizations.services.organization_service import create_organization
+
+    admin = get_user_model().objects.create_user(
+        username="bench-admin",
+        email="admin@bench.example.com",
+        password="!",
+        primary_role="ORG_ADMIN",
+    )
+    with override_settings(ALLOWED_COUNTRIES=["US"], ALLOWED_CURRENCIES=["USD"]):
+        org = create_organization(creator=admin, name="Bench", country="US", base_currency="USD")
+    seed_invites(org, admin, invites, accepted_ratio, seed)
+
+    fields = ("id", "email", "role", "status", "invited_at", "expires_at", "accepted_at")
+    results: dict[str, Any] = {
+        "invites": invites,
+        "page_size": page_size,
+        "accepted_ratio": accepted_ratio,
+    }
+    for label, status in (("all", None), ("invited", InviteStatus.INVITED)):
+        rows = OrganizationInviteRepository.list_for_org(org.org_id, status=status, fields=fields)
+        offset = _measure(walk_offset, rows, page_size)
+        cursor = _measure(walk_cursor, rows, page_size)
+        results[label] = {
+            "offset": offset,
+            "cursor": cursor,
+            "last_page_speedup": round(offset["last_page_ms"] / cursor["last_page_ms"], 1),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--invites", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--accepted-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database():
+        results = run(args.invites, args.page_size, args.accepted_ratio, args.seed)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
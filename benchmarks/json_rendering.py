@@ -0,0 +1,120 @@
+"""Throughput of DRF's stdlib JSON renderer/parser vs shared.fastjson.
+
+Usage::
+
+    python -m benchmarks.json_rendering --rows 5000 --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from typing import Any, Callable
+
+from benchmarks import setup_django
+
+
+def build_invoice_listing(rows: int, rng: random.Random) -> dict[str, Any]:
+    start = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+    invoices = [
+        {
+            "invoice_id": uuid.UUID(int=rng.getrandbits(128)),
+            "vendor_id": f"ven_{rng.getrandbits(40):010x}",
+            "amount": Decimal(rng.randint(100, 10_000_000)) / 100,
+            "currency": rng.choice(["USD", "INR"]),
+            "status": rng.choice(["uploaded", "approved", "rejected"]),
+            "issued_at": start + timedelta(seconds=rng.randint(0, 10_000_000)),
+            "due_on": (start + timedelta(days=rng.randint(0, 365))).date(),
+        }
+        for _ in range(rows)
+    ]
+    return {"count": rows, "next": None, "previous": None, "results": invoices}
+
+
+def build_user_listing(rows: int, rng: random.Random) -> dict[str, Any]:
+    users = [
+        {
+            "id": index,
+            "username": f"user{index}",
+            "email": f"user{index}@example.com",
+            "first_name": rng.choice(["Ada", "Grace", "Linus", "Zoë"]),
+            "last_name": rng.choice(["Lovelace", "Hopper", "Torvalds", "Ångström"]),
+            "is_active": rng.random() > 0.1,
+            "role": rng.choice(["ORG_ADMIN", "FINANCE", "APPROVER", "VIEWER", "VENDOR"]),
+        }
+        for index in range(1, rows + 1)
+    ]
+    return {"count": rows, "next": None, "previous": None, "results": users}
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> float:
+    func()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def run(rows: int, repeat: int, seed: int) -> dict[str, Any]:
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from shared.fastjson import FastJSONParser, FastJSONRenderer, is_fast_backend_available
+
+    rng = random.Random(seed)
+    listings = {
+        "invoices": build_invoice_listing(rows, rng),
+        "users": build_user_listing(rows, rng),
+    }
+    implementations = {
+        "drf": (JSONRenderer(), JSONParser()),
+        "fastjson": (FastJSONRenderer(), FastJSONParser()),
+    }
+
+    results: dict[str, Any] = {
+        "rows": rows,
+        "repeat": repeat,
+        "fast_backend_available": is_fast_backend_available(),
+        "listings": {},
+    }
+    for name, payload in listings.items():
+        body = JSONRenderer().render(payload)
+        listing_results: dict[str, Any] = {"bytes": len(body)}
+        for impl_name, (renderer, parser) in implementations.items():
+            render_s = _measure(lambda: renderer.render(payload), repeat)
+            parse_s = _measure(lambda: parser.parse(io.BytesIO(body)), repeat)
+            listing_results[impl_name] = {
+                "render_ms": round(render_s * 1000, 3),
+                "render_rows_per_s": round(rows / render_s),
+                "render_mb_per_s": round(len(body) / render_s / 1_000_000, 1),
+                "parse_ms": round(parse_s * 1000, 3),
+                "parse_rows_per_s": round(rows / parse_s),
+            }
+        listing_results["render_speedup"] = round(
+            listing_results["drf"]["render_ms"] / listing_results["fastjson"]["render_ms"], 2
+        )
+        listing_results["parse_speedup"] = round(
+            listing_results["drf"]["parse_ms"] / listing_results["fastjson"]["parse_ms"], 2
+        )
+        results["listings"][name] = listing_results
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    setup_django()
+    print(json.dumps(run(args.rows, args.repeat, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""In-process load test for the hot API paths.
+
+Seeds organizations, members and invites through the service layer, then
+drives login, refresh, ``/api/dashboard/me``, the org users listing and
+invoice upload through DRF's test client. Each scenario reports throughput,
+latency percentiles and per-request query counts as JSON.
+
+The run happens against a throwaway test database, so it is safe to point at
+any settings module::
+
+    python -m benchmarks.load --orgs 5 --users-per-org 50 --iterations 200
+    python manage.py run_load_benchmark --output load.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from benchmarks import setup_django, test_database
+
+SEED_PASSWORD = "bench-pass-1234"
+
+MEMBER_ROLES = ("FINANCE", "APPROVER", "VIEWER")
+
+
+@dataclass
+class SeededOrg:
+    organization: Any
+    admin: Any
+    vendor: Any
+    members: list[Any] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named request factory: ``build(org, rng)`` returns ``(method, path, data, user)``."""
+
+    name: str
+    build: Callable[[SeededOrg, random.Random], tuple[str, str, dict[str, Any] | None, Any]]
+    expected_status: int = 200
+
+
+def seed_orgs(*, orgs: int, users_per_org: int, invites_per_org: int, seed: int = 1) -> list[SeededOrg]:
+    """Create ``orgs`` organizations with members and pending invites.
+
+    Organizations and invites go through ``create_organization`` and
+    ``invite_user`` so the seeded rows look exactly like production ones.
+    Member users share one pre-hashed password to keep seeding fast.
+    """
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+
+    from apps.access_control.models import UserRole
+    from apps.access_control.services import role_count_service
+    from apps.access_control.services.invite_service import invite_user
+    from apps.organizations.services.organization_service import create_organization
+
+    User = get_user_model()
+    rng = random.Random(seed)
+    password_hash = make_password(SEED_PASSWORD)
+    seeded: list[SeededOrg] = []
+
+    for org_index in range(orgs):
+        prefix = f"bench{seed}o{org_index}"
+        admin = User.objects.create(
+            username=f"{prefix}admin",
+            email=f"{prefix}admin@bench.example.com",
+            password=password_hash,
+            primary_role="ORG_ADMIN",
+        )
+        organization = create_organization(
+            creator=admin,
+            name=f"Bench Org {org_index}",
+            country="US",
+            base_currency="USD",
+        )
+
+        vendor = User.objects.create(
+            username=f"{prefix}vendor",
+            email=f"{prefix}vendor@bench.example.com",
+            password=password_hash,
+            primary_role="VENDOR",
+        )
+        members = User.objects.bulk_create(
+            [
+                User(
+                    username=f"{prefix}u{index}",
+                    email=f"{prefix}u{index}@bench.example.com",
+                    password=password_hash,
+                    primary_role=rng.choice(MEMBER_ROLES),
+                )
+                for index in range(users_per_org)
+            ]
+        )
+        if not all(member.pk for member in members):
+            members = list(
+                User.objects.filter(username__startswith=f"{prefix}u").order_by("id")
+            )
+        UserRole.objects.bulk_create(
+            [UserRole(user=vendor, org=organization, role="VENDOR")]
+            + [
+                UserRole(user=member, org=organization, role=member.primary_role)
+                for member in members
+            ]
+        )
+
+        for index in range(invites_per_org):
+            invite_user(
+                org=organization,
+                email=f"{prefix}invite{index}@bench.example.com",
+                role=rng.choice(MEMBER_ROLES),
+                invited_by=admin,
+            )
+
+        seeded.append(
+            SeededOrg(organization=organization, admin=admin, vendor=vendor, members=members)
+        )
+
+    # The membership bulk_create bypasses the signals that maintain role counts.
+    role_count_service.rebuild([org.organization.org_id for org in seeded])
+    return seeded
+
+
+def _any_member(org: SeededOrg, rng: random.Random):
+    return rng.choice(org.members) if org.members else org.admin
+
+
+def _login(org: SeededOrg, rng: random.Random):
+    user = _any_member(org, rng)
+    return "post", "/api/accounts/login", {"username": user.username, "password": SEED_PASSWORD}, None
+
+
+def _refresh(org: SeededOrg, rng: random.Random):
+    from apps.accounts.services.auth_token_service import issue_token_pair
+
+    user = _any_member(org, rng)
+    tokens = issue_token_pair(
+        user_id=user.id, org_id=org.organization.org_id, role=user.primary_role
+    )
+    return "post", "/api/accounts/refresh", {"refresh_token": tokens["refresh_token"]}, None
+
+
+def _me(org: SeededOrg, rng: random.Random):
+    return "get", "/api/dashboard/me", None, _any_member(org, rng)
+
+
+def _org_users(org: SeededOrg, rng: random.Random):
+    return "get", "/api/organizations/users", None, org.admin
+
+
+def _invoice_upload(org: SeededOrg, rng: random.Random):
+    payload = {"invoice_id": f"inv-{rng.getrandbits(48):012x}", "amount": rng.randint(1, 100_000)}
+    return "post", "/api/vendor/invoices/upload", payload, org.vendor
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("login", _login),
+        Scenario("refresh", _refresh),
+        Scenario("dashboard_me", _me),
+        Scenario("organization_users", _org_users),
+        Scenario("invoice_upload", _invoice_upload, expected_status=201),
+    )
+}
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _summarize(latencies: list[float], queries: list[int], elapsed: float, errors: int) -> dict[str, Any]:
+    latencies_ms = sorted(value * 1000 for value in latencies)
+    sorted_queries = sorted(queries)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 3),
+            "p95": round(percentile(latencies_ms, 95), 3),
+            "p99": round(percentile(latencies_ms, 99), 3),
+            "max": round(latencies_ms[-1], 3) if latencies_ms else 0.0,
+        },
+        "queries": {
+            "min": sorted_queries[0] if sorted_queries else 0,
+            "median": percentile(sorted_queries, 50),
+            "max": sorted_queries[-1] if sorted_queries else 0,
+        },
+    }
+
+
+def run_scenarios(
+    seeded: list[SeededOrg],
+    *,
+    iterations: int,
+    scenarios: list[str] | None = None,
+    seed: int = 1,
+) -> dict[str, Any]:
+    """Drive each scenario ``iterations`` times and return per-scenario stats."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+
+    from apps.accounts.services.auth_token_service import issue_token
+
+    rng = random.Random(seed)
+    client = APIClient()
+    tokens: dict[tuple[int, str], str] = {}
+    results: dict[str, Any] = {}
+
+    def auth_headers(user, org: SeededOrg) -> dict[str, str]:
+        key = (user.id, org.organization.org_id)
+        if key not in tokens:
+            tokens[key] = issue_token(
+                user_id=user.id, org_id=org.organization.org_id, role=user.primary_role
+            )
+        return {"HTTP_AUTHORIZATION": f"Bearer {tokens[key]}"}
+
+    for name in scenarios or list(SCENARIOS):
+        scenario = SCENARIOS[name]
+        latencies: list[float] = []
+        queries: list[int] = []
+        errors = 0
+        started = time.perf_counter()
+        for _ in range(iterations):
+            org = rng.choice(seeded)
+            method, path, data, user = scenario.build(org, rng)
+            headers = auth_headers(user, org) if user is not None else {}
+            with CaptureQueriesContext(connection) as captured:
+                request_started = time.perf_counter()
+                response = getattr(client, method)(path, data, format="json", **headers)
+                latencies.append(time.perf_counter() - request_started)
+            queries.append(len(captured.captured_queries))
+            if response.status_code != scenario.expected_status:
+                errors += 1
+        results[name] = _summarize(latencies, queries, time.perf_counter() - started, errors)
+    return results
+
+
+def run(
+    *,
+    orgs: int,
+    users_per_org: int,
+    invites_per_org: int,
+    iterations: int,
+    scenarios: list[str] | None = None,
+    seed: int = 1,
+) -> dict[str, Any]:
+    """Seed data and run the scenarios against the current database."""
+    from django.test import override_settings
+
+    with override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend"):
+        seed_started = time.perf_counter()
+        seeded = seed_orgs(
+            orgs=orgs, users_per_org=users_per_org, invites_per_org=invites_per_org, seed=seed
+        )
+        seed_seconds = time.perf_counter() - seed_started
+        results = run_scenarios(seeded, iterations=iterations, scenarios=scenarios, seed=seed)
+
+    return {
+        "config": {
+            "orgs": orgs,
+            "users_per_org": users_per_org,
+            "invites_per_org": invites_per_org,
+            "iterations": iterations,
+            "seed": seed,
+        },
+        "seed_seconds": round(seed_seconds, 3),
+        "seeded_orgs": len(seeded),
+        "scenarios": results,
+    }
+
+
+def run_isolated(*, keepdb: bool = False, verbosity: int = 0, **options) -> dict[str, Any]:
+    """Run :func:`run` inside a freshly created test database."""
+    with test_database(keepdb=keepdb, verbosity=verbosity):
+        return run(**options)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--orgs", type=int, default=5)
+    parser.add_argument("--users-per-org", type=int, default=50)
+    parser.add_argument("--invites-per-org", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        dest="scenarios",
+        help="Run only this scenario (repeatable). Defaults to all.",
+    )
+    parser.add_argument("--keepdb", action="store_true", help="Reuse the test database.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    setup_django()
+    results = run_isolated(
+        keepdb=args.keepdb,
+        orgs=args.orgs,
+        users_per_org=args.users_per_org,
+        invites_per_org=args.invites_per_org,
+        iterations=args.iterations,
+        scenarios=args.scenarios,
+        seed=args.seed,
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
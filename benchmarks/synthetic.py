@@ -0,0 +1,402 @@
+"""Deterministic synthetic tenants for scale testing.
+
+Generates organizations, users, skewed memberships and invites in mixed
+statuses, then bulk loads them: ``COPY ... FROM STDIN`` on PostgreSQL and
+batched ``bulk_create`` elsewhere. The same seed and configuration always
+produce the same rows, so index and org-scoped query benchmarks can be
+reproduced across machines::
+
+    python manage.py generate_synthetic_data --orgs 10000 --users 1000000 --seed 7
+
+Membership follows a Zipf-like distribution over organizations (``skew``),
+which yields a handful of very large tenants and a long tail of small ones.
+User ids are allocated up front so memberships can reference them without
+reading anything back; the id sequence is reset afterwards.
+
+On the ``bulk_create`` path, ``auto_now_add`` columns (``created_at``,
+``assigned_at``, ``invited_at``) take the load time instead of the generated
+timestamps.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Iterable, Iterator
+
+from benchmarks import setup_django
+
+EPOCH = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+SPAN_SECONDS = 2 * 365 * 24 * 3600
+
+COUNTRY_CURRENCIES = (("US", "USD"), ("IN", "INR"))
+
+USER_FIELDS = (
+    "id",
+    "password",
+    "last_login",
+    "is_superuser",
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "primary_role",
+    "is_staff",
+    "is_active",
+    "status",
+    "date_joined",
+)
+ORGANIZATION_FIELDS = (
+    "org_id",
+    "name",
+    "country",
+    "base_currency",
+    "timezone",
+    "status",
+    "created_at",
+    "created_by_id",
+)
+USER_ROLE_FIELDS = ("user_id", "org_id", "role", "assigned_at")
+INVITE_FIELDS = (
+    "org_id",
+    "email",
+    "role",
+    "status",
+    "token_hash",
+    "invited_by_id",
+    "invited_at",
+    "expires_at",
+    "accepted_at",
+    "accepted_user_id",
+)
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    orgs: int = 100
+    users: int = 10_000
+    seed: int = 1
+    prefix: str = "syn"
+    skew: float = 1.1
+    multi_org_ratio: float = 0.05
+    inactive_ratio: float = 0.02
+    invites_per_org: int = 5
+    accepted_invite_ratio: float = 0.3
+    role_weights: dict[str, float] = field(
+        default_factory=lambda: {"FINANCE": 0.2, "APPROVER": 0.15, "VIEWER": 0.5, "VENDOR": 0.15}
+    )
+    password: str = "synthetic-pass-1234"
+    batch_size: int = 5000
+    use_copy: bool = True
+
+    def __post_init__(self):
+        if self.orgs < 1:
+            raise ValueError("orgs must be at least 1.")
+        if self.users < self.orgs:
+            raise ValueError("users must be at least orgs (each org needs a creator).")
+        if not self.role_weights:
+            raise ValueError("role_weights must not be empty.")
+
+
+def _timestamp(rng: random.Random) -> datetime:
+    return EPOCH + timedelta(seconds=rng.randrange(SPAN_SECONDS))
+
+
+def _cumulative(weights: Iterable[float]) -> list[float]:
+    return list(itertools.accumulate(weights))
+
+
+class SyntheticDataset:
+    """Row generators for one configuration. Each call replays the same rows."""
+
+    def __init__(self, config: SyntheticConfig, *, first_user_id: int, password_hash: str):
+        self.config = config
+        self.first_user_id = first_user_id
+        self.password_hash = password_hash
+        self.member_roles = list(config.role_weights)
+        self.role_cum_weights = _cumulative(config.role_weights.values())
+        # Org 0 is the largest tenant; weights fall off as 1 / rank ** skew.
+        self.org_cum_weights = _cumulative(
+            1 / (rank**config.skew) for rank in range(1, config.orgs + 1)
+        )
+        id_rng = random.Random(f"{config.seed}:org-ids")
+        self.org_ids = [f"org_{id_rng.getrandbits(128):032x}" for _ in range(config.orgs)]
+
+    def _rng(self, stream: str) -> random.Random:
+        return random.Random(f"{self.config.seed}:{stream}")
+
+    def roles(self) -> Iterator[str]:
+        """Primary role per user index; users() and memberships() both replay it."""
+        rng = self._rng("roles")
+        for index in range(self.config.users):
+            if index < self.config.orgs:
+                yield "ORG_ADMIN"
+            else:
+                yield rng.choices(self.member_roles, cum_weights=self.role_cum_weights)[0]
+
+    def users(self) -> Iterator[tuple]:
+        config = self.config
+        rng = self._rng("users")
+        for index, role in enumerate(self.roles()):
+            user_id = self.first_user_id + index
+            active = index < config.orgs or rng.random() >= config.inactive_ratio
+            username = f"{config.prefix}{config.seed}_u{index}"
+            yield (
+                user_id,
+                self.password_hash,
+                None,
+                False,
+                username,
+                "",
+                "",
+                f"{username}@synthetic.example.com",
+                role,
+                False,
+                active,
+                "ACTIVE" if active else "INACTIVE",
+                _timestamp(rng),
+            )
+
+    def organizations(self) -> Iterator[tuple]:
+        config = self.config
+        rng = self._rng("organizations")
+        for index, org_id in enumerate(self.org_ids):
+            country, currency = rng.choice(COUNTRY_CURRENCIES)
+            yield (
+                org_id,
+                f"{config.prefix.title()} Org {config.seed}-{index}",
+                country,
+                currency,
+                "UTC",
+                "ACTIVE",
+                _timestamp(rng),
+                self.first_user_id + index,
+            )
+
+    def memberships(self) -> Iterator[tuple]:
+        config = self.config
+        rng = self._rng("memberships")
+        for index, role in enumerate(self.roles()):
+            user_id = self.first_user_id + index
+            if index < config.orgs:
+                yield (user_id, self.org_ids[index], role, _timestamp(rng))
+                continue
+
+            primary = rng.choices(range(config.orgs), cum_weights=self.org_cum_weights)[0]
+            yield (user_id, self.org_ids[primary], role, _timestamp(rng))
+            if config.orgs > 1 and rng.random() < config.multi_org_ratio:
+                extra = rng.randrange(config.orgs - 1)
+                extra += extra >= primary
+                yield (user_id, self.org_ids[extra], role, _timestamp(rng))
+
+    def invites(self) -> Iterator[tuple]:
+        config = self.config
+        rng = self._rng("invites")
+        invite_roles = [role for role in self.member_roles if role != "VENDOR"] or self.member_roles
+        for index, org_id in enumerate(self.org_ids):
+            creator_id = self.first_user_id + index
+            for number in range(rng.randint(0, 2 * config.invites_per_org)):
+                invited_at = _timestamp(rng)
+                accepted = rng.random() < config.accepted_invite_ratio
+                yield (
+                    org_id,
+                    f"{config.prefix}{config.seed}_o{index}_i{number}@synthetic.example.com",
+                    rng.choice(invite_roles),
+                    "ACTIVE" if accepted else "INVITED",
+                    f"{rng.getrandbits(256):064x}",
+                    creator_id,
+                    invited_at,
+                    invited_at + timedelta(days=7),
+                    invited_at + timedelta(hours=rng.randint(1, 240)) if accepted else None,
+                    self.first_user_id + rng.randrange(config.users) if accepted else None,
+                )
+
+
+def _batched(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _copy_batch(connection, model, attnames: tuple[str, ...], rows: list[tuple]) -> None:
+    quote = connection.ops.quote_name
+    columns = ", ".join(quote(model._meta.get_field(name).column) for name in attnames)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(value) for value in row])
+    buffer.seek(0)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {quote(model._meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer,
+        )
+
+
+def load_rows(model, attnames: tuple[str, ...], rows: Iterable[tuple], *, config: SyntheticConfig) -> int:
+    """Bulk load ``rows`` (tuples ordered like ``attnames``) into ``model``'s table."""
+    from django.db import connection, transaction
+
+    use_copy = config.use_copy and connection.vendor == "postgresql"
+    loaded = 0
+    with transaction.atomic():
+        for batch in _batched(rows, config.batch_size):
+            if use_copy:
+                _copy_batch(connection, model, attnames, batch)
+            else:
+                model.objects.bulk_create(
+                    [model(**dict(zip(attnames, row))) for row in batch],
+                    batch_size=config.batch_size,
+                )
+            loaded += len(batch)
+    return loaded
+
+
+def _reset_sequences(models) -> None:
+    from django.core.management.color import no_style
+    from django.db import connection
+
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+
+def generate(config: SyntheticConfig) -> dict[str, Any]:
+    """Generate and load one dataset; returns per-table row counts and timings."""
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.db.models import Max
+
+    from apps.access_control.models import OrganizationInvite, UserRole
+    from apps.access_control.services import role_count_service
+    from apps.organizations.models import Organization
+
+    User = get_user_model()
+    first_user_id = (User.objects.aggregate(max_id=Max("id"))["max_id"] or 0) + 1
+    dataset = SyntheticDataset(
+        config, first_user_id=first_user_id, password_hash=make_password(config.password)
+    )
+
+    tables: dict[str, Any] = {}
+    started = time.perf_counter()
+    for name, model, attnames, rows in (
+        ("users", User, USER_FIELDS, dataset.users()),
+        ("organizations", Organization, ORGANIZATION_FIELDS, dataset.organizations()),
+        ("user_roles", UserRole, USER_ROLE_FIELDS, dataset.memberships()),
+        ("organization_invites", OrganizationInvite, INVITE_FIELDS, dataset.invites()),
+    ):
+        table_started = time.perf_counter()
+        count = load_rows(model, attnames, rows, config=config)
+        seconds = time.perf_counter() - table_started
+        tables[name] = {
+            "rows": count,
+            "seconds": round(seconds, 3),
+            "rows_per_s": round(count / seconds) if seconds else None,
+        }
+        if model is User:
+            _reset_sequences([User])
+
+    # COPY/bulk_create bypass the signals that maintain role counts.
+    count_started = time.perf_counter()
+    count_rows = role_count_service.rebuild()
+    tables["organization_role_counts"] = {
+        "rows": count_rows,
+        "seconds": round(time.perf_counter() - count_started, 3),
+    }
+
+    return {
+        "config": asdict(config),
+        "first_user_id": first_user_id,
+        "largest_org_id": dataset.org_ids[0],
+        "tables": tables,
+        "total_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = SyntheticConfig()
+    parser.add_argument("--orgs", type=int, default=defaults.orgs)
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--prefix",
+        default=defaults.prefix,
+        help="Prefix for generated usernames, emails and org names.",
+    )
+    parser.add_argument(
+        "--skew",
+        type=float,
+        default=defaults.skew,
+        help="Zipf exponent for org sizes; 0 spreads members evenly.",
+    )
+    parser.add_argument("--multi-org-ratio", type=float, default=defaults.multi_org_ratio)
+    parser.add_argument("--inactive-ratio", type=float, default=defaults.inactive_ratio)
+    parser.add_argument("--invites-per-org", type=int, default=defaults.invites_per_org)
+    parser.add_argument(
+        "--accepted-invite-ratio", type=float, default=defaults.accepted_invite_ratio
+    )
+    parser.add_argument(
+        "--role-weights",
+        type=json.loads,
+        default=None,
+        help='JSON object of member role weights, e.g. \'{"VIEWER": 0.8, "VENDOR": 0.2}\'.',
+    )
+    parser.add_argument("--password", default=defaults.password)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument(
+        "--no-copy",
+        action="store_false",
+        dest="use_copy",
+        help="Use bulk_create even on PostgreSQL.",
+    )
+
+
+def config_from_options(options: dict[str, Any]) -> SyntheticConfig:
+    values = {
+        "orgs": options["orgs"],
+        "users": options["users"],
+        "seed": options["seed"],
+        "prefix": options["prefix"],
+        "skew": options["skew"],
+        "multi_org_ratio": options["multi_org_ratio"],
+        "inactive_ratio": options["inactive_ratio"],
+        "invites_per_org": options["invites_per_org"],
+        "accepted_invite_ratio": options["accepted_invite_ratio"],
+        "password": options["password"],
+        "batch_size": options["batch_size"],
+        "use_copy": options["use_copy"],
+    }
+    if options.get("role_weights"):
+        values["role_weights"] = options["role_weights"]
+    return SyntheticConfig(**values)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    setup_django()
+    print(json.dumps(generate(config_from_options(vars(args))), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Notification fan-out: per-message template loading vs the compiled registry.
+
+Renders the invite notification ``--messages`` times three ways: loading and
+parsing each part per message (``render_to_string`` with a non-caching
+loader), ``render_to_string`` with Django's cached loader, and
+``template_registry.render_many`` with a shared context::
+
+    python -m benchmarks.template_rendering --messages 10000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from benchmarks import setup_django
+
+PARTS = ("subject.txt", "body.txt", "body.html")
+
+
+def _measure(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(messages: int) -> dict[str, Any]:
+    from django.template import Engine, engines
+
+    from apps.notifications.services import template_registry
+
+    contexts = [
+        {"token": f"token-{index}", "link": f"https://app.example.com/accept/?token={index}"}
+        for index in range(messages)
+    ]
+    shared = {"org_name": "Bench Org"}
+    dirs = engines["django"].engine.dirs
+    # Engine only wraps its loaders in the cached loader when debug is off.
+    uncached = Engine(dirs=dirs, app_dirs=True, debug=True)
+    cached = Engine(dirs=dirs, app_dirs=True)
+
+    def per_message(engine: Engine) -> Callable[[], None]:
+        def render() -> None:
+            for context in contexts:
+                for part in PARTS:
+                    engine.render_to_string(
+                        f"notifications/organization_invite/{part}", {**shared, **context}
+                    )
+
+        return render
+
+    def registry() -> None:
+        template_registry.clear()
+        for _ in template_registry.get("organization_invite").render_many(contexts, shared):
+            pass
+
+    results: dict[str, Any] = {"messages": messages}
+    for label, func in (
+        ("parse_per_message", per_message(uncached)),
+        ("cached_loader", per_message(cached)),
+        ("registry_render_many", registry),
+    ):
+        seconds = _measure(func)
+        results[label] = {
+            "total_ms": round(seconds * 1000, 1),
+            "per_message_us": round(seconds / messages * 1_000_000, 1),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10_000)
+    args = parser.parse_args()
+
+    setup_django()
+    print(json.dumps(run(args.messages), indent=2))
+
+
+if __name__ == "__main__":
+    main()
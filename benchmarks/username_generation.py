@@ -0,0 +1,99 @@
+"""Per-candidate probing vs single-query username generation.
+
+Seeds ``--users`` accounts sharing one username prefix (``john``, ``john1``,
+... ``john<n-1>``) and times how long each strategy takes to pick the next
+free username, along with the number of queries it issues::
+
+    python -m benchmarks.username_generation --users 10000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from benchmarks import setup_django, test_database
+
+
+def probe_each_candidate(user_model, base: str) -> str:
+    """The previous implementation: one ``exists()`` round trip per candidate."""
+    candidate = base
+    counter = 1
+    while user_model.objects.filter(username=candidate).exists():
+        candidate = f"{base}{counter}"
+        counter += 1
+    return candidate
+
+
+def seed_users(user_model, base: str, count: int) -> None:
+    user_model.objects.bulk_create(
+        [
+            user_model(
+                username=base if index == 0 else f"{base}{index}",
+                email=f"{base}{index}@bench.example.com",
+                password="!",
+                primary_role="VIEWER",
+            )
+            for index in range(count)
+        ],
+        batch_size=5000,
+    )
+
+
+def _measure(strategy: Callable[[Any, str], str], user_model, base: str, repeat: int) -> dict[str, Any]:
+    from django.db import connection
+
+    # connection.queries_log is capped at 9000 entries, so count via a wrapper.
+    queries = 0
+
+    def count(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    durations = []
+    for _ in range(repeat):
+        queries = 0
+        with connection.execute_wrapper(count):
+            started = time.perf_counter()
+            username = strategy(user_model, base)
+            durations.append(time.perf_counter() - started)
+    return {
+        "username": username,
+        "queries": queries,
+        "best_ms": round(min(durations) * 1000, 3),
+    }
+
+
+def run(users: int, repeat: int, base: str = "john") -> dict[str, Any]:
+    from django.contrib.auth import get_user_model
+
+    from apps.access_control.services.invite_service import _generate_unique_username
+
+    User = get_user_model()
+    seed_users(User, base, users)
+    results: dict[str, Any] = {"users": users, "repeat": repeat, "base": base}
+    results["probe_each_candidate"] = _measure(probe_each_candidate, User, base, repeat)
+    results["single_query"] = _measure(_generate_unique_username, User, base, repeat)
+    results["speedup"] = round(
+        results["probe_each_candidate"]["best_ms"] / results["single_query"]["best_ms"], 1
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--base", default="john")
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database():
+        results = run(args.users, args.repeat, args.base)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
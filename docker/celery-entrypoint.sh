@@ -10,6 +10,7 @@ set -e
 CELERY_RESULT_DB="${CELERY_RESULT_DB:-1}"
 RUN_MIGRATIONS="${RUN_MIGRATIONS:-1}"
 CELERY_LOG_LEVEL="${CELERY_LOG_LEVEL:-info}"
+CELERY_WORKER_PROFILE="${CELERY_WORKER_PROFILE:-all}"
 
 if [ -n "${REDIS_PASSWORD:-}" ]; then
   REDIS_AUTH=":${REDIS_PASSWORD}@"
@@ -51,4 +52,13 @@ if [ "${RUN_MIGRATIONS}" = "1" ] || [ "${RUN_MIGRATIONS}" = "true" ]; then
   python manage.py migrate --noinput
 fi
 
-exec celery -A sourceright worker -l "${CELERY_LOG_LEVEL}"
+if [ "${CELERY_WORKER_PROFILE}" = "beat" ]; then
+  # Periodic tasks come from CELERY_BEAT_SCHEDULE via django_celery_beat.
+  exec celery -A sourceright beat -l "${CELERY_LOG_LEVEL}" "$@"
+fi
+
+# Queues, node name, concurrency and prefetch come from CELERY_WORKER_PROFILES.
+WORKER_ARGS="$(python -m sourceright.celery_queues "${CELERY_WORKER_PROFILE}")"
+
+# shellcheck disable=SC2086
+exec celery -A sourceright worker -l "${CELERY_LOG_LEVEL}" ${WORKER_ARGS} "$@"
@@ -0,0 +1,9 @@
+from .codecs import Codec, available_codecs, negotiate
+from .middleware import CompressionMiddleware
+
+__all__ = [
+    "Codec",
+    "CompressionMiddleware",
+    "available_codecs",
+    "negotiate",
+]
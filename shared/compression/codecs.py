@@ -0,0 +1,99 @@
+"""Content codings for response compression.
+
+gzip is always available; brotli is used when the optional ``brotli``
+package is installed.
+"""
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+try:  # pragma: no cover - depends on the environment
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+_GZIP_LEVEL = 6
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+_BROTLI_QUALITY = 5
+
+
+@dataclass(frozen=True)
+class Codec:
+    name: str
+    compress: Callable[[bytes], bytes]
+    compress_stream: Callable[[Iterable[bytes]], Iterator[bytes]]
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+    for chunk in chunks:
+        # Sync-flush per chunk so streamed rows reach the client as they are
+        # produced instead of waiting for the compressor's internal buffer.
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _brotli_compress(data: bytes) -> bytes:
+    return brotli.compress(data, quality=_BROTLI_QUALITY)
+
+
+def _brotli_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = brotli.Compressor(quality=_BROTLI_QUALITY)
+    for chunk in chunks:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+GZIP = Codec("gzip", _gzip_compress, _gzip_stream)
+BROTLI = Codec("br", _brotli_compress, _brotli_stream)
+
+
+def available_codecs() -> list[Codec]:
+    """Codecs in server preference order."""
+    if brotli is not None:
+        return [BROTLI, GZIP]
+    return [GZIP]
+
+
+def _parse_accept_encoding(header: str) -> dict[str, float]:
+    accepted: dict[str, float] = {}
+    for item in header.split(","):
+        parts = [part.strip() for part in item.split(";")]
+        coding = parts[0].lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in parts[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate(accept_encoding: str, codecs: Optional[list[Codec]] = None) -> Optional[Codec]:
+    """Pick the best codec for an Accept-Encoding header, or None."""
+    if not accept_encoding:
+        return None
+    accepted = _parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    best: Optional[Codec] = None
+    best_quality = 0.0
+    for codec in codecs if codecs is not None else available_codecs():
+        quality = accepted.get(codec.name, wildcard)
+        if quality > best_quality:
+            best, best_quality = codec, quality
+    return best
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from .codecs import Codec, negotiate
+
+_COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/yaml",
+    "image/svg+xml",
+}
+_COMPRESSIBLE_SUFFIXES = ("+json", "+xml", "+yaml", "+openapi")
+_SKIPPED_STATUSES = {204, 206, 304}
+
+
+def _normalize_path(path: str) -> str:
+    if path != "/" and path.endswith("/"):
+        return path.rstrip("/")
+    return path
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type.startswith("text/") or media_type in _COMPRESSIBLE_TYPES:
+        return True
+    if media_type.startswith("application/vnd.oai.openapi"):
+        return True
+    return media_type.endswith(_COMPRESSIBLE_SUFFIXES)
+
+
+class _CompressedBodyCache:
+    """Small LRU of compressed bodies keyed by (codec, ETag or content digest)."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compress(self, codec: Codec, validator: str, content: bytes) -> bytes:
+        key = (codec.name, validator)
+        with self._lock:
+            compressed = self._entries.get(key)
+            if compressed is not None:
+                self._entries.move_to_end(key)
+                return compressed
+        compressed = codec.compress(content)
+        with self._lock:
+            self._entries[key] = compressed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compressed
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/brotli response compression.
+
+    Bodies below ``COMPRESSION_MIN_SIZE`` bytes, non-text content types and
+    paths under ``COMPRESSION_EXEMPT_PREFIXES`` are passed through untouched.
+    Streaming responses are compressed chunk by chunk.  Responses for
+    ``COMPRESSION_CACHED_PATHS`` (e.g. the OpenAPI schema) keep their
+    compressed bytes in a per-process LRU so identical bodies are only
+    compressed once.
+    """
+
+    def __init__(self, get_response: Callable):
+        self.get_response = get_response
+        self.min_size = int(getattr(settings, "COMPRESSION_MIN_SIZE", 1024))
+        self.exempt_prefixes = tuple(getattr(settings, "COMPRESSION_EXEMPT_PREFIXES", []))
+        self.cached_paths = {
+            _normalize_path(path) for path in getattr(settings, "COMPRESSION_CACHED_PATHS", [])
+        }
+        self.cache = _CompressedBodyCache(
+            int(getattr(settings, "COMPRESSION_CACHE_MAX_ENTRIES", 32))
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        if request.path.startswith(self.exempt_prefixes):
+            return response
+        if not self._is_candidate(response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        codec = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if codec is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                return response
+            response.streaming_content = codec.compress_stream(response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            content = response.content
+            if _normalize_path(request.path) in self.cached_paths:
+                validator = response.get("ETag") or hashlib.sha256(content).hexdigest()
+                compressed = self.cache.get_or_compress(codec, validator, content)
+            else:
+                compressed = codec.compress(content)
+            if len(compressed) >= len(content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # A compressed representation is only weakly equal to the original.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = codec.name
+        return response
+
+    def _is_candidate(self, response: HttpResponse) -> bool:
+        if response.status_code in _SKIPPED_STATUSES:
+            return False
+        if response.has_header("Content-Encoding"):
+            return False
+        if "no-transform" in response.get("Cache-Control", ""):
+            return False
+        if not _is_compressible(response.get("Content-Type", "")):
+            return False
+        if response.streaming:
+            length = response.get("Content-Length")
+            return length is None or int(length) >= self.min_size
+        return len(response.content) >= self.min_size
@@ -0,0 +1,9 @@
+from .backend import is_fast_backend_available
+from .parsers import FastJSONParser
+from .renderers import FastJSONRenderer
+
+__all__ = [
+    "FastJSONParser",
+    "FastJSONRenderer",
+    "is_fast_backend_available",
+]
@@ -0,0 +1,52 @@
+"""Optional fast JSON backend.
+
+orjson is used when it is installed and ``FAST_JSON_ENABLED`` is not turned
+off; otherwise callers fall back to DRF's stdlib ``json`` implementation.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+
+try:  # pragma: no cover - exercised implicitly depending on the environment
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Datetimes go through DRF's encoder ("Z" suffix for UTC) instead of orjson's
+# native "+00:00" format; dataclasses are not serialized natively by DRF.
+_DUMPS_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+    if orjson is not None
+    else 0
+)
+_LINE_SEPARATOR = "\u2028".encode()
+_PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+_default_encoder = JSONEncoder()
+
+
+class FastJSONError(ValueError):
+    """Raised when the fast backend cannot handle a payload."""
+
+
+def is_fast_backend_available() -> bool:
+    return orjson is not None and getattr(settings, "FAST_JSON_ENABLED", True)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize compactly to UTF-8 bytes, matching DRF's JSONRenderer output."""
+    try:
+        ret = orjson.dumps(data, default=_default_encoder.default, option=_DUMPS_OPTIONS)
+    except TypeError as exc:  # orjson.JSONEncodeError subclasses TypeError
+        raise FastJSONError(str(exc)) from exc
+    # Match DRF: keep the output a strict JavaScript subset.
+    if b"\xe2\x80" in ret:
+        ret = ret.replace(_LINE_SEPARATOR, b"\\u2028").replace(_PARAGRAPH_SEPARATOR, b"\\u2029")
+    return ret
+
+
+def loads(data: bytes) -> Any:
+    return orjson.loads(data)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import codecs
+import io
+import re
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .backend import is_fast_backend_available, loads
+from .renderers import FastJSONRenderer
+
+# orjson turns integers outside the 64-bit range into floats. Any run of 19+
+# digits might be one, so such bodies take the exact stdlib path.
+_WIDE_NUMBER = re.compile(rb"\d{19,}")
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser that decodes UTF-8 bodies through orjson when available.
+
+    Bodies orjson would read lossily (integers wider than 64 bits) or rejects
+    are handed to DRF's stdlib parser, which also produces the error message
+    for invalid JSON.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        # orjson only reads UTF-8 and always rejects NaN/Infinity.
+        if (
+            not is_fast_backend_available()
+            or not self.strict
+            or codecs.lookup(encoding).name != "utf-8"
+        ):
+            return super().parse(stream, media_type, parser_context)
+
+        data = stream.read()
+        if not _WIDE_NUMBER.search(data):
+            try:
+                return loads(data)
+            except ValueError:
+                pass
+        return super().parse(io.BytesIO(data), media_type, parser_context)
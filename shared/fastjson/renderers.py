@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from rest_framework.renderers import JSONRenderer
+
+from .backend import FastJSONError, dumps, is_fast_backend_available
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that serializes through orjson when available.
+
+    Pretty-printed, ASCII-only or non-compact output and payloads orjson
+    rejects (e.g. integers wider than 64 bits) are rendered by DRF's stdlib
+    implementation. Otherwise the output matches DRF's for the types the API
+    returns (see the tests), but it is not guaranteed in general; for one,
+    orjson writes NaN/Infinity as ``null`` instead of raising.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if (
+            not is_fast_backend_available()
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            return dumps(data)
+        except FastJSONError:
+            return super().render(data, accepted_media_type, renderer_context)
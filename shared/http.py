@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.http import HttpRequest
+from django.utils.http import parse_etags
+
+
+def etag_matches(request: HttpRequest, etag: str) -> bool:
+    """Weakly compare ``etag`` against the request's If-None-Match header.
+
+    Weak comparison is required because compression middleware weakens the
+    ETags of compressed responses.
+    """
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if not if_none_match:
+        return False
+    etags = {value.removeprefix("W/") for value in parse_etags(if_none_match)}
+    return "*" in etags or etag.removeprefix("W/") in etags
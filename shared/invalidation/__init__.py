@@ -0,0 +1,13 @@
+from .bus import InvalidationBus, get_bus, set_bus
+from .cache import L1Cache
+from .transports import InMemoryBroker, InMemoryTransport, RedisPubSubTransport
+
+__all__ = [
+    "InMemoryBroker",
+    "InMemoryTransport",
+    "InvalidationBus",
+    "L1Cache",
+    "RedisPubSubTransport",
+    "get_bus",
+    "set_bus",
+]
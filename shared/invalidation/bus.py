@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.db import transaction
+
+Stamp = Tuple[int, Tuple[int, ...]]
+
+
+class InvalidationBus:
+    """Per-process version counters for invalidation scopes, kept coherent across processes.
+
+    A scope is any string naming a piece of source data (``"org:<id>"``).
+    Cached values record the versions of their scopes when loaded and are
+    stale once any of them moves. ``invalidate()`` bumps the scopes here at
+    once and, after the surrounding transaction commits, in every other
+    process through the transport. The transport calls :meth:`reset` when
+    messages may have been missed (e.g. on reconnect), which makes every
+    cached value stale.
+    """
+
+    def __init__(self, transport=None) -> None:
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        self._epoch = 0
+        self._caches: list = []
+        self.transport = transport
+        if transport is not None:
+            transport.bind(self)
+
+    def stamp(self, scopes: Iterable[str]) -> Stamp:
+        if self.transport is not None:
+            self.transport.ensure_started()
+        versions = self._versions
+        return self._epoch, tuple(versions.get(scope, 0) for scope in scopes)
+
+    def apply(self, scopes: Iterable[str]) -> None:
+        """Bump ``scopes`` locally; called for local and remote invalidations."""
+        with self._lock:
+            for scope in scopes:
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._epoch += 1
+
+    def invalidate(self, *scopes: str) -> None:
+        scopes_list = list(scopes)
+        if not scopes_list:
+            return
+        self.apply(scopes_list)
+
+        def publish() -> None:
+            # Bump again so values reloaded from pre-commit data are dropped too.
+            self.apply(scopes_list)
+            if self.transport is not None:
+                self.transport.publish(scopes_list)
+
+        transaction.on_commit(publish)
+
+    def register(self, cache) -> None:
+        with self._lock:
+            self._caches.append(cache)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {cache.name: cache.stats() for cache in list(self._caches)}
+
+
+_bus: Optional[InvalidationBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_bus() -> InvalidationBus:
+    """Process bus using ``INVALIDATION_BUS_BACKEND`` (``redis`` or ``memory``)."""
+    global _bus
+    if _bus is None:
+        from django.conf import settings
+
+        from .transports import InMemoryTransport, RedisPubSubTransport
+
+        with _bus_lock:
+            if _bus is None:
+                backend = getattr(settings, "INVALIDATION_BUS_BACKEND", "redis")
+                if backend == "redis":
+                    transport = RedisPubSubTransport(
+                        getattr(settings, "INVALIDATION_BUS_CHANNEL", "cache-invalidation")
+                    )
+                elif backend == "memory":
+                    transport = InMemoryTransport()
+                else:
+                    raise ValueError(f"Unknown INVALIDATION_BUS_BACKEND {backend!r}.")
+                _bus = InvalidationBus(transport)
+    return _bus
+
+
+def set_bus(bus: Optional[InvalidationBus]) -> None:
+    """Replace (or with ``None``, reset) the process bus. Caches pick it up on next use."""
+    global _bus
+    with _bus_lock:
+        _bus = bus
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from .bus import InvalidationBus, Stamp, get_bus
+
+
+class L1Cache:
+    """Bounded per-process LRU with TTL whose entries are invalidated through the bus.
+
+    ``get_or_load`` stores the loader's result (``None`` included) together
+    with the bus stamp of the entry's scopes taken *before* loading, so an
+    invalidation that races the load still marks the entry stale.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl: float = 30.0,
+        max_entries: int = 10_000,
+        bus: Optional[InvalidationBus] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._bus = bus
+        self._registered_with: Optional[InvalidationBus] = None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Tuple[str, ...], Stamp, Any]]" = OrderedDict()
+        self._counts = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    @property
+    def bus(self) -> InvalidationBus:
+        bus = self._bus or get_bus()
+        if self._registered_with is not bus:
+            bus.register(self)
+            self._registered_with = bus
+        return bus
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], *, scopes: Iterable[str] = ()) -> Any:
+        bus = self.bus
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, entry_scopes, stamp, value = entry
+                if expires_at <= now:
+                    self._counts["expirations"] += 1
+                    del self._entries[key]
+                elif bus.stamp(entry_scopes) != stamp:
+                    self._counts["invalidations"] += 1
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    self._counts["hits"] += 1
+                    return value
+            self._counts["misses"] += 1
+
+        scopes = tuple(scopes)
+        stamp = bus.stamp(scopes)
+        value = loader()
+        with self._lock:
+            self._entries[key] = (now + self.ttl, scopes, stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+        return value
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._counts, "size": len(self._entries)}
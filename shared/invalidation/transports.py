@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import List, Optional
+
+import redis
+
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RedisPubSubTransport:
+    """Publishes invalidated scopes on a Redis channel and applies other processes' messages.
+
+    The subscriber is a daemon thread started on first use, and restarted
+    after a fork. Every successful (re)subscribe resets the bus, because
+    messages sent while disconnected are lost.
+    """
+
+    def __init__(self, channel: str, client_factory=None) -> None:
+        self.channel = channel
+        self._client_factory = client_factory
+        self._bus = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._origin = f"{os.getpid()}:{uuid.uuid4().hex}"
+
+    def _client(self):
+        if self._client_factory is not None:
+            return self._client_factory()
+        from shared.redis import get_redis_client
+
+        return get_redis_client()
+
+    def bind(self, bus) -> None:
+        self._bus = bus
+
+    def publish(self, scopes: List[str]) -> None:
+        payload = json.dumps({"origin": self._origin, "scopes": scopes})
+        try:
+            self._client().publish(self.channel, payload)
+        except redis.RedisError:
+            logger.warning("Cache invalidation publish failed", extra={"scopes": ",".join(scopes)})
+
+    def handle(self, data) -> None:
+        try:
+            message = json.loads(data)
+            scopes = message["scopes"]
+        except (TypeError, ValueError, KeyError):
+            logger.warning("Ignoring malformed cache invalidation message")
+            return
+        if message.get("origin") != self._origin and self._bus is not None:
+            self._bus.apply(scopes)
+
+    def ensure_started(self) -> None:
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                # A fresh origin after fork keeps the child from ignoring the parent.
+                self._origin = f"{os.getpid()}:{uuid.uuid4().hex}"
+                self._thread = threading.Thread(
+                    target=self._listen, name="cache-invalidation-bus", daemon=True
+                )
+                self._thread.start()
+
+    def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                if self._bus is not None:
+                    self._bus.reset()
+                backoff = 1.0
+                while True:
+                    message = pubsub.get_message(timeout=5.0)
+                    if message and message.get("type") == "message":
+                        self.handle(message["data"])
+            except redis.RedisError:
+                logger.warning("Cache invalidation subscriber disconnected; retrying")
+                if pubsub is not None:
+                    pubsub.close()
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+
+class InMemoryBroker:
+    """Fan-out between buses in one process, standing in for a Redis channel in tests."""
+
+    def __init__(self) -> None:
+        self.transports: List["InMemoryTransport"] = []
+        self.published: List[List[str]] = []
+
+
+class InMemoryTransport:
+    """Test double for :class:`RedisPubSubTransport`; buses sharing a broker act as processes."""
+
+    def __init__(self, broker: Optional[InMemoryBroker] = None) -> None:
+        self.broker = broker or InMemoryBroker()
+        self.broker.transports.append(self)
+        self._bus = None
+
+    def bind(self, bus) -> None:
+        self._bus = bus
+
+    def ensure_started(self) -> None:
+        return None
+
+    def publish(self, scopes: List[str]) -> None:
+        self.broker.published.append(list(scopes))
+        for transport in self.broker.transports:
+            if transport is not self and transport._bus is not None:
+                transport._bus.apply(scopes)
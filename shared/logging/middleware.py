@@ -4,8 +4,9 @@ from typing import Callable
 from asgiref.sync import iscoroutinefunction
 from django.http import HttpRequest, HttpResponse
 
-from .context import generate_log_id, reset_log_id, set_log_id
+from .context import generate_log_id, reset_log_id, reset_tenant_id, set_log_id, set_tenant_id
 from .logger import get_logger
+from .tenant_metrics import tenant_metrics
 
 
 class LoggingMiddleware:
@@ -37,15 +38,23 @@ class LoggingMiddleware:
         )
 
     def _log_end(self, request: HttpRequest, status_code: int, duration_ms: int) -> None:
-        self.logger.info(
-            "Request end",
-            extra={
-                "method": request.method,
-                "path": request.path,
-                "status": status_code,
-                "duration_ms": duration_ms,
-            },
-        )
+        # Inner middleware unbinds the tenant when it returns; rebind it so the
+        # end-of-request line is attributable, and feed the per-tenant stats.
+        tenant_id = getattr(request, "tenant_id", None)
+        token = set_tenant_id(tenant_id)
+        try:
+            self.logger.info(
+                "Request end",
+                extra={
+                    "method": request.method,
+                    "path": request.path,
+                    "status": status_code,
+                    "duration_ms": duration_ms,
+                },
+            )
+        finally:
+            reset_tenant_id(token)
+        tenant_metrics.record(tenant_id, duration_ms, status_code)
 
     def _call_sync(self, request: HttpRequest) -> HttpResponse:
         token = self._set_context(request)
@@ -63,6 +72,7 @@ class LoggingMiddleware:
                     "duration_ms": duration_ms,
                 },
             )
+            tenant_metrics.record(getattr(request, "tenant_id", None), duration_ms, 500)
             raise
         else:
             duration_ms = int((time.perf_counter() - start) * 1000)
@@ -87,6 +97,7 @@ class LoggingMiddleware:
                     "duration_ms": duration_ms,
                 },
             )
+            tenant_metrics.record(getattr(request, "tenant_id", None), duration_ms, 500)
             raise
         else:
             duration_ms = int((time.perf_counter() - start) * 1000)
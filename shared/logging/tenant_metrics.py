@@ -0,0 +1,108 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+
+from .context import reset_tenant_id, set_tenant_id
+from .logger import get_logger
+
+# Upper bounds (ms) of the latency histogram; the last bucket is open-ended.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass
+class TenantRequestStats:
+    requests: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def record(self, duration_ms: float, status_code: int) -> None:
+        self.requests += 1
+        if status_code >= 500:
+            self.errors += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        index = 0
+        while index < len(LATENCY_BUCKETS_MS) and duration_ms > LATENCY_BUCKETS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the ``pct`` percentile (max for the last one)."""
+        if not self.requests:
+            return 0.0
+        rank = pct / 100 * self.requests
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(min(LATENCY_BUCKETS_MS[index], self.max_ms))
+                return self.max_ms
+        return self.max_ms
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.requests, 1) if self.requests else 0.0,
+            "max_ms": round(self.max_ms, 1),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+class TenantMetrics:
+    """In-process per-tenant request counters and latency histograms.
+
+    Each process aggregates independently and periodically writes one
+    ``Tenant request stats`` log line per tenant, then starts a new window.
+    Dashboards sum the lines across processes.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: Dict[str, TenantRequestStats] = {}
+        self._window_started = clock()
+        self.logger = get_logger("tenant_metrics")
+
+    def record(self, tenant_id: Optional[str], duration_ms: float, status_code: int) -> None:
+        if not tenant_id or not getattr(settings, "TENANT_METRICS_ENABLED", True):
+            return
+        with self._lock:
+            stats = self._stats.get(tenant_id)
+            if stats is None:
+                stats = self._stats[tenant_id] = TenantRequestStats()
+            stats.record(duration_ms, status_code)
+            due = self._clock() - self._window_started >= getattr(
+                settings, "TENANT_METRICS_FLUSH_INTERVAL_SECONDS", 60
+            )
+        if due:
+            self.flush()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {tenant_id: stats.as_dict() for tenant_id, stats in self._stats.items()}
+
+    def flush(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            stats, self._stats = self._stats, {}
+            window_s = round(self._clock() - self._window_started, 1)
+            self._window_started = self._clock()
+        summary = {tenant_id: tenant_stats.as_dict() for tenant_id, tenant_stats in stats.items()}
+        for tenant_id, values in summary.items():
+            token = set_tenant_id(tenant_id)
+            try:
+                self.logger.info("Tenant request stats", extra={**values, "window_s": window_s})
+            finally:
+                reset_tenant_id(token)
+        return summary
+
+
+tenant_metrics = TenantMetrics()
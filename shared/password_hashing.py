@@ -0,0 +1,56 @@
+"""Process pool for hashing many passwords at once.
+
+PBKDF2 is CPU-bound and holds the GIL, so bulk operations hash in separate
+processes. Workers are spawned (never forked from a process holding DB
+connections and server threads) and run ``django.setup()`` once. This
+module imports nothing from Django at import time so that spawned workers
+can unpickle its functions before the app registry is ready.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _init_worker() -> None:
+    import django
+
+    django.setup()
+
+
+def _make_password(password: str) -> str:
+    from django.contrib.auth.hashers import make_password
+
+    return make_password(password)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def hash_passwords(passwords: list[str], *, workers: int) -> list[str]:
+    """``make_password`` for each password, in order, using ``workers`` processes.
+
+    With ``workers`` of 0 or 1, or a single password, hashing stays in-process.
+    """
+    if workers <= 1 or len(passwords) < 2:
+        return [_make_password(password) for password in passwords]
+    chunksize = max(1, len(passwords) // (workers * 4))
+    return list(_get_pool(workers).map(_make_password, passwords, chunksize=chunksize))
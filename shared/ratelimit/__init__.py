@@ -0,0 +1,23 @@
+from .buckets import (
+    BucketResult,
+    InMemoryTokenBucketBackend,
+    Rate,
+    RedisTokenBucketBackend,
+    get_backend,
+    parse_rate,
+    set_backend,
+)
+from .middleware import TenantRateLimitMiddleware
+from .throttling import TenantRateThrottle
+
+__all__ = [
+    "BucketResult",
+    "InMemoryTokenBucketBackend",
+    "Rate",
+    "RedisTokenBucketBackend",
+    "TenantRateLimitMiddleware",
+    "TenantRateThrottle",
+    "get_backend",
+    "parse_rate",
+    "set_backend",
+]
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+@dataclass(frozen=True)
+class Rate:
+    """``capacity`` tokens refilled evenly over ``period`` seconds (burst = capacity)."""
+
+    capacity: int
+    period: int
+
+    @property
+    def per_ms(self) -> float:
+        return self.capacity / (self.period * 1000)
+
+
+def parse_rate(value: str) -> Rate:
+    """Parse DRF-style rates such as ``"600/min"`` or ``"30/m"``."""
+    try:
+        count, period = value.split("/", 1)
+        capacity = int(count)
+        seconds = _PERIODS[period.strip().lower()[0]]
+    except (ValueError, KeyError, IndexError) as exc:
+        raise ValueError(f"Invalid rate {value!r}; expected '<count>/<s|m|h|d>'.") from exc
+    if capacity <= 0:
+        raise ValueError(f"Invalid rate {value!r}; count must be positive.")
+    return Rate(capacity=capacity, period=seconds)
+
+
+@dataclass(frozen=True)
+class BucketResult:
+    allowed: bool
+    remaining: float
+    retry_after_ms: int
+
+    @property
+    def retry_after_seconds(self) -> int:
+        return max(1, math.ceil(self.retry_after_ms / 1000)) if not self.allowed else 0
+
+
+# Refill, take and persist in one round trip. Redis TIME keeps every API
+# worker on the same clock. Tokens are stored as strings to keep fractions.
+TOKEN_BUCKET_LUA = """
+if redis.replicate_commands then redis.replicate_commands() end
+local capacity = tonumber(ARGV[1])
+local per_ms = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+  tokens = capacity
+  ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * per_ms)
+local allowed = 0
+local retry_ms = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry_ms = math.ceil((cost - tokens) / per_ms)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / per_ms) + 1000)
+return {allowed, retry_ms, tostring(tokens)}
+"""
+
+
+class RedisTokenBucketBackend:
+    def __init__(self, client=None) -> None:
+        self._client = client
+        self._script = None
+
+    def _get_script(self):
+        if self._script is None:
+            client = self._client
+            if client is None:
+                from shared.redis import get_redis_client
+
+                client = get_redis_client()
+            # register_script uses EVALSHA and reloads the script on NOSCRIPT.
+            self._script = client.register_script(TOKEN_BUCKET_LUA)
+        return self._script
+
+    def consume(self, key: str, rate: Rate, cost: int = 1) -> BucketResult:
+        allowed, retry_ms, remaining = self._get_script()(
+            keys=[key], args=[rate.capacity, repr(rate.per_ms), cost]
+        )
+        return BucketResult(
+            allowed=bool(int(allowed)),
+            remaining=float(remaining),
+            retry_after_ms=int(retry_ms),
+        )
+
+
+class InMemoryTokenBucketBackend:
+    """Same algorithm as the Lua script, per process. For tests and local development."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def consume(self, key: str, rate: Rate, cost: int = 1) -> BucketResult:
+        now = self._clock() * 1000
+        with self._lock:
+            tokens, ts = self._buckets.get(key, (float(rate.capacity), now))
+            tokens = min(rate.capacity, tokens + max(0.0, now - ts) * rate.per_ms)
+            if tokens >= cost:
+                tokens -= cost
+                result = BucketResult(allowed=True, remaining=tokens, retry_after_ms=0)
+            else:
+                retry_ms = math.ceil((cost - tokens) / rate.per_ms)
+                result = BucketResult(allowed=False, remaining=tokens, retry_after_ms=retry_ms)
+            self._buckets[key] = (tokens, now)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Backend selected by ``RATE_LIMIT_BACKEND`` (``redis`` or ``memory``)."""
+    global _backend
+    if _backend is None:
+        from django.conf import settings
+
+        with _backend_lock:
+            if _backend is None:
+                name = getattr(settings, "RATE_LIMIT_BACKEND", "redis")
+                if name == "memory":
+                    _backend = InMemoryTokenBucketBackend()
+                elif name == "redis":
+                    _backend = RedisTokenBucketBackend()
+                else:
+                    raise ValueError(f"Unknown RATE_LIMIT_BACKEND {name!r}.")
+    return _backend
+
+
+def set_backend(backend: Optional[object]) -> None:
+    """Override (or with ``None``, reset) the process backend."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import redis
+from django.conf import settings
+
+from shared.logging import get_logger
+
+from .buckets import BucketResult, Rate, get_backend, parse_rate
+
+logger = get_logger(__name__)
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+DEFAULT_TIER = "*"
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    key: str
+    tier: str
+    retry_after: int = 0
+
+
+def is_enabled() -> bool:
+    return getattr(settings, "RATE_LIMIT_ENABLED", False)
+
+
+def request_scope(method: str) -> str:
+    return "read" if method.upper() in SAFE_METHODS else "write"
+
+
+_parsed_rates: Dict[str, Rate] = {}
+
+
+def resolve_rate(role: Optional[str], scope: str) -> Optional[Rate]:
+    """Rate for ``role``/``scope`` from ``RATE_LIMIT_TIERS``, falling back to the ``*`` tier."""
+    tiers = getattr(settings, "RATE_LIMIT_TIERS", {})
+    tier = tiers.get(role or DEFAULT_TIER) or tiers.get(DEFAULT_TIER) or {}
+    value = tier.get(scope)
+    if not value:
+        return None
+    rate = _parsed_rates.get(value)
+    if rate is None:
+        rate = _parsed_rates[value] = parse_rate(value)
+    return rate
+
+
+def bucket_key(org_id: str, role: Optional[str], scope: str) -> str:
+    return f"ratelimit:{org_id}:{role or DEFAULT_TIER}:{scope}"
+
+
+class RateLimitStats:
+    """Process-local counters of allowed, throttled and fail-open checks per tier."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+
+    def incr(self, outcome: str, tier: str) -> None:
+        with self._lock:
+            self._counts[(outcome, tier)] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {f"{outcome}:{tier}": count for (outcome, tier), count in self._counts.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+stats = RateLimitStats()
+
+
+class BlockedKeys:
+    """Process-local memo of buckets known to be empty, so repeat offenders are
+    rejected by the middleware without a Redis round trip."""
+
+    def __init__(self, clock=time.monotonic, max_entries: int = 10_000) -> None:
+        self._clock = clock
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._until: Dict[str, float] = {}
+
+    def block(self, key: str, seconds: float) -> None:
+        with self._lock:
+            if len(self._until) >= self._max_entries:
+                now = self._clock()
+                self._until = {k: v for k, v in self._until.items() if v > now}
+                if len(self._until) >= self._max_entries:
+                    self._until.clear()
+            self._until[key] = self._clock() + seconds
+
+    def retry_after(self, key: str) -> int:
+        """Seconds left on a block, or 0 when the key is not blocked."""
+        until = self._until.get(key)
+        if until is None:
+            return 0
+        remaining = until - self._clock()
+        if remaining <= 0:
+            with self._lock:
+                self._until.pop(key, None)
+            return 0
+        return max(1, int(remaining + 0.999))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._until.clear()
+
+
+blocked_keys = BlockedKeys()
+
+
+def check(org_id: str, role: Optional[str], method: str) -> RateLimitDecision:
+    """Take one token from the org's bucket for this role and request scope."""
+    scope = request_scope(method)
+    tier = f"{role or DEFAULT_TIER}:{scope}"
+    key = bucket_key(org_id, role, scope)
+    rate = resolve_rate(role, scope)
+    if rate is None:
+        return RateLimitDecision(allowed=True, key=key, tier=tier)
+
+    try:
+        result: BucketResult = get_backend().consume(key, rate)
+    except redis.RedisError:
+        # Fail open: an unavailable limiter must not take the API down with it.
+        stats.incr("error", tier)
+        logger.warning("Rate limit check failed; allowing request", extra={"tier": tier})
+        return RateLimitDecision(allowed=True, key=key, tier=tier)
+
+    if result.allowed:
+        stats.incr("allowed", tier)
+        return RateLimitDecision(allowed=True, key=key, tier=tier)
+
+    stats.incr("throttled", tier)
+    blocked_keys.block(key, result.retry_after_ms / 1000)
+    logger.info(
+        "Rate limit exceeded",
+        extra={"tier": tier, "retry_after": result.retry_after_seconds},
+    )
+    return RateLimitDecision(
+        allowed=False, key=key, tier=tier, retry_after=result.retry_after_seconds
+    )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from rest_framework.throttling import BaseThrottle
+
+from . import policy
+
+
+class TenantRateThrottle(BaseThrottle):
+    """Token-bucket throttle keyed by ``request.organization`` and membership role.
+
+    Requests already charged by :class:`TenantRateLimitMiddleware` are not
+    charged twice. Requests without org context are left to authentication.
+    """
+
+    def __init__(self) -> None:
+        self._retry_after: Optional[int] = None
+
+    def allow_request(self, request, view) -> bool:
+        if not policy.is_enabled() or getattr(request, "rate_limit_checked", False):
+            return True
+        organization = getattr(request, "organization", None)
+        if organization is None:
+            return True
+
+        decision = policy.check(
+            organization.org_id, getattr(request, "organization_role", None), request.method
+        )
+        request._request.rate_limit_checked = True
+        if not decision.allowed:
+            self._retry_after = decision.retry_after
+        return decision.allowed
+
+    def wait(self) -> Optional[float]:
+        return self._retry_after
@@ -0,0 +1,37 @@
+"""Process-wide Redis client for features that need raw Redis commands.
+
+Django's cache API covers plain get/set; rate limiting, pub/sub and Lua
+scripts need a ``redis.Redis`` connection. One client (and connection pool)
+is shared per process and built lazily from ``REDIS_URL``.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import redis
+from django.conf import settings
+
+_client: Optional[redis.Redis] = None
+_lock = threading.Lock()
+
+
+def get_redis_client() -> redis.Redis:
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = redis.Redis.from_url(
+                    settings.REDIS_URL,
+                    socket_timeout=getattr(settings, "REDIS_SOCKET_TIMEOUT_SECONDS", 0.25),
+                    socket_connect_timeout=getattr(settings, "REDIS_SOCKET_TIMEOUT_SECONDS", 0.25),
+                    health_check_interval=30,
+                )
+    return _client
+
+
+def reset_redis_client() -> None:
+    """Drop the cached client (tests, or after fork in pre-fork servers)."""
+    global _client
+    with _lock:
+        _client = None
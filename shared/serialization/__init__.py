@@ -0,0 +1,6 @@
+from .compiled import CompiledSerializer, compile_serializer
+
+__all__ = [
+    "CompiledSerializer",
+    "compile_serializer",
+]
@@ -0,0 +1,152 @@
+"""Compiled read-only serializers for hot response paths.
+
+DRF builds and binds a fresh field tree on every serializer instantiation and
+dispatches through ``get_attribute``/``to_representation`` per field.  For
+small, read-only payloads that overhead dominates.  ``compile_serializer``
+walks a serializer class once, precomputes a getter and converter per field
+and emits plain dicts from model instances or ``.values()`` rows.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable, Optional
+
+from django.db import models
+from rest_framework import fields as drf_fields
+from rest_framework import serializers
+from rest_framework.fields import SkipField, get_attribute, is_simple_callable
+
+Getter = Callable[[Any], Any]
+Converter = Callable[[Any], Any]
+
+_MISSING = object()
+_cache: dict[tuple[type, tuple[tuple[str, str], ...]], "CompiledSerializer"] = {}
+
+
+def _str(value: Any) -> str:
+    return value if type(value) is str else str(value)
+
+
+def _int(value: Any) -> int:
+    return value if type(value) is int else int(value)
+
+
+def _build_getter(field: drf_fields.Field, source: Optional[str]) -> Getter:
+    if source is not None:
+        key = source
+
+        def get_row_value(instance: Any) -> Any:
+            return instance.get(key, _MISSING)
+
+        return get_row_value
+
+    attrs = field.source_attrs
+    if len(attrs) != 1:
+        return lambda instance: get_attribute(instance, attrs)
+
+    attr = attrs[0]
+
+    def get_value(instance: Any) -> Any:
+        if isinstance(instance, Mapping):
+            value = instance.get(attr, _MISSING)
+        else:
+            value = getattr(instance, attr, _MISSING)
+        if value is not _MISSING and callable(value) and is_simple_callable(value):
+            value = value()
+        return value
+
+    return get_value
+
+
+def _build_converter(field: drf_fields.Field) -> Converter:
+    if isinstance(field, serializers.ListSerializer):
+        child = CompiledSerializer(type(field.child))
+
+        def convert_many(value: Any) -> list[dict[str, Any]]:
+            if isinstance(value, models.manager.BaseManager):
+                value = value.all()
+            return child.many(value)
+
+        return convert_many
+    if isinstance(field, serializers.Serializer):
+        return CompiledSerializer(type(field)).to_representation
+
+    # Exact type checks: subclasses may override to_representation.
+    field_type = type(field)
+    if field_type in (
+        drf_fields.CharField,
+        drf_fields.EmailField,
+        drf_fields.SlugField,
+        drf_fields.URLField,
+        drf_fields.RegexField,
+    ):
+        return _str
+    if field_type is drf_fields.IntegerField:
+        return _int
+    if field_type is drf_fields.FloatField:
+        return float
+    return field.to_representation
+
+
+class CompiledSerializer:
+    """Precomputed, read-only representation plan for a DRF serializer class.
+
+    ``sources`` maps field names to row keys, for feeding ``.values()`` rows
+    whose keys differ from the serializer field names (e.g. ``user__email``).
+    """
+
+    def __init__(
+        self,
+        serializer_class: type[serializers.Serializer],
+        *,
+        sources: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        sources = dict(sources or {})
+        serializer = serializer_class()
+        unknown = set(sources) - set(serializer.fields)
+        if unknown:
+            raise ValueError(
+                f"Unknown fields for {serializer_class.__name__}: {', '.join(sorted(unknown))}"
+            )
+
+        self.serializer_class = serializer_class
+        self._plan = [
+            (
+                field.field_name,
+                _build_getter(field, sources.get(field.field_name)),
+                _build_converter(field),
+                field,
+            )
+            for field in serializer._readable_fields
+        ]
+
+    def to_representation(self, instance: Any) -> dict[str, Any]:
+        ret: dict[str, Any] = {}
+        for name, getter, converter, field in self._plan:
+            value = getter(instance)
+            if value is _MISSING:
+                # Defer to DRF for defaults, allow_null and required handling.
+                try:
+                    value = field.get_attribute(instance)
+                except SkipField:
+                    continue
+            ret[name] = None if value is None else converter(value)
+        return ret
+
+    def many(self, instances: Iterable[Any]) -> list[dict[str, Any]]:
+        to_representation = self.to_representation
+        return [to_representation(instance) for instance in instances]
+
+
+def compile_serializer(
+    serializer_class: type[serializers.Serializer],
+    *,
+    sources: Optional[Mapping[str, str]] = None,
+) -> CompiledSerializer:
+    """Return the memoized compiled form of ``serializer_class``."""
+    key = (serializer_class, tuple(sorted((sources or {}).items())))
+    compiled = _cache.get(key)
+    if compiled is None:
+        compiled = CompiledSerializer(serializer_class, sources=sources)
+        _cache[key] = compiled
+    return compiled
@@ -0,0 +1,106 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework import serializers
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import UserRole
+from apps.dashboard.serializers import (
+    MeOrganizationSerializer,
+    MeResponseSerializer,
+    MeUserSerializer,
+)
+from apps.organizations.api import ORGANIZATION_USER_ROW_SOURCES
+from apps.organizations.serializers import (
+    OrganizationResponseSerializer,
+    OrganizationSettingsSerializer,
+    OrganizationUserSerializer,
+)
+from apps.organizations.services.organization_service import create_organization
+from apps.organizations.utils import build_user_payload
+from shared.serialization import CompiledSerializer, compile_serializer
+
+
+class _OptionalFieldsSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    nickname = serializers.CharField(required=False)
+    score = serializers.IntegerField(allow_null=True)
+    joined = serializers.DateTimeField()
+    tags = serializers.ListField(child=serializers.CharField())
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+)
+class CompiledSerializerEquivalenceTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+            first_name="Ada",
+        )
+        self.org = create_organization(
+            creator=self.user, name="Org One", country="US", base_currency="USD"
+        )
+
+    def assertEquivalent(self, serializer_class, instance):
+        expected = serializer_class(instance).data
+        actual = compile_serializer(serializer_class).to_representation(instance)
+        self.assertEqual(actual, expected)
+
+    def test_me_serializers(self):
+        self.assertEquivalent(MeUserSerializer, self.user)
+        self.assertEquivalent(MeOrganizationSerializer, self.org)
+        self.assertEquivalent(
+            MeResponseSerializer,
+            {"user": self.user, "organization": self.org, "role": RoleType.ORG_ADMIN},
+        )
+        self.assertEquivalent(
+            MeResponseSerializer, {"user": self.user, "organization": None, "role": None}
+        )
+
+    def test_organization_serializers(self):
+        self.assertEquivalent(OrganizationSettingsSerializer, self.org)
+        self.assertEquivalent(OrganizationResponseSerializer, self.org)
+        self.assertEquivalent(
+            OrganizationUserSerializer, build_user_payload(self.user, RoleType.ORG_ADMIN)
+        )
+
+    def test_values_rows_match_model_serialization(self):
+        rows = UserRole.objects.filter(org=self.org).values(
+            *ORGANIZATION_USER_ROW_SOURCES.values()
+        )
+        compiled = compile_serializer(
+            OrganizationUserSerializer, sources=ORGANIZATION_USER_ROW_SOURCES
+        )
+
+        expected = OrganizationUserSerializer(
+            [build_user_payload(self.user, RoleType.ORG_ADMIN)], many=True
+        ).data
+        self.assertEqual(compiled.many(rows), expected)
+
+    def test_missing_none_and_converted_values(self):
+        instance = {
+            "name": 42,
+            "score": None,
+            "joined": datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+            "tags": ["a", 1],
+        }
+        self.assertEquivalent(_OptionalFieldsSerializer, instance)
+        self.assertNotIn(
+            "nickname", compile_serializer(_OptionalFieldsSerializer).to_representation(instance)
+        )
+
+    def test_compile_is_memoized(self):
+        self.assertIs(
+            compile_serializer(MeUserSerializer), compile_serializer(MeUserSerializer)
+        )
+
+    def test_unknown_source_field_rejected(self):
+        with self.assertRaises(ValueError):
+            CompiledSerializer(MeUserSerializer, sources={"missing": "user__missing"})
@@ -0,0 +1,109 @@
+import gzip
+import zlib
+from unittest import mock
+
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from shared.compression import Codec, CompressionMiddleware, negotiate
+from shared.compression import codecs as compression_codecs
+
+LARGE_BODY = {"results": [{"id": index, "name": f"user{index}"} for index in range(200)]}
+
+
+@override_settings(
+    COMPRESSION_MIN_SIZE=1024,
+    COMPRESSION_EXEMPT_PREFIXES=["/health/"],
+    COMPRESSION_CACHED_PATHS=["/api/schema"],
+)
+class CompressionMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def _call(self, response, path="/api/organizations/users", accept="gzip"):
+        middleware = CompressionMiddleware(lambda request: response)
+        request = self.factory.get(path, HTTP_ACCEPT_ENCODING=accept)
+        return middleware(request)
+
+    def test_large_json_is_gzipped(self):
+        original = JsonResponse(LARGE_BODY)
+        body = original.content
+
+        response = self._call(original)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(gzip.decompress(response.content), body)
+        self.assertEqual(response["Content-Length"], str(len(response.content)))
+
+    def test_small_responses_are_not_compressed(self):
+        response = self._call(JsonResponse({"status": "ok"}))
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_exempt_paths_are_not_compressed(self):
+        response = self._call(JsonResponse(LARGE_BODY), path="/health/ready")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_client_without_support_gets_identity(self):
+        response = self._call(JsonResponse(LARGE_BODY), accept="identity")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+
+    def test_strong_etag_is_weakened(self):
+        original = JsonResponse(LARGE_BODY)
+        original["ETag"] = '"abc"'
+
+        response = self._call(original)
+
+        self.assertEqual(response["ETag"], 'W/"abc"')
+
+    def test_streaming_response_is_compressed_per_chunk(self):
+        rows = [b'{"row": %d}\n' % index for index in range(500)]
+        original = StreamingHttpResponse(iter(rows), content_type="application/x-ndjson")
+
+        response = self._call(original)
+        chunks = list(response.streaming_content)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertGreater(len(chunks), 2)
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        # Every flushed chunk is independently decodable as it arrives.
+        first = decompressor.decompress(chunks[0] + chunks[1])
+        self.assertTrue(first.startswith(b'{"row": 0}\n'))
+        self.assertEqual(gzip.decompress(b"".join(chunks)), b"".join(rows))
+
+    def test_cached_paths_reuse_compressed_bytes(self):
+        body = b"openapi: 3.0.3\n" + b"x: y\n" * 1000
+
+        compress = mock.Mock(wraps=compression_codecs.GZIP.compress)
+        codec = Codec("gzip", compress, compression_codecs.GZIP.compress_stream)
+        with mock.patch("shared.compression.middleware.negotiate", return_value=codec):
+            middleware = CompressionMiddleware(
+                lambda request: HttpResponse(body, content_type="application/vnd.oai.openapi")
+            )
+            request = self.factory.get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip")
+            first = middleware(request)
+            second = middleware(request)
+
+        self.assertEqual(compress.call_count, 1)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(gzip.decompress(second.content), body)
+
+
+class NegotiationTests(SimpleTestCase):
+    def test_prefers_brotli_when_available(self):
+        codecs = [compression_codecs.BROTLI, compression_codecs.GZIP]
+
+        self.assertEqual(negotiate("gzip, deflate, br", codecs).name, "br")
+        self.assertEqual(negotiate("gzip;q=1.0, br;q=0.5", codecs).name, "gzip")
+
+    def test_rejected_and_wildcard_codings(self):
+        codecs = [compression_codecs.GZIP]
+
+        self.assertIsNone(negotiate("gzip;q=0", codecs))
+        self.assertIsNone(negotiate("", codecs))
+        self.assertEqual(negotiate("*", codecs).name, "gzip")
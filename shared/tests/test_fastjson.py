@@ -0,0 +1,102 @@
+import io
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.access_control.domain.enums import RoleType
+from shared.fastjson import FastJSONParser, FastJSONRenderer, is_fast_backend_available
+from shared.fastjson import backend
+
+
+def _sample_payload():
+    return {
+        "invoice_id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "amount": Decimal("1200.50"),
+        "issued_at": datetime(2026, 2, 3, 12, 34, 56, 789123, tzinfo=dt_timezone.utc),
+        "local_at": datetime(2026, 2, 3, 12, 34, 56, tzinfo=dt_timezone(timedelta(hours=5, minutes=30))),
+        "due_on": date(2026, 3, 1),
+        "grace": timedelta(days=2),
+        "role": RoleType.FINANCE,
+        "label": gettext_lazy("Finance"),
+        "note": "line\u2028separator\u2029and unicode ₹",
+        "counts": {1: "one"},
+        "items": ({"n": 1}, {"n": 2}),
+        "missing": None,
+    }
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_output_matches_drf_renderer(self):
+        payload = _sample_payload()
+
+        self.assertEqual(
+            FastJSONRenderer().render(payload), JSONRenderer().render(payload)
+        )
+
+    def test_indent_requests_use_stdlib_output(self):
+        payload = {"a": [1, 2]}
+
+        self.assertEqual(
+            FastJSONRenderer().render(payload, "application/json; indent=4"),
+            JSONRenderer().render(payload, "application/json; indent=4"),
+        )
+
+    def test_oversized_integers_fall_back(self):
+        payload = {"big": 2**70}
+
+        self.assertEqual(FastJSONRenderer().render(payload), b'{"big":%d}' % 2**70)
+
+    def test_falls_back_when_backend_missing(self):
+        payload = _sample_payload()
+
+        with mock.patch.object(backend, "orjson", None):
+            self.assertFalse(is_fast_backend_available())
+            self.assertEqual(
+                FastJSONRenderer().render(payload), JSONRenderer().render(payload)
+            )
+
+    @override_settings(FAST_JSON_ENABLED=False)
+    def test_setting_disables_fast_backend(self):
+        self.assertFalse(is_fast_backend_available())
+
+
+class FastJSONParserTests(SimpleTestCase):
+    def test_parses_like_drf(self):
+        body = '{"amount": 12.5, "name": "Ac\\u00e9me", "tags": [1, null, true]}'.encode()
+
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO(body)),
+            JSONParser().parse(io.BytesIO(body)),
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"amount": NaN}'))
+
+    def test_non_utf8_encoding_falls_back(self):
+        body = '{"name": "Acéme"}'.encode("latin-1")
+
+        data = FastJSONParser().parse(io.BytesIO(body), parser_context={"encoding": "latin-1"})
+
+        self.assertEqual(data, {"name": "Acéme"})
+
+    def test_wide_integers_are_not_rounded(self):
+        body = b'{"big": %d, "small": -%d, "ok": 12}' % (2**64, 2**63 + 1)
+
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO(body)),
+            {"big": 2**64, "small": -(2**63 + 1), "ok": 12},
+        )
+
+    def test_input_orjson_rejects_falls_back(self):
+        # A lone surrogate escape is valid for the stdlib parser.
+        body = b'{"name": "\\ud800"}'
+
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), {"name": "\ud800"})
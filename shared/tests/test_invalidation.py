@@ -0,0 +1,167 @@
+import json
+from unittest import mock
+
+import redis
+from django.test import SimpleTestCase, TestCase
+
+from shared.invalidation import (
+    InMemoryBroker,
+    InMemoryTransport,
+    InvalidationBus,
+    L1Cache,
+    RedisPubSubTransport,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class L1CacheTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bus = InvalidationBus(InMemoryTransport())
+        self.loads = []
+
+    def _cache(self, **kwargs):
+        return L1Cache("test", bus=self.bus, clock=self.clock, **kwargs)
+
+    def _loader(self, value):
+        def load():
+            self.loads.append(value)
+            return value
+
+        return load
+
+    def test_hit_after_miss(self):
+        cache = self._cache()
+
+        self.assertEqual(cache.get_or_load("a", self._loader(1)), 1)
+        self.assertEqual(cache.get_or_load("a", self._loader(2)), 1)
+
+        self.assertEqual(self.loads, [1])
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_none_is_cached(self):
+        cache = self._cache()
+        cache.get_or_load("a", self._loader(None))
+        cache.get_or_load("a", self._loader(1))
+        self.assertEqual(self.loads, [None])
+
+    def test_entries_expire_after_ttl(self):
+        cache = self._cache(ttl=10)
+        cache.get_or_load("a", self._loader(1))
+
+        self.clock.now += 11
+
+        self.assertEqual(cache.get_or_load("a", self._loader(2)), 2)
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = self._cache(max_entries=2)
+        cache.get_or_load("a", self._loader("a"))
+        cache.get_or_load("b", self._loader("b"))
+        cache.get_or_load("a", self._loader("a2"))
+        cache.get_or_load("c", self._loader("c"))
+
+        self.assertEqual(cache.get_or_load("a", self._loader("a3")), "a")
+        self.assertEqual(cache.get_or_load("b", self._loader("b2")), "b2")
+        self.assertEqual(cache.stats()["evictions"], 2)
+        self.assertEqual(cache.stats()["size"], 2)
+
+    def test_invalidating_a_scope_only_drops_entries_that_depend_on_it(self):
+        cache = self._cache()
+        cache.get_or_load("a", self._loader("a"), scopes=["org:1"])
+        cache.get_or_load("b", self._loader("b"), scopes=["org:2"])
+
+        self.bus.apply(["org:1"])
+
+        self.assertEqual(cache.get_or_load("a", self._loader("a2"), scopes=["org:1"]), "a2")
+        self.assertEqual(cache.get_or_load("b", self._loader("b2"), scopes=["org:2"]), "b")
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+    def test_invalidation_during_load_leaves_entry_stale(self):
+        cache = self._cache()
+
+        def racing_load():
+            self.bus.apply(["org:1"])
+            return "stale"
+
+        cache.get_or_load("a", racing_load, scopes=["org:1"])
+
+        self.assertEqual(cache.get_or_load("a", self._loader("fresh"), scopes=["org:1"]), "fresh")
+
+    def test_reset_drops_everything(self):
+        cache = self._cache()
+        cache.get_or_load("a", self._loader("a"))
+
+        self.bus.reset()
+
+        self.assertEqual(cache.get_or_load("a", self._loader("a2")), "a2")
+
+    def test_bus_aggregates_cache_stats(self):
+        cache = self._cache()
+        cache.get_or_load("a", self._loader("a"))
+        self.assertEqual(self.bus.stats()["test"]["misses"], 1)
+
+
+class InvalidationBusTests(TestCase):
+    def test_invalidation_reaches_other_processes_after_commit(self):
+        broker = InMemoryBroker()
+        local = InvalidationBus(InMemoryTransport(broker))
+        remote = InvalidationBus(InMemoryTransport(broker))
+        remote_cache = L1Cache("remote", bus=remote)
+        remote_cache.get_or_load("org", lambda: "old", scopes=["org:1"])
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            local.invalidate("org:1")
+        self.assertEqual(remote_cache.get_or_load("org", lambda: "new", scopes=["org:1"]), "old")
+
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(broker.published, [["org:1"]])
+        self.assertEqual(remote_cache.get_or_load("org", lambda: "new", scopes=["org:1"]), "new")
+
+    def test_local_entries_are_dropped_before_commit(self):
+        bus = InvalidationBus(InMemoryTransport())
+        cache = L1Cache("local", bus=bus)
+        cache.get_or_load("org", lambda: "old", scopes=["org:1"])
+
+        bus.invalidate("org:1")
+
+        self.assertEqual(cache.get_or_load("org", lambda: "new", scopes=["org:1"]), "new")
+
+
+class RedisPubSubTransportTests(SimpleTestCase):
+    def setUp(self):
+        self.client = mock.Mock()
+        self.transport = RedisPubSubTransport("invalidate", client_factory=lambda: self.client)
+        self.bus = InvalidationBus(self.transport)
+
+    def test_publish_sends_scopes_with_origin(self):
+        self.transport.publish(["org:1"])
+
+        channel, payload = self.client.publish.call_args.args
+        self.assertEqual(channel, "invalidate")
+        self.assertEqual(json.loads(payload)["scopes"], ["org:1"])
+
+    def test_publish_failure_is_logged_not_raised(self):
+        self.client.publish.side_effect = redis.ConnectionError()
+        self.transport.publish(["org:1"])
+
+    def test_messages_from_other_processes_bump_versions(self):
+        with mock.patch.object(self.transport, "ensure_started"):
+            initial = self.bus.stamp(["org:1"])
+            self.transport.handle(json.dumps({"origin": "other", "scopes": ["org:1"]}))
+            self.assertNotEqual(self.bus.stamp(["org:1"]), initial)
+
+            current = self.bus.stamp(["org:1"])
+            self.transport.handle(json.dumps({"origin": self.transport._origin, "scopes": ["org:1"]}))
+            self.transport.handle("not json")
+            self.assertEqual(self.bus.stamp(["org:1"]), current)
@@ -0,0 +1,149 @@
+from unittest import mock
+
+import redis
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.access_control.domain.enums import RoleType
+from apps.access_control.models import UserRole
+from apps.accounts.services.auth_token_service import issue_token
+from apps.organizations.services.organization_service import create_organization
+from shared.ratelimit import (
+    InMemoryTokenBucketBackend,
+    Rate,
+    RedisTokenBucketBackend,
+    parse_rate,
+    set_backend,
+)
+from shared.ratelimit import policy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("600/min"), Rate(capacity=600, period=60))
+        self.assertEqual(parse_rate("5/s"), Rate(capacity=5, period=1))
+        with self.assertRaises(ValueError):
+            parse_rate("fast")
+
+    def test_in_memory_bucket_bursts_then_refills(self):
+        clock = FakeClock()
+        backend = InMemoryTokenBucketBackend(clock=clock)
+        rate = Rate(capacity=2, period=60)
+
+        self.assertTrue(backend.consume("k", rate).allowed)
+        self.assertTrue(backend.consume("k", rate).allowed)
+        rejected = backend.consume("k", rate)
+        self.assertFalse(rejected.allowed)
+        self.assertEqual(rejected.retry_after_seconds, 30)
+
+        clock.now += 30
+        self.assertTrue(backend.consume("k", rate).allowed)
+        self.assertTrue(backend.consume("other", rate).allowed)
+
+    def test_redis_backend_runs_one_script_call(self):
+        client = mock.Mock()
+        script = client.register_script.return_value
+        script.return_value = [0, 1500, "0.25"]
+
+        result = RedisTokenBucketBackend(client=client).consume("k", Rate(capacity=60, period=60))
+
+        script.assert_called_once_with(keys=["k"], args=[60, "0.001", 1])
+        self.assertFalse(result.allowed)
+        self.assertEqual(result.retry_after_seconds, 2)
+        self.assertEqual(result.remaining, 0.25)
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+    RATE_LIMIT_ENABLED=True,
+    RATE_LIMIT_TIERS={
+        "VENDOR": {"read": "100/min", "write": "2/min"},
+        "*": {"read": "1/min", "write": "100/min"},
+    },
+)
+class TenantRateLimitTests(TestCase):
+    def setUp(self):
+        self.backend = InMemoryTokenBucketBackend()
+        set_backend(self.backend)
+        self.addCleanup(set_backend, None)
+        policy.blocked_keys.clear()
+        policy.stats.reset()
+        self.client = APIClient()
+        User = get_user_model()
+        self.admin = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.admin, name="Org One", country="US", base_currency="USD"
+        )
+        self.vendor = User.objects.create_user(
+            username="vendor",
+            email="vendor@example.com",
+            password="pass1234",
+            primary_role=RoleType.VENDOR,
+        )
+        UserRole.objects.create(user=self.vendor, org=self.org, role=RoleType.VENDOR)
+
+    def _auth_headers(self, user, role):
+        token = issue_token(user_id=user.id, org_id=self.org.org_id, role=role)
+        return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    def _upload(self):
+        return self.client.post(
+            "/api/vendor/invoices/upload",
+            {"invoice_id": "inv-001", "amount": 100},
+            format="json",
+            **self._auth_headers(self.vendor, RoleType.VENDOR),
+        )
+
+    def test_middleware_throttles_vendor_uploads_with_retry_after(self):
+        self.assertEqual(self._upload().status_code, 201)
+        self.assertEqual(self._upload().status_code, 201)
+
+        rejected = self._upload()
+        self.assertEqual(rejected.status_code, 429)
+        self.assertEqual(rejected["Retry-After"], "30")
+
+        with mock.patch.object(self.backend, "consume") as consume:
+            repeat = self._upload()
+        consume.assert_not_called()
+        self.assertEqual(repeat.status_code, 429)
+        self.assertEqual(policy.stats.snapshot()["throttled:VENDOR:write"], 2)
+
+    def test_drf_throttle_covers_exempt_org_endpoints(self):
+        headers = self._auth_headers(self.admin, RoleType.ORG_ADMIN)
+
+        first = self.client.get("/api/dashboard/me", **headers)
+        second = self.client.get("/api/dashboard/me", **headers)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 429)
+        self.assertEqual(second["Retry-After"], "60")
+
+    def test_limiter_fails_open_when_redis_is_unavailable(self):
+        with mock.patch.object(
+            self.backend, "consume", side_effect=redis.ConnectionError("down")
+        ):
+            for _ in range(3):
+                self.assertEqual(self._upload().status_code, 201)
+
+        self.assertEqual(policy.stats.snapshot()["error:VENDOR:write"], 3)
+
+    @override_settings(RATE_LIMIT_ENABLED=False)
+    def test_disabled_limiter_never_throttles(self):
+        for _ in range(4):
+            self.assertEqual(self._upload().status_code, 201)
@@ -0,0 +1,112 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.access_control.domain.enums import RoleType
+from apps.accounts.services.auth_token_service import issue_token
+from apps.organizations.services.organization_service import create_organization
+from shared.logging.context import get_tenant_id
+from shared.logging.tenant_metrics import TenantMetrics, TenantRequestStats, tenant_metrics
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TenantMetricsTests(SimpleTestCase):
+    def test_percentiles_use_histogram_bucket_bounds(self):
+        stats = TenantRequestStats()
+        for duration_ms in [3] * 90 + [40] * 9 + [700]:
+            stats.record(duration_ms, 200)
+
+        self.assertEqual(stats.percentile(50), 5.0)
+        self.assertEqual(stats.percentile(95), 50.0)
+        self.assertEqual(stats.percentile(99), 50.0)
+        self.assertEqual(stats.percentile(100), 700.0)
+
+    @override_settings(TENANT_METRICS_FLUSH_INTERVAL_SECONDS=60)
+    def test_aggregates_per_tenant_and_flushes_on_interval(self):
+        clock = FakeClock()
+        metrics = TenantMetrics(clock=clock)
+        metrics.record("org_a", 12, 200)
+        metrics.record("org_a", 30, 503)
+        metrics.record("org_b", 4, 200)
+        metrics.record(None, 4, 200)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(set(snapshot), {"org_a", "org_b"})
+        self.assertEqual(snapshot["org_a"]["requests"], 2)
+        self.assertEqual(snapshot["org_a"]["errors"], 1)
+        self.assertEqual(snapshot["org_a"]["avg_ms"], 21.0)
+
+        clock.now = 61
+        logged = []
+        with mock.patch.object(
+            metrics.logger,
+            "info",
+            side_effect=lambda msg, extra: logged.append((get_tenant_id(), extra["requests"])),
+        ):
+            metrics.record("org_b", 6, 200)
+
+        self.assertEqual(sorted(logged), [("org_a", 2), ("org_b", 2)])
+        self.assertEqual(metrics.snapshot(), {})
+        self.assertIsNone(get_tenant_id())
+
+
+@override_settings(
+    DEFAULT_BASE_CURRENCY="USD",
+    ALLOWED_CURRENCIES=["USD"],
+    ALLOWED_COUNTRIES=["US"],
+    TENANT_METRICS_FLUSH_INTERVAL_SECONDS=3600,
+)
+class TenantRequestContextTests(TestCase):
+    def setUp(self):
+        tenant_metrics.flush()
+        self.addCleanup(tenant_metrics.flush)
+        self.user = get_user_model().objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="pass1234",
+            primary_role=RoleType.ORG_ADMIN,
+        )
+        self.org = create_organization(
+            creator=self.user, name="Org One", country="US", base_currency="USD"
+        )
+
+    def test_request_end_log_and_stats_carry_tenant(self):
+        token = issue_token(user_id=self.user.id, org_id=self.org.org_id, role=RoleType.ORG_ADMIN)
+
+        request_logger = mock.Mock()
+        logged = []
+        request_logger.info.side_effect = lambda msg, extra: logged.append((msg, get_tenant_id()))
+
+        with mock.patch("shared.logging.middleware.get_logger", return_value=request_logger):
+            response = APIClient().get(
+                "/api/organizations/settings", HTTP_AUTHORIZATION=f"Bearer {token}"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(logged, [("Request start", None), ("Request end", self.org.org_id)])
+        self.assertEqual(tenant_metrics.snapshot()[self.org.org_id]["requests"], 1)
+        self.assertIsNone(get_tenant_id())
+
+    def test_exempt_paths_carry_the_token_tenant(self):
+        token = issue_token(user_id=self.user.id, org_id=self.org.org_id, role=RoleType.ORG_ADMIN)
+
+        request_logger = mock.Mock()
+        logged = []
+        request_logger.info.side_effect = lambda msg, extra: logged.append((msg, get_tenant_id()))
+
+        with mock.patch("shared.logging.middleware.get_logger", return_value=request_logger):
+            response = APIClient().get("/api/dashboard/me", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(logged, [("Request start", None), ("Request end", self.org.org_id)])
+        self.assertEqual(tenant_metrics.snapshot()[self.org.org_id]["requests"], 1)
+        self.assertIsNone(get_tenant_id())
@@ -0,0 +1,68 @@
+"""Queue routing helpers for Celery: late-ack annotations and worker profiles.
+
+``python -m sourceright.celery_queues <profile>`` prints the ``celery worker``
+arguments for a profile in ``CELERY_WORKER_PROFILES``; the Docker entrypoint
+uses it to launch specialized workers.
+"""
+from __future__ import annotations
+
+import os
+import shlex
+import sys
+from typing import Optional
+
+from celery.app.routes import MapRoute
+from django.conf import settings
+
+
+def queue_for(task_name: str) -> str:
+    """Queue a task is published to according to ``CELERY_TASK_ROUTES``."""
+    route = MapRoute(settings.CELERY_TASK_ROUTES)(task_name, (), {}, {}) or {}
+    return route.get("queue") or settings.CELERY_TASK_DEFAULT_QUEUE
+
+
+class LateAckAnnotation:
+    """``task_annotations`` entry enabling late acks for tasks on ``CELERY_LATE_ACK_QUEUES``."""
+
+    def annotate(self, task) -> Optional[dict]:
+        if queue_for(task.name) in settings.CELERY_LATE_ACK_QUEUES:
+            return {"acks_late": True, "reject_on_worker_lost": True}
+        return None
+
+    def annotate_any(self) -> Optional[dict]:
+        return None
+
+
+def worker_arguments(profile: str) -> list[str]:
+    try:
+        config = settings.CELERY_WORKER_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown Celery worker profile {profile!r}; "
+            f"expected one of: {', '.join(sorted(settings.CELERY_WORKER_PROFILES))}."
+        ) from None
+    return [
+        "-Q",
+        ",".join(config["queues"]),
+        "-n",
+        f"{profile}@%h",
+        "--concurrency",
+        str(config["concurrency"]),
+        "--prefetch-multiplier",
+        str(config["prefetch_multiplier"]),
+    ]
+
+
+def main(argv: list[str]) -> int:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sourceright.settings.local")
+    profile = argv[0] if argv else "all"
+    try:
+        print(shlex.join(worker_arguments(profile)))
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
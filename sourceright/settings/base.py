@@ -67,6 +67,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "shared.compression.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "shared.logging.middleware.LoggingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -74,6 +75,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "apps.organizations.middleware.OrganizationContextMiddleware",
+    "shared.ratelimit.TenantRateLimitMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -121,6 +123,7 @@ else:
     REDIS_AUTH = ""
 
 REDIS_URL = f"redis://{REDIS_AUTH}{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.environ.get("REDIS_SOCKET_TIMEOUT_SECONDS", "0.25"))
 
 CACHES = {
     "default": {
@@ -135,6 +138,66 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
+# Workloads get their own queues so slow ingestion or maintenance never delays email.
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_ROUTES = {
+    "apps.notifications.tasks.*": {"queue": "email"},
+    "apps.invoices.tasks.*": {"queue": "ingest"},
+    # Exact names win over the module globs. The relay is short, frequent and
+    # claims rows with SKIP LOCKED, so it must not wait behind purges on the
+    # single-slot maintenance queue.
+    "apps.core.tasks.relay_outbox": {"queue": "email"},
+    "apps.core.tasks.*": {"queue": "maintenance"},
+    "apps.access_control.tasks.*": {"queue": "maintenance"},
+}
+# Beat reads this schedule into django_celery_beat's tables on startup.
+CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+CELERY_BEAT_SCHEDULE = {
+    "purge-expired-invites": {
+        "task": "apps.access_control.tasks.purge_expired_invites",
+        "schedule": int(os.environ.get("INVITE_PURGE_INTERVAL_SECONDS", "3600")),
+    },
+    # Backstop for the post-commit wake-up; see apps.core.services.outbox_service.
+    "relay-outbox": {
+        "task": "apps.core.tasks.relay_outbox",
+        "schedule": int(os.environ.get("OUTBOX_RELAY_INTERVAL_SECONDS", "10")),
+    },
+    # Picks up deliveries whose task was never published or whose retry is due.
+    "deliver-due-emails": {
+        "task": "apps.notifications.tasks.deliver_due_emails",
+        "schedule": int(os.environ.get("EMAIL_SWEEP_INTERVAL_SECONDS", "60")),
+    },
+    "purge-email-deliveries": {
+        "task": "apps.notifications.tasks.purge_email_deliveries",
+        "schedule": int(os.environ.get("EMAIL_DELIVERY_PURGE_INTERVAL_SECONDS", "3600")),
+    },
+}
+# Tasks routed to these queues ack after running, so a crashed worker's task is redelivered.
+CELERY_LATE_ACK_QUEUES = parse_csv_env("CELERY_LATE_ACK_QUEUES") or ["ingest", "maintenance"]
+CELERY_TASK_ANNOTATIONS = ["sourceright.celery_queues.LateAckAnnotation"]
+# Redis redelivers unacked messages after this; keep it above the longest late-ack task.
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "visibility_timeout": int(os.environ.get("CELERY_VISIBILITY_TIMEOUT_SECONDS", "3600"))
+}
+
+
+def _worker_profile(name: str, queues: list[str], concurrency: int, prefetch: int) -> dict:
+    prefix = f"CELERY_{name.upper()}_WORKER"
+    return {
+        "queues": queues,
+        "concurrency": int(os.environ.get(f"{prefix}_CONCURRENCY", str(concurrency))),
+        "prefetch_multiplier": int(os.environ.get(f"{prefix}_PREFETCH", str(prefetch))),
+    }
+
+
+# Selected by CELERY_WORKER_PROFILE in docker/celery-entrypoint.sh.
+CELERY_WORKER_PROFILES = {
+    "all": _worker_profile("all", ["default", "email", "ingest", "maintenance"], 4, 1),
+    "default": _worker_profile("default", ["default"], 4, 4),
+    "email": _worker_profile("email", ["email"], 8, 4),
+    "ingest": _worker_profile("ingest", ["ingest"], 2, 1),
+    "maintenance": _worker_profile("maintenance", ["maintenance"], 1, 1),
+}
 
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -163,10 +226,25 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_THROTTLE_CLASSES": [
+        "shared.ratelimit.TenantRateThrottle",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    "DEFAULT_RENDERER_CLASSES": [
+        "shared.fastjson.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "shared.fastjson.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
+# Use orjson for API JSON when installed; set to false to force stdlib json.
+FAST_JSON_ENABLED = parse_bool(os.environ.get("FAST_JSON_ENABLED", "true"))
+
 JWT_ACCESS_TOKEN_LIFETIME_MINUTES = int(os.environ.get("JWT_ACCESS_TOKEN_LIFETIME_MINUTES", "15"))
 JWT_REFRESH_TOKEN_LIFETIME_DAYS = int(os.environ.get("JWT_REFRESH_TOKEN_LIFETIME_DAYS", "7"))
 
@@ -187,6 +265,10 @@ SPECTACULAR_SETTINGS = {
     "DESCRIPTION": "SourceRight API documentation",
     "VERSION": "0.1.0",
 }
+# Built at deploy time by `manage.py build_openapi_schema`.
+OPENAPI_SCHEMA_FILE = os.environ.get(
+    "OPENAPI_SCHEMA_FILE", str(BASE_DIR / "build" / "openapi-schema.json")
+)
 
 ALLOWED_COUNTRIES = [country.upper() for country in parse_csv_env("ALLOWED_COUNTRIES")]
 ALLOWED_CURRENCIES = [currency.upper() for currency in parse_csv_env("ALLOWED_CURRENCIES")]
@@ -194,6 +276,36 @@ DEFAULT_BASE_CURRENCY = os.environ.get("DEFAULT_BASE_CURRENCY", "").strip().uppe
 DEFAULT_ORG_TIMEZONE = os.environ.get("DEFAULT_ORG_TIMEZONE", "UTC").strip() or "UTC"
 
 ORG_CONTEXT_HEADER = os.environ.get("ORG_CONTEXT_HEADER", "X-Org-Id")
+RATE_LIMIT_ENABLED = parse_bool(os.environ.get("RATE_LIMIT_ENABLED", "false"))
+RATE_LIMIT_BACKEND = os.environ.get("RATE_LIMIT_BACKEND", "redis").strip().lower()
+# Token buckets per (org, role, read|write). Capacity doubles as the burst size.
+RATE_LIMIT_TIERS = {
+    "ORG_ADMIN": {"read": "1200/min", "write": "300/min"},
+    "FINANCE": {"read": "1200/min", "write": "300/min"},
+    "APPROVER": {"read": "600/min", "write": "120/min"},
+    "VIEWER": {"read": "600/min", "write": "60/min"},
+    "VENDOR": {"read": "300/min", "write": "30/min"},
+    "*": {"read": "300/min", "write": "60/min"},
+}
+# Bulk user provisioning (POST /api/organizations/users/provision).
+PROVISIONING_BATCH_SIZE = int(os.environ.get("PROVISIONING_BATCH_SIZE", "500"))
+PROVISIONING_MAX_ROWS = int(os.environ.get("PROVISIONING_MAX_ROWS", "10000"))
+PROVISIONING_MAX_BYTES = int(os.environ.get("PROVISIONING_MAX_BYTES", str(16 * 1024 * 1024)))
+PROVISIONING_MAX_LINE_BYTES = int(os.environ.get("PROVISIONING_MAX_LINE_BYTES", "4096"))
+# Processes hashing supplied passwords; 0 or 1 hashes in the request thread.
+PROVISIONING_HASH_WORKERS = int(
+    os.environ.get("PROVISIONING_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+# Per-process membership/org context cache used by OrgTokenAuthentication.
+MEMBERSHIP_CACHE_TTL_SECONDS = int(os.environ.get("MEMBERSHIP_CACHE_TTL_SECONDS", "30"))
+MEMBERSHIP_CACHE_MAX_ENTRIES = 50_000
+# Cross-process invalidation of per-process caches: "redis" (pub/sub) or "memory" (single process).
+INVALIDATION_BUS_BACKEND = os.environ.get("INVALIDATION_BUS_BACKEND", "redis")
+INVALIDATION_BUS_CHANNEL = os.environ.get("INVALIDATION_BUS_CHANNEL", "cache-invalidation")
+TENANT_METRICS_ENABLED = parse_bool(os.environ.get("TENANT_METRICS_ENABLED", "true"))
+TENANT_METRICS_FLUSH_INTERVAL_SECONDS = int(
+    os.environ.get("TENANT_METRICS_FLUSH_INTERVAL_SECONDS", "60")
+)
 ORG_CONTEXT_ENFORCED_PREFIXES = ["/api/"]
 ORG_CONTEXT_EXEMPT_PATHS = [
     "/api/organizations",
@@ -202,8 +314,11 @@ ORG_CONTEXT_EXEMPT_PATHS = [
     "/api/health/ready",
     "/api/accounts/register",
     "/api/accounts/login",
+    "/api/accounts/refresh",
     "/api/accounts/token/refresh",
     "/api/accounts/logout",
+    "/api/accounts/memberships",
+    "/api/accounts/switch-org",
     "/api/dashboard/me",
     "/api/schema",
     "/api/docs",
@@ -212,3 +327,46 @@ INTERNAL_API_PREFIXES = ["/api/internal/"]
 
 DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@sourceright.local")
 INVITE_ACCEPT_URL_BASE = os.environ.get("INVITE_ACCEPT_URL_BASE", "").strip()
+INVITE_TTL_DAYS = int(os.environ.get("INVITE_TTL_DAYS", "7"))
+# Expired pending invites are purged right away; accepted ones are kept this long.
+INVITE_ACCEPTED_RETENTION_DAYS = int(os.environ.get("INVITE_ACCEPTED_RETENTION_DAYS", "90"))
+INVITE_PURGE_BATCH_SIZE = int(os.environ.get("INVITE_PURGE_BATCH_SIZE", "1000"))
+
+# Transactional outbox (apps.core). "celery" wakes the relay task after commit,
+# "sync" drains in the committing thread.
+OUTBOX_RELAY_MODE = os.environ.get("OUTBOX_RELAY_MODE", "celery").strip().lower()
+OUTBOX_RELAY_BATCH_SIZE = int(os.environ.get("OUTBOX_RELAY_BATCH_SIZE", "500"))
+OUTBOX_RELAY_MAX_BATCHES = int(os.environ.get("OUTBOX_RELAY_MAX_BATCHES", "100"))
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get("OUTBOX_MAX_ATTEMPTS", "10"))
+OUTBOX_RETRY_BASE_SECONDS = int(os.environ.get("OUTBOX_RETRY_BASE_SECONDS", "5"))
+OUTBOX_RETRY_MAX_SECONDS = int(os.environ.get("OUTBOX_RETRY_MAX_SECONDS", "600"))
+
+# Email delivery (apps.notifications). "celery" sends from the email queue,
+# "sync" sends in the calling thread after commit.
+EMAIL_DELIVERY_MODE = os.environ.get("EMAIL_DELIVERY_MODE", "celery").strip().lower()
+# Messages sent over one SMTP connection per task.
+EMAIL_DELIVERY_BATCH_SIZE = int(os.environ.get("EMAIL_DELIVERY_BATCH_SIZE", "100"))
+EMAIL_DELIVERY_MAX_ATTEMPTS = int(os.environ.get("EMAIL_DELIVERY_MAX_ATTEMPTS", "5"))
+# Retry n waits base * 2**(n - 1) seconds, capped at the max.
+EMAIL_RETRY_BASE_SECONDS = int(os.environ.get("EMAIL_RETRY_BASE_SECONDS", "30"))
+EMAIL_RETRY_MAX_SECONDS = int(os.environ.get("EMAIL_RETRY_MAX_SECONDS", "3600"))
+# A claimed delivery is handed to another worker if not finished within this.
+EMAIL_DELIVERY_LEASE_SECONDS = int(os.environ.get("EMAIL_DELIVERY_LEASE_SECONDS", "300"))
+# Sent and failed deliveries (bodies already blanked) are deleted after this.
+EMAIL_DELIVERY_RETENTION_DAYS = int(os.environ.get("EMAIL_DELIVERY_RETENTION_DAYS", "30"))
+EMAIL_DELIVERY_PURGE_BATCH_SIZE = int(os.environ.get("EMAIL_DELIVERY_PURGE_BATCH_SIZE", "1000"))
+# Token buckets per recipient domain, e.g. "gmail.com=300/m,*=1200/m"; "*" covers
+# every other domain. Empty disables domain limits.
+EMAIL_DOMAIN_RATE_LIMITS = dict(
+    entry.split("=", 1) for entry in parse_csv_env("EMAIL_DOMAIN_RATE_LIMITS") if "=" in entry
+)
+
+ME_CACHE_TIMEOUT_SECONDS = int(os.environ.get("ME_CACHE_TIMEOUT_SECONDS", "300"))
+
+# Response compression (gzip, plus brotli when the `brotli` package is installed)
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+# Auth responses carry tokens next to attacker-influenced fields; compressing
+# them would leak token bytes through the response length (BREACH).
+COMPRESSION_EXEMPT_PREFIXES = ["/health/", "/api/accounts/"]
+COMPRESSION_CACHED_PATHS = ["/api/schema"]
+COMPRESSION_CACHE_MAX_ENTRIES = 32